@@ -8,7 +8,7 @@ Reads and writes simulation data in JSON format.
 import json
 from typing import Any
 
-from humeris.domain.ccsds_contracts import CcsdsEnvelope, roundtrip_envelope
+from humeris.domain.ccsds_contracts import CcsdsEnvelope, verify_envelope
 from humeris.ports import SimulationReader, SimulationWriter
 
 
@@ -38,9 +38,11 @@ class JsonSimulationReader(SimulationReader):
             payload=raw["payload"],
             source_timestamp=raw["source_timestamp"],
             provenance_hash=raw["provenance_hash"],
+            hash_algorithm=raw.get("hash_algorithm", "sha256"),
         )
-        # roundtrip_envelope verifies provenance integrity loudly.
-        return roundtrip_envelope(envelope)
+        # The file was just parsed, so a serialize/parse round-trip would
+        # only repeat work; hash the payload once and fail loudly on mismatch.
+        return verify_envelope(envelope)
 
 
 class JsonSimulationWriter(SimulationWriter):
@@ -57,6 +59,7 @@ class JsonSimulationWriter(SimulationWriter):
             "payload": envelope.payload,
             "source_timestamp": envelope.source_timestamp,
             "provenance_hash": envelope.provenance_hash,
+            "hash_algorithm": envelope.hash_algorithm,
         }
         with open(path, 'w', encoding='utf-8') as f:
             json.dump(body, f, indent=2, ensure_ascii=False)
@@ -22,7 +22,6 @@ from humeris.domain.constellation import (
     ShellConfig,
     Satellite,
     generate_walker_shell,
-    generate_sso_band_configs,
 )
 from humeris.domain.serialization import build_satellite_entity
 from humeris.adapters.json_io import JsonSimulationReader, JsonSimulationWriter
@@ -37,42 +36,7 @@ from humeris.adapters.ksp_exporter import KspExporter
 from humeris.adapters.ubox_exporter import UboxExporter
 from humeris.domain.orbital_mechanics import OrbitalConstants
 from humeris.domain.propagation import derive_orbital_state
-
-
-def get_default_shells() -> list[ShellConfig]:
-    """
-    Default constellation: 3 Walker shells + SSO band.
-
-    - 3 Walker shells at 500/450/400 km, 30° inc, 22 planes × 72 sats
-    - SSO band from 525–2200 km in 50 km steps, 1 plane × 72 sats
-    """
-    walker_shells = [
-        ShellConfig(
-            altitude_km=500, inclination_deg=30,
-            num_planes=22, sats_per_plane=72,
-            phase_factor=17, raan_offset_deg=0.0,
-            shell_name='LEO-Shell500',
-        ),
-        ShellConfig(
-            altitude_km=450, inclination_deg=30,
-            num_planes=22, sats_per_plane=72,
-            phase_factor=17, raan_offset_deg=5.45,
-            shell_name='LEO-Shell450',
-        ),
-        ShellConfig(
-            altitude_km=400, inclination_deg=30,
-            num_planes=22, sats_per_plane=72,
-            phase_factor=17, raan_offset_deg=10.9,
-            shell_name='LEO-Shell400',
-        ),
-    ]
-
-    sso_shells = generate_sso_band_configs(
-        start_alt_km=525, end_alt_km=2200,
-        step_km=50, sats_per_plane=72,
-    )
-
-    return walker_shells + sso_shells
+from humeris.defaults import get_default_shells
 
 
 def run(
@@ -751,12 +715,8 @@ def _get_version() -> str:
     return __version__
 
 
-def main():
-    # Rewrite legacy argv to subcommand syntax (backward compat)
-    rewritten_argv, dep_warnings = _rewrite_legacy_argv(sys.argv)
-    for w in dep_warnings:
-        print(w, file=sys.stderr)
-
+def build_parser() -> argparse.ArgumentParser:
+    """Build the top-level ``humeris`` argument parser with all subcommands."""
     parser = argparse.ArgumentParser(
         prog="humeris",
         description="Satellite constellation analysis — generation, propagation, visualization",
@@ -834,6 +794,29 @@ def main():
         help="Output format (default: csv)"
     )
 
+    return parser
+
+
+def _get_subparser(
+    parser: argparse.ArgumentParser, *path: str,
+) -> argparse.ArgumentParser:
+    """Walk subcommand names (e.g. "import", "opm") down to their parser."""
+    for name in path:
+        subparsers = next(
+            action for action in parser._actions
+            if isinstance(action, argparse._SubParsersAction)
+        )
+        parser = subparsers.choices[name]
+    return parser
+
+
+def main():
+    # Rewrite legacy argv to subcommand syntax (backward compat)
+    rewritten_argv, dep_warnings = _rewrite_legacy_argv(sys.argv)
+    for w in dep_warnings:
+        print(w, file=sys.stderr)
+
+    parser = build_parser()
     args = parser.parse_args(rewritten_argv[1:])
 
     # Dispatch
@@ -852,7 +835,7 @@ def main():
         elif args.import_format == "oem":
             _run_import_oem(args.file)
         else:
-            import_parser.print_help()
+            _get_subparser(parser, "import").print_help()
             sys.exit(1)
     elif args.command == "sweep":
         _run_sweep(args)
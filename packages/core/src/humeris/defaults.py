@@ -0,0 +1,44 @@
+# Copyright (c) 2026 Jeroen Visser. All rights reserved.
+# Licensed under the MIT License — see LICENSE.
+"""Default constellation configuration.
+
+Kept apart from the CLI so callers that only need the shell list (GUI,
+tests) do not pull in argparse wiring and every exporter adapter.
+"""
+from humeris.domain.constellation import ShellConfig, generate_sso_band_configs
+
+
+def get_default_shells() -> list[ShellConfig]:
+    """
+    Default constellation: 3 Walker shells + SSO band.
+
+    - 3 Walker shells at 500/450/400 km, 30° inc, 22 planes × 72 sats
+    - SSO band from 525–2200 km in 50 km steps, 1 plane × 72 sats
+    """
+    walker_shells = [
+        ShellConfig(
+            altitude_km=500, inclination_deg=30,
+            num_planes=22, sats_per_plane=72,
+            phase_factor=17, raan_offset_deg=0.0,
+            shell_name='LEO-Shell500',
+        ),
+        ShellConfig(
+            altitude_km=450, inclination_deg=30,
+            num_planes=22, sats_per_plane=72,
+            phase_factor=17, raan_offset_deg=5.45,
+            shell_name='LEO-Shell450',
+        ),
+        ShellConfig(
+            altitude_km=400, inclination_deg=30,
+            num_planes=22, sats_per_plane=72,
+            phase_factor=17, raan_offset_deg=10.9,
+            shell_name='LEO-Shell400',
+        ),
+    ]
+
+    sso_shells = generate_sso_band_configs(
+        start_alt_km=525, end_alt_km=2200,
+        step_km=50, sats_per_plane=72,
+    )
+
+    return walker_shells + sso_shells
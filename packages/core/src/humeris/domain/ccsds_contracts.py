@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import hashlib
+import hmac
 import json
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -51,12 +52,34 @@ class CcsdsEnvelope:
     payload: dict[str, Any]
     source_timestamp: str
     provenance_hash: str
+    hash_algorithm: str = "sha256"
 
 
+# Both produce 32-byte digests (64 hex chars); blake2b is the faster one
+# for bulk provenance hashing.
+_HASH_ALGORITHMS = frozenset({"sha256", "blake2b"})
 
-def _stable_hash(payload: dict[str, Any]) -> str:
-    body = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return hashlib.sha256(body).hexdigest()
+
+
+def _canonical_payload_bytes(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+
+def _digest(body: bytes, algorithm: str) -> str:
+    if algorithm == "sha256":
+        return hashlib.sha256(body).hexdigest()
+    if algorithm == "blake2b":
+        return hashlib.blake2b(body, digest_size=32).hexdigest()
+    raise CcsdsValidationError(
+        f"Unsupported hash algorithm: {algorithm} "
+        f"(expected one of {', '.join(sorted(_HASH_ALGORITHMS))})"
+    )
+
+
+
+def _stable_hash(payload: dict[str, Any], algorithm: str = "sha256") -> str:
+    return _digest(_canonical_payload_bytes(payload), algorithm)
 
 
 
@@ -107,8 +130,17 @@ def validate_oem_record(record: dict[str, Any]) -> dict[str, Any]:
 
 
 
-def envelope_from_record(message_type: str, record: dict[str, Any], source_timestamp: str | None = None) -> CcsdsEnvelope:
-    """Create a provenance-carrying envelope from a validated CCSDS record."""
+def envelope_from_record(
+    message_type: str,
+    record: dict[str, Any],
+    source_timestamp: str | None = None,
+    hash_algorithm: str = "sha256",
+) -> CcsdsEnvelope:
+    """Create a provenance-carrying envelope from a validated CCSDS record.
+
+    hash_algorithm selects the provenance digest ("sha256" or "blake2b");
+    it is stored on the envelope so verification uses the same one.
+    """
     normalized_type = message_type.upper()
     if normalized_type == "OMM":
         payload = validate_omm_record(record)
@@ -122,30 +154,46 @@ def envelope_from_record(message_type: str, record: dict[str, Any], source_times
         message_type=normalized_type,
         payload=payload,
         source_timestamp=ts,
-        provenance_hash=_stable_hash(payload),
+        provenance_hash=_stable_hash(payload, hash_algorithm),
+        hash_algorithm=hash_algorithm,
     )
 
 
 
+def _provenance_matches(payload: dict[str, Any], provenance_hash: str, algorithm: str) -> bool:
+    return hmac.compare_digest(provenance_hash, _stable_hash(payload, algorithm))
+
+
+
+def verify_envelope(envelope: CcsdsEnvelope) -> CcsdsEnvelope:
+    """Check an already-deserialized envelope against its provenance hash.
+
+    Hashes the payload's canonical bytes once and compares digests; use
+    this instead of roundtrip_envelope when the envelope was just parsed.
+    """
+    if not _provenance_matches(
+        envelope.payload, envelope.provenance_hash, envelope.hash_algorithm,
+    ):
+        raise CcsdsValidationError("Envelope provenance hash mismatch")
+    return envelope
+
+
+
 def roundtrip_envelope(envelope: CcsdsEnvelope) -> CcsdsEnvelope:
     """Serialize and deserialize envelope while preserving required semantics."""
-    blob = json.dumps(
-        {
-            "message_type": envelope.message_type,
-            "payload": envelope.payload,
-            "source_timestamp": envelope.source_timestamp,
-            "provenance_hash": envelope.provenance_hash,
-        },
-        sort_keys=True,
-    )
-    raw = json.loads(blob)
+    # Only the payload can change shape through JSON (tuples, mappings,
+    # key types); the metadata fields are plain strings.
+    payload = json.loads(_canonical_payload_bytes(envelope.payload))
     # Fail loudly if provenance no longer matches payload.
-    expected = _stable_hash(raw["payload"])
-    if raw["provenance_hash"] != expected:
+    if not hmac.compare_digest(
+        envelope.provenance_hash,
+        _digest(_canonical_payload_bytes(payload), envelope.hash_algorithm),
+    ):
         raise CcsdsValidationError("Envelope provenance hash mismatch after transform")
     return CcsdsEnvelope(
-        message_type=raw["message_type"],
-        payload=raw["payload"],
-        source_timestamp=raw["source_timestamp"],
-        provenance_hash=raw["provenance_hash"],
+        message_type=envelope.message_type,
+        payload=payload,
+        source_timestamp=envelope.source_timestamp,
+        provenance_hash=envelope.provenance_hash,
+        hash_algorithm=envelope.hash_algorithm,
     )
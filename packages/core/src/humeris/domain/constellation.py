@@ -89,8 +89,8 @@ def generate_walker_shell(config: ShellConfig) -> list[Satellite]:
 
             satellites.append(Satellite(
                 name=name,
-                position_eci=(pos[0], pos[1], pos[2]),
-                velocity_eci=(vel[0], vel[1], vel[2]),
+                position_eci=tuple(pos.tolist()),
+                velocity_eci=tuple(vel.tolist()),
                 plane_index=plane_idx,
                 sat_index=sat_idx,
                 raan_deg=raan_deg,
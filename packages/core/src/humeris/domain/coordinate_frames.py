@@ -58,6 +58,36 @@ def gmst_rad(epoch: datetime) -> float:
     return float(np.radians(gmst_deg))
 
 
+def gmst_rad_batch(epoch: datetime, offsets_s: np.ndarray) -> np.ndarray:
+    """
+    Vectorized gmst_rad at epoch + offsets_s.
+
+    Args:
+        epoch: UTC datetime the offsets are measured from.
+        offsets_s: Time offsets from epoch in seconds (any shape).
+
+    Returns:
+        GMST in radians, normalized to [0, 2π), same shape as offsets_s.
+    """
+    if epoch.tzinfo is None:
+        epoch = epoch.replace(tzinfo=timezone.utc)
+
+    j2000 = datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    jd_since_j2000 = (
+        (epoch - j2000).total_seconds() + np.asarray(offsets_s, dtype=np.float64)
+    ) / 86400.0
+    t_centuries = jd_since_j2000 / 36525.0
+
+    gmst_deg = (
+        280.46061837
+        + 360.98564736629 * jd_since_j2000
+        + 0.000387933 * t_centuries**2
+        - t_centuries**3 / 38710000.0
+    )
+
+    return np.radians(np.mod(gmst_deg, 360.0))
+
+
 def eci_to_ecef(
     pos_eci: tuple[float, float, float],
     vel_eci: tuple[float, float, float],
@@ -155,6 +185,55 @@ def ecef_to_geodetic(
     return lat_deg, lon_deg, alt
 
 
+def ecef_to_geodetic_batch(
+    pos_ecef: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized ECEF to geodetic conversion over an (..., 3) array.
+
+    Uses Vermeille's (2011) closed-form solution instead of the scalar
+    path's Bowring iteration: a fixed sequence of array operations (one
+    cube root, a handful of square roots, two atan2) with no iteration.
+    Agrees with ecef_to_geodetic to ~1e-13 deg and sub-millimetre in
+    altitude. Valid everywhere outside the evolute of the ellipsoid, i.e.
+    for any point more than ~45 km from Earth's centre.
+
+    Args:
+        pos_ecef: ECEF positions in meters, components on the last axis.
+
+    Returns:
+        (latitude_deg, longitude_deg, altitude_m), each of shape pos_ecef.shape[:-1].
+    """
+    c = OrbitalConstants
+    a = c.R_EARTH_EQUATORIAL
+    e2 = c.E_SQUARED
+    e4 = e2 * e2
+
+    pos_ecef = np.asarray(pos_ecef, dtype=np.float64)
+    x = pos_ecef[..., 0]
+    y = pos_ecef[..., 1]
+    z = pos_ecef[..., 2]
+    rho = np.hypot(x, y)
+
+    p = (rho / a) ** 2
+    q = (1.0 - e2) * (z / a) ** 2
+    r = (p + q - e4) / 6.0
+    s = e4 * p * q / (4.0 * r**3)
+    t = np.cbrt(1.0 + s + np.sqrt(s * (2.0 + s)))
+    u = r * (1.0 + t + 1.0 / t)
+    v = np.sqrt(u**2 + e4 * q)
+    w = e2 * (u + v - q) / (2.0 * v)
+    k = np.sqrt(u + v + w**2) - w
+    d = k * rho / (k + e2)
+    d_z = np.hypot(d, z)
+
+    lat_rad = 2.0 * np.arctan2(z, d + d_z)
+    lon_rad = np.arctan2(y, x)
+    alt = (k + e2 - 1.0) / k * d_z
+
+    return np.degrees(lat_rad), np.degrees(lon_rad), alt
+
+
 def geodetic_to_ecef(
     lat_deg: float,
     lon_deg: float,
@@ -11,18 +11,14 @@ pipeline. Includes ascending node detection and ground track crossing
 """
 import math
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import numpy as np
 
-from humeris.domain.propagation import (
-    derive_orbital_state,
-    propagate_to,
-)
+from humeris.domain.propagation import derive_orbital_state
 from humeris.domain.coordinate_frames import (
-    gmst_rad,
-    eci_to_ecef,
-    ecef_to_geodetic,
+    gmst_rad_batch,
+    ecef_to_geodetic_batch,
 )
 from humeris.domain.numerical_propagation import PropagationStep
 
@@ -36,13 +32,105 @@ class GroundTrackPoint:
     alt_km: float
 
 
+# Contiguous per-point layout for compute_ground_track(return_array=True):
+# 32 bytes per point; time is UTC.
+GROUND_TRACK_DTYPE = np.dtype([
+    ('time', 'datetime64[ns]'),
+    ('lat_deg', 'f8'),
+    ('lon_deg', 'f8'),
+    ('alt_km', 'f8'),
+])
+
+
+def _time_grid_seconds(duration: timedelta, step: timedelta) -> np.ndarray:
+    """Offsets in seconds from start to start+duration (inclusive) at step."""
+    step_seconds = step.total_seconds()
+    if step_seconds <= 0:
+        raise ValueError(f"Step must be positive, got {step}")
+
+    duration_seconds = duration.total_seconds()
+    n_points = int(math.floor((duration_seconds + 1e-9) / step_seconds)) + 1
+    return np.arange(n_points) * step_seconds
+
+
+def _circular_orbit_ecef(
+    sma: np.ndarray,
+    inc: np.ndarray,
+    node_lon: np.ndarray,
+    arg_lat: np.ndarray,
+) -> np.ndarray:
+    """ECEF positions (m) on circular orbits, shape broadcast + (3,).
+
+    Args:
+        sma: Orbit radius (m).
+        inc: Inclination (radians).
+        node_lon: Earth-fixed longitude of the ascending node (radians).
+        arg_lat: Argument of latitude (radians).
+    """
+    cos_u = np.cos(arg_lat)
+    sin_u = np.sin(arg_lat)
+    cos_l = np.cos(node_lon)
+    sin_l = np.sin(node_lon)
+    r_sin_u_cos_i = sma * sin_u * np.cos(inc)
+    r_cos_u = sma * cos_u
+    return np.stack(np.broadcast_arrays(
+        r_cos_u * cos_l - r_sin_u_cos_i * sin_l,
+        r_cos_u * sin_l + r_sin_u_cos_i * cos_l,
+        sma * sin_u * np.sin(inc),
+    ), axis=-1)
+
+
+def _ground_track_array(
+    satellites,
+    start: datetime,
+    offsets_s: np.ndarray,
+    include_j2: bool,
+) -> np.ndarray:
+    """Geodetic (lat_deg, lon_deg, alt_km) of M satellites at N offsets, shape (M, N, 3)."""
+    states = [
+        derive_orbital_state(sat, start, include_j2=include_j2)
+        for sat in satellites
+    ]
+    m = len(states)
+
+    def column(values) -> np.ndarray:
+        return np.fromiter(values, dtype=np.float64, count=m)[:, np.newaxis]
+
+    # Structure-of-arrays elements, shape (M, 1), broadcast against (N,).
+    sma = column(s.semi_major_axis_m for s in states)
+    inc = column(s.inclination_rad for s in states)
+    raan0 = column(s.raan_rad for s in states)
+    argp0 = column(s.arg_perigee_rad for s in states)
+    nu0 = column(s.true_anomaly_rad for s in states)
+    raan_rate = column(s.j2_raan_rate for s in states)
+    argp_rate = column(s.j2_arg_perigee_rate for s in states)
+    n_eff = column(
+        s.j2_mean_motion_correction
+        if s.j2_mean_motion_correction != 0.0
+        else s.mean_motion_rad_s
+        for s in states
+    )
+
+    # Circular orbit, position only: with u = argp + nu the orbit-plane
+    # position is (r cos u, r sin u), and the Earth-fixed rotation by GMST
+    # folds into the node as an Earth-fixed node longitude RAAN - GMST.
+    # This skips the velocity terms and the separate ECI -> ECEF rotation.
+    node_lon = raan0 + raan_rate * offsets_s - gmst_rad_batch(start, offsets_s)
+    arg_lat = (argp0 + argp_rate * offsets_s) + (nu0 + n_eff * offsets_s)
+    pos_ecef = _circular_orbit_ecef(sma, inc, node_lon, arg_lat)
+
+    lat_deg, lon_deg, alt_m = ecef_to_geodetic_batch(pos_ecef)
+    return np.stack([lat_deg, lon_deg, alt_m / 1000.0], axis=-1)
+
+
 def compute_ground_track(
     satellite,
     start: datetime,
     duration: timedelta,
     step: timedelta,
     include_j2: bool = False,
-) -> list[GroundTrackPoint]:
+    return_array: bool = False,
+) -> list[GroundTrackPoint] | np.ndarray:
     """
     Compute the ground track of a satellite over a time interval.
 
@@ -56,46 +144,74 @@ def compute_ground_track(
         duration: Total time span to compute.
         step: Time between consecutive points.
         include_j2: If True, apply J2 secular perturbations.
+        return_array: If True, return a structured array of
+            GROUND_TRACK_DTYPE instead of GroundTrackPoint objects.
 
     Returns:
-        List of GroundTrackPoint objects from start to start+duration.
+        List of GroundTrackPoint objects from start to start+duration,
+        or a structured array of the same points if return_array is True.
 
     Raises:
         ValueError: If step is zero or negative.
     """
-    step_seconds = step.total_seconds()
-    if step_seconds <= 0:
-        raise ValueError(f"Step must be positive, got {step}")
+    offsets_s = _time_grid_seconds(duration, step)
+    track = _ground_track_array([satellite], start, offsets_s, include_j2)[0]
 
-    duration_seconds = duration.total_seconds()
-    state = derive_orbital_state(satellite, start, include_j2=include_j2)
-
-    points: list[GroundTrackPoint] = []
-    elapsed = 0.0
+    if return_array:
+        start_utc = (
+            start.replace(tzinfo=timezone.utc) if start.tzinfo is None
+            else start.astimezone(timezone.utc)
+        )
+        out = np.empty(offsets_s.shape[0], dtype=GROUND_TRACK_DTYPE)
+        out['time'] = (
+            np.datetime64(start_utc.replace(tzinfo=None), 'ns')
+            + np.round(offsets_s * 1e9).astype('timedelta64[ns]')
+        )
+        out['lat_deg'] = track[:, 0]
+        out['lon_deg'] = track[:, 1]
+        out['alt_km'] = track[:, 2]
+        return out
+
+    return [
+        GroundTrackPoint(
+            time=start + timedelta(seconds=t),
+            lat_deg=lat,
+            lon_deg=lon,
+            alt_km=alt_km,
+        )
+        for t, (lat, lon, alt_km) in zip(offsets_s.tolist(), track.tolist())
+    ]
 
-    while elapsed <= duration_seconds + 1e-9:
-        current_time = start + timedelta(seconds=elapsed)
-        pos_eci, vel_eci = propagate_to(state, current_time)
 
-        gmst_angle = gmst_rad(current_time)
-        pos_ecef, _ = eci_to_ecef(
-            (pos_eci[0], pos_eci[1], pos_eci[2]),
-            (vel_eci[0], vel_eci[1], vel_eci[2]),
-            gmst_angle,
-        )
+def compute_ground_track_batch(
+    satellites,
+    start: datetime,
+    duration: timedelta,
+    step: timedelta,
+    include_j2: bool = False,
+) -> np.ndarray:
+    """
+    Compute ground tracks for many satellites on a shared time grid.
 
-        lat_deg, lon_deg, alt_m = ecef_to_geodetic(pos_ecef)
+    Same propagation model as compute_ground_track, evaluated for all
+    M satellites and N time steps in one broadcast pass.
 
-        points.append(GroundTrackPoint(
-            time=current_time,
-            lat_deg=lat_deg,
-            lon_deg=lon_deg,
-            alt_km=alt_m / 1000.0,
-        ))
+    Args:
+        satellites: Sequence of Satellite domain objects.
+        start: UTC datetime for the first ground track point.
+        duration: Total time span to compute.
+        step: Time between consecutive points.
+        include_j2: If True, apply J2 secular perturbations.
 
-        elapsed += step_seconds
+    Returns:
+        Array of shape (M, N, 3) holding (lat_deg, lon_deg, alt_km) for
+        each satellite at start + k*step, k = 0..N-1.
 
-    return points
+    Raises:
+        ValueError: If step is zero or negative.
+    """
+    offsets_s = _time_grid_seconds(duration, step)
+    return _ground_track_array(satellites, start, offsets_s, include_j2)
 
 
 def compute_ground_track_numerical(
@@ -103,7 +219,8 @@ def compute_ground_track_numerical(
 ) -> list[GroundTrackPoint]:
     """Convert numerical propagation steps to ground track points.
 
-    Pipeline per step: gmst_rad -> eci_to_ecef -> ecef_to_geodetic -> GroundTrackPoint.
+    Pipeline over all steps at once: gmst_rad_batch -> Z-rotation of the
+    positions into ECEF -> ecef_to_geodetic_batch -> GroundTrackPoint.
 
     Args:
         steps: Tuple of PropagationStep from numerical propagation.
@@ -111,24 +228,38 @@ def compute_ground_track_numerical(
     Returns:
         List of GroundTrackPoint, one per step.
     """
-    points: list[GroundTrackPoint] = []
-
-    for step in steps:
-        gmst_angle = gmst_rad(step.time)
-        pos_ecef, _ = eci_to_ecef(
-            step.position_eci,
-            step.velocity_eci,
-            gmst_angle,
-        )
-        lat_deg, lon_deg, alt_m = ecef_to_geodetic(pos_ecef)
-        points.append(GroundTrackPoint(
-            time=step.time,
-            lat_deg=lat_deg,
-            lon_deg=lon_deg,
-            alt_km=alt_m / 1000.0,
-        ))
+    if not steps:
+        return []
 
-    return points
+    t0 = steps[0].time
+    offsets_s = np.fromiter(
+        ((step.time - t0).total_seconds() for step in steps),
+        dtype=np.float64, count=len(steps),
+    )
+    pos_eci = np.array([step.position_eci for step in steps], dtype=np.float64)
+
+    # Position-only R_z(-GMST); the velocity rotation is not needed here.
+    gmst = gmst_rad_batch(t0, offsets_s)
+    cos_t = np.cos(gmst)
+    sin_t = np.sin(gmst)
+    pos_ecef = np.stack([
+        cos_t * pos_eci[:, 0] + sin_t * pos_eci[:, 1],
+        -sin_t * pos_eci[:, 0] + cos_t * pos_eci[:, 1],
+        pos_eci[:, 2],
+    ], axis=-1)
+
+    lat_deg, lon_deg, alt_m = ecef_to_geodetic_batch(pos_ecef)
+    return [
+        GroundTrackPoint(
+            time=step.time,
+            lat_deg=lat,
+            lon_deg=lon,
+            alt_km=alt / 1000.0,
+        )
+        for step, lat, lon, alt in zip(
+            steps, lat_deg.tolist(), lon_deg.tolist(), alt_m.tolist(),
+        )
+    ]
 
 
 @dataclass(frozen=True)
@@ -7,6 +7,7 @@ Pure mathematical conversions for orbital element transformations.
 """
 import math
 from dataclasses import dataclass
+from typing import Iterable, Mapping
 
 import numpy as np
 
@@ -30,6 +31,54 @@ class _OrbitalConstants:
 OrbitalConstants: _OrbitalConstants = _OrbitalConstants()
 
 
+_ELEMENT_FIELDS = ("a", "e", "i_rad", "omega_big_rad", "omega_small_rad", "nu_rad")
+
+
+@dataclass(frozen=True, eq=False)
+class OrbitalElementBatch:
+    """Keplerian elements for N satellites in structure-of-arrays layout.
+
+    Each field is a contiguous float64 array of shape (N,), with the same
+    meaning and units as the kepler_to_cartesian arguments. Derived
+    Cartesian outputs put the components on a trailing axis: (N, 3).
+    """
+
+    a: np.ndarray
+    e: np.ndarray
+    i_rad: np.ndarray
+    omega_big_rad: np.ndarray
+    omega_small_rad: np.ndarray
+    nu_rad: np.ndarray
+
+    def __post_init__(self) -> None:
+        for name in _ELEMENT_FIELDS:
+            object.__setattr__(
+                self, name,
+                np.ascontiguousarray(getattr(self, name), dtype=np.float64),
+            )
+        shapes = {getattr(self, name).shape for name in _ELEMENT_FIELDS}
+        if len(shapes) != 1:
+            raise ValueError(
+                f"OrbitalElementBatch fields must share one shape, got {sorted(shapes)}"
+            )
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, float]]) -> "OrbitalElementBatch":
+        """Build a batch from mappings keyed by the field names, in one pass."""
+        rows = np.array(
+            [tuple(rec[name] for name in _ELEMENT_FIELDS) for rec in records],
+            dtype=np.float64,
+        ).reshape(-1, len(_ELEMENT_FIELDS))
+        return cls(*rows.T)
+
+    def to_cartesian(self) -> tuple[np.ndarray, np.ndarray]:
+        """ECI (position, velocity), each of shape (N, 3), in m and m/s."""
+        return kepler_to_cartesian_batch(
+            self.a, self.e, self.i_rad,
+            self.omega_big_rad, self.omega_small_rad, self.nu_rad,
+        )
+
+
 def kepler_to_cartesian(
     a: float,
     e: float,
@@ -37,7 +86,7 @@ def kepler_to_cartesian(
     omega_big_rad: float,
     omega_small_rad: float,
     nu_rad: float,
-) -> tuple[list[float], list[float]]:
+) -> tuple[np.ndarray, np.ndarray]:
     """
     Convert Keplerian orbital elements to ECI Cartesian position/velocity.
 
@@ -50,43 +99,127 @@ def kepler_to_cartesian(
         nu_rad: True anomaly (radians)
 
     Returns:
-        (position_eci [x,y,z] in m, velocity_eci [vx,vy,vz] in m/s)
+        (position_eci, velocity_eci) as float64 arrays of shape (3,),
+        in m and m/s.
     """
     mu = OrbitalConstants.MU_EARTH
 
-    cos_nu = float(np.cos(nu_rad))
-    sin_nu = float(np.sin(nu_rad))
+    # Scalar path: math builtins avoid NumPy's per-call ufunc dispatch.
+    cos_nu = math.cos(nu_rad)
+    sin_nu = math.sin(nu_rad)
 
     r = a * (1 - e**2) / (1 + e * cos_nu)
-
-    p_factor = float(np.sqrt(mu / (a * (1 - e**2))))
-    pos_pqw = np.array([r * cos_nu, r * sin_nu, 0.0])
-    vel_pqw = np.array([
-        -p_factor * sin_nu,
-        p_factor * (e + cos_nu),
-        0.0,
+    p_factor = math.sqrt(mu / (a * (1 - e**2)))
+
+    # Perifocal (PQW) state; the W components are identically zero.
+    x_pqw = r * cos_nu
+    y_pqw = r * sin_nu
+    vx_pqw = -p_factor * sin_nu
+    vy_pqw = p_factor * (e + cos_nu)
+
+    cO = math.cos(omega_big_rad)
+    sO = math.sin(omega_big_rad)
+    co = math.cos(omega_small_rad)
+    so = math.sin(omega_small_rad)
+    ci = math.cos(i_rad)
+    si = math.sin(i_rad)
+
+    # First two columns of the PQW -> ECI rotation, shared by position and
+    # velocity so both products come out of a single pass.
+    r00 = cO * co - sO * so * ci
+    r01 = -cO * so - sO * co * ci
+    r10 = sO * co + cO * so * ci
+    r11 = -sO * so + cO * co * ci
+    r20 = so * si
+    r21 = co * si
+
+    pos_eci = np.array([
+        r00 * x_pqw + r01 * y_pqw,
+        r10 * x_pqw + r11 * y_pqw,
+        r20 * x_pqw + r21 * y_pqw,
     ])
-
-    cO = float(np.cos(omega_big_rad))
-    sO = float(np.sin(omega_big_rad))
-    co = float(np.cos(omega_small_rad))
-    so = float(np.sin(omega_small_rad))
-    ci = float(np.cos(i_rad))
-    si = float(np.sin(i_rad))
-
-    rotation = np.array([
-        [cO * co - sO * so * ci, -cO * so - sO * co * ci, sO * si],
-        [sO * co + cO * so * ci, -sO * so + cO * co * ci, -cO * si],
-        [so * si, co * si, ci],
+    vel_eci = np.array([
+        r00 * vx_pqw + r01 * vy_pqw,
+        r10 * vx_pqw + r11 * vy_pqw,
+        r20 * vx_pqw + r21 * vy_pqw,
     ])
 
-    pos_eci_arr = rotation @ pos_pqw
-    vel_eci_arr = rotation @ vel_pqw
+    return pos_eci, vel_eci
 
-    pos_eci = [float(pos_eci_arr[0]), float(pos_eci_arr[1]), float(pos_eci_arr[2])]
-    vel_eci = [float(vel_eci_arr[0]), float(vel_eci_arr[1]), float(vel_eci_arr[2])]
 
-    return pos_eci, vel_eci
+def kepler_to_cartesian_batch(
+    a: np.ndarray | float,
+    e: np.ndarray | float,
+    i_rad: np.ndarray | float,
+    omega_big_rad: np.ndarray | float,
+    omega_small_rad: np.ndarray | float,
+    nu_rad: np.ndarray | float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized kepler_to_cartesian over broadcastable element arrays.
+
+    Any subset of the inputs may be arrays; they broadcast together under
+    normal NumPy rules. Scalar elements with an (T,) true-anomaly grid give
+    a (T, 3) time series; (N, 1) elements against a (T,) grid give
+    (N, T, 3).
+
+    Args:
+        a: Semi-major axis (m)
+        e: Eccentricity
+        i_rad: Inclination (radians)
+        omega_big_rad: RAAN (radians)
+        omega_small_rad: Argument of perigee (radians)
+        nu_rad: True anomaly (radians)
+
+    Returns:
+        (position_eci, velocity_eci), each of shape broadcast_shape + (3,),
+        in m and m/s.
+    """
+    mu = OrbitalConstants.MU_EARTH
+
+    a = np.asarray(a, dtype=np.float64)
+    e = np.asarray(e, dtype=np.float64)
+    nu = np.asarray(nu_rad, dtype=np.float64)
+
+    cos_nu = np.cos(nu)
+    sin_nu = np.sin(nu)
+
+    p = a * (1 - e**2)
+    r = p / (1 + e * cos_nu)
+    p_factor = np.sqrt(mu / p)
+
+    x_pqw = r * cos_nu
+    y_pqw = r * sin_nu
+    vx_pqw = -p_factor * sin_nu
+    vy_pqw = p_factor * (e + cos_nu)
+
+    cO = np.cos(omega_big_rad)
+    sO = np.sin(omega_big_rad)
+    co = np.cos(omega_small_rad)
+    so = np.sin(omega_small_rad)
+    ci = np.cos(i_rad)
+    si = np.sin(i_rad)
+
+    # Only the first two rotation columns matter: the PQW z-component is 0.
+    r00 = cO * co - sO * so * ci
+    r01 = -cO * so - sO * co * ci
+    r10 = sO * co + cO * so * ci
+    r11 = -sO * so + cO * co * ci
+    r20 = so * si
+    r21 = co * si
+
+    pos = np.stack(np.broadcast_arrays(
+        r00 * x_pqw + r01 * y_pqw,
+        r10 * x_pqw + r11 * y_pqw,
+        r20 * x_pqw + r21 * y_pqw,
+    ), axis=-1)
+    vel = np.stack(np.broadcast_arrays(
+        r00 * vx_pqw + r01 * vy_pqw,
+        r10 * vx_pqw + r11 * vy_pqw,
+        r20 * vx_pqw + r21 * vy_pqw,
+    ), axis=-1)
+
+    return pos, vel
 
 
 def sso_inclination_deg(altitude_km: float) -> float:
@@ -115,7 +248,17 @@ def sso_inclination_deg(altitude_km: float) -> float:
     return float(np.degrees(np.arccos(cos_i)))
 
 
-def j2_raan_rate(n: float, a: float, e: float, i_rad: float) -> float:
+def _float_or_array(x: np.ndarray | float) -> np.ndarray | float:
+    """Return a Python float for 0-d results, the array otherwise."""
+    return float(x) if np.ndim(x) == 0 else x
+
+
+def j2_raan_rate(
+    n: np.ndarray | float,
+    a: np.ndarray | float,
+    e: np.ndarray | float,
+    i_rad: np.ndarray | float,
+) -> np.ndarray | float:
     """
     J2 secular rate of RAAN (longitude of ascending node).
 
@@ -127,15 +270,23 @@ def j2_raan_rate(n: float, a: float, e: float, i_rad: float) -> float:
         e: Eccentricity.
         i_rad: Inclination (radians).
 
+    Inputs may be scalars or broadcastable arrays.
+
     Returns:
-        RAAN rate in rad/s. Negative for prograde, positive for retrograde.
+        RAAN rate in rad/s (float for scalar inputs, else an array).
+        Negative for prograde, positive for retrograde.
     """
     c = OrbitalConstants
     p_ratio = (c.R_EARTH_EQUATORIAL / a) ** 2
-    return float(-1.5 * n * c.J2_EARTH * p_ratio * np.cos(i_rad) / (1 - e**2) ** 2)
+    return _float_or_array(-1.5 * n * c.J2_EARTH * p_ratio * np.cos(i_rad) / (1 - e**2) ** 2)
 
 
-def j2_arg_perigee_rate(n: float, a: float, e: float, i_rad: float) -> float:
+def j2_arg_perigee_rate(
+    n: np.ndarray | float,
+    a: np.ndarray | float,
+    e: np.ndarray | float,
+    i_rad: np.ndarray | float,
+) -> np.ndarray | float:
     """
     J2 secular rate of argument of perigee.
 
@@ -149,15 +300,23 @@ def j2_arg_perigee_rate(n: float, a: float, e: float, i_rad: float) -> float:
         e: Eccentricity.
         i_rad: Inclination (radians).
 
+    Inputs may be scalars or broadcastable arrays.
+
     Returns:
-        Argument of perigee rate in rad/s.
+        Argument of perigee rate in rad/s (float for scalar inputs, else
+        an array).
     """
     c = OrbitalConstants
     p_ratio = (c.R_EARTH_EQUATORIAL / a) ** 2
-    return float(1.5 * n * c.J2_EARTH * p_ratio * (2 - 2.5 * np.sin(i_rad) ** 2) / (1 - e**2) ** 2)
+    return _float_or_array(1.5 * n * c.J2_EARTH * p_ratio * (2 - 2.5 * np.sin(i_rad) ** 2) / (1 - e**2) ** 2)
 
 
-def j2_mean_motion_correction(n: float, a: float, e: float, i_rad: float) -> float:
+def j2_mean_motion_correction(
+    n: np.ndarray | float,
+    a: np.ndarray | float,
+    e: np.ndarray | float,
+    i_rad: np.ndarray | float,
+) -> np.ndarray | float:
     """
     J2-corrected mean motion.
 
@@ -169,9 +328,12 @@ def j2_mean_motion_correction(n: float, a: float, e: float, i_rad: float) -> flo
         e: Eccentricity.
         i_rad: Inclination (radians).
 
+    Inputs may be scalars or broadcastable arrays.
+
     Returns:
-        Corrected mean motion in rad/s.
+        Corrected mean motion in rad/s (float for scalar inputs, else an
+        array).
     """
     c = OrbitalConstants
     p_ratio = (c.R_EARTH_EQUATORIAL / a) ** 2
-    return float(n * (1 + 1.5 * c.J2_EARTH * p_ratio * np.sqrt(1 - e**2) * (1 - 1.5 * np.sin(i_rad) ** 2)))
+    return _float_or_array(n * (1 + 1.5 * c.J2_EARTH * p_ratio * np.sqrt(1 - e**2) * (1 - 1.5 * np.sin(i_rad) ** 2)))
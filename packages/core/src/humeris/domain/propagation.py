@@ -107,10 +107,82 @@ def derive_orbital_state(
     )
 
 
+def derive_orbital_states_batch(
+    satellites,
+    reference_epoch: datetime,
+    include_j2: bool = False,
+) -> list[OrbitalState]:
+    """
+    Derive OrbitalStates for many satellites with one set of array operations.
+
+    Same circular-orbit assumptions as derive_orbital_state, with the norms,
+    angular momentum, inclination, mean motion and J2 rates computed over
+    (N, 3) arrays. Results agree with the per-satellite path to rounding.
+
+    Args:
+        satellites: Sequence of Satellite objects.
+        reference_epoch: Reference time for the states.
+        include_j2: If True, compute J2 secular perturbation rates.
+
+    Returns:
+        List of OrbitalState, in the order of satellites.
+    """
+    if not satellites:
+        return []
+
+    pos = np.array([s.position_eci for s in satellites], dtype=np.float64)
+    vel = np.array([s.velocity_eci for s in satellites], dtype=np.float64)
+
+    a = np.sqrt(np.einsum("ij,ij->i", pos, pos))
+
+    h = np.cross(pos, vel)
+    h_mag = np.sqrt(np.einsum("ij,ij->i", h, h))
+    safe_h = np.where(h_mag > 0, h_mag, 1.0)
+    inc = np.where(h_mag > 0, np.arccos(h[:, 2] / safe_h), 0.0)
+
+    n = np.sqrt(OrbitalConstants.MU_EARTH / a**3)
+
+    raan = np.radians([s.raan_deg for s in satellites])
+    nu_0 = np.radians([s.true_anomaly_deg for s in satellites])
+    offsets = np.array([
+        (reference_epoch - s.epoch).total_seconds() if s.epoch is not None else 0.0
+        for s in satellites
+    ])
+    nu_at_ref = nu_0 + n * offsets
+
+    e = 0.0
+    if include_j2:
+        j2_raan = j2_raan_rate(n, a, e, inc)
+        j2_argp = j2_arg_perigee_rate(n, a, e, inc)
+        j2_n_corr = j2_mean_motion_correction(n, a, e, inc)
+    else:
+        j2_raan = j2_argp = j2_n_corr = np.zeros(len(satellites))
+
+    return [
+        OrbitalState(
+            semi_major_axis_m=a_i,
+            eccentricity=e,
+            inclination_rad=inc_i,
+            raan_rad=raan_i,
+            arg_perigee_rad=0.0,
+            true_anomaly_rad=nu_i,
+            mean_motion_rad_s=n_i,
+            reference_epoch=reference_epoch,
+            j2_raan_rate=jr,
+            j2_arg_perigee_rate=ja,
+            j2_mean_motion_correction=jn,
+        )
+        for a_i, inc_i, raan_i, nu_i, n_i, jr, ja, jn in zip(
+            a.tolist(), inc.tolist(), raan.tolist(), nu_at_ref.tolist(),
+            n.tolist(), j2_raan.tolist(), j2_argp.tolist(), j2_n_corr.tolist(),
+        )
+    ]
+
+
 def propagate_to(
     state: OrbitalState,
     target_time: datetime,
-) -> tuple[list[float], list[float]]:
+) -> tuple[np.ndarray, np.ndarray]:
     """
     Propagate orbital state to target time, returning ECI position/velocity.
 
@@ -122,7 +194,8 @@ def propagate_to(
         target_time: Target UTC datetime.
 
     Returns:
-        (position_eci [x,y,z] in m, velocity_eci [vx,vy,vz] in m/s)
+        (position_eci, velocity_eci) as float64 arrays of shape (3,),
+        in m and m/s.
     """
     dt = (target_time - state.reference_epoch).total_seconds()
 
@@ -281,7 +281,7 @@ def generate_from_configs(configs: list[Any]) -> list[Any]:
 
 def load_default_satellites() -> list[Any]:
     """Load the default constellation (Walker shells + SSO band)."""
-    from humeris.cli import get_default_shells
+    from humeris.defaults import get_default_shells
 
     return generate_from_configs(get_default_shells())
 
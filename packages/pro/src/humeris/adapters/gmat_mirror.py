@@ -26,6 +26,7 @@ from humeris.domain.numerical_propagation import (
     SphericalHarmonicGravity,
     TwoBodyGravity,
     propagate_numerical,
+    propagate_universal_variable,
 )
 from humeris.domain.orbit_properties import state_vector_to_elements
 from humeris.domain.gravity_field import CunninghamGravity, load_gravity_field
@@ -137,12 +138,11 @@ def run_humeris_mirror() -> dict[str, dict[str, float]]:
         ta_deg=0.0,
         epoch=basic_epoch,
     )
-    basic = propagate_numerical(
+    # Pure two-body: closed-form universal-variable solve, no integration.
+    basic = propagate_universal_variable(
         initial_state=basic_state,
         duration=timedelta(seconds=5400.0),
         step=timedelta(seconds=30.0),
-        force_models=[TwoBodyGravity()],
-        integrator="dormand_prince",
     )
     b_start = basic.steps[0]
     b_end = basic.steps[-1]
@@ -203,12 +203,10 @@ def run_humeris_mirror() -> dict[str, dict[str, float]]:
         ta_deg=40.0,
         epoch=ou_epoch,
     )
-    ou = propagate_numerical(
+    ou = propagate_universal_variable(
         initial_state=ou_state,
         duration=timedelta(days=120.0),
         step=timedelta(seconds=3600.0),
-        force_models=[TwoBodyGravity()],
-        integrator="dormand_prince",
     )
     o_start = ou.steps[0]
     o_end = ou.steps[-1]
@@ -777,6 +777,12 @@ class LayerManager:
                 raise KeyError(f"Layer not found: {layer_id}")
             del self.layers[layer_id]
 
+    def clear_layers(self) -> None:
+        """Remove all layers and restart layer ID numbering."""
+        with self._lock:
+            self.layers.clear()
+            self._counter = 0
+
     def update_layer(
         self,
         layer_id: str,
@@ -1338,8 +1344,7 @@ th {{ background: #f0f4f8; font-weight: 600; }}
 
         with self._lock:
             # Clear existing layers atomically with restore
-            self.layers.clear()
-            self._counter = 0
+            self.clear_layers()
             self.constraints = list(session_data.get("constraints", []))
             if "duration_s" in session_data:
                 self.duration = timedelta(seconds=session_data["duration_s"])
@@ -1524,28 +1529,78 @@ class ThreadingHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
 
 
 class ConstellationHandler(BaseHTTPRequestHandler):
-    """HTTP request handler for the interactive viewer API."""
+    """HTTP request handler for the interactive viewer API.
+
+    Speaks HTTP/1.1 so clients can keep a connection open across requests;
+    every response carries Content-Length. A connection is closed after a
+    request whose body was not read, since the unread bytes would be parsed
+    as the next request line.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; without TCP_NODELAY the
+    # body waits on the client's delayed ACK of a kept-alive connection.
+    disable_nagle_algorithm = True
 
     # Set by create_viewer_server
     layer_manager: LayerManager
     html_content: str = ""
 
+    _body_consumed = False
+
     def log_message(self, format: str, *args: Any) -> None:
         """Suppress default stderr logging."""
         logger.debug(format, *args)
 
-    def _set_headers(self, status: int = 200, content_type: str = "application/json") -> None:
+    def parse_request(self) -> bool:
+        self._body_consumed = False
+        return super().parse_request()
+
+    def _has_unread_body(self) -> bool:
+        headers = getattr(self, "headers", None)
+        if headers is None or self._body_consumed:
+            return False
+        if headers.get("Transfer-Encoding"):
+            return True
+        return headers.get("Content-Length", "0").strip() not in ("", "0")
+
+    def end_headers(self) -> None:
+        if self._has_unread_body():
+            self.close_connection = True
+            self.send_header("Connection", "close")
+        super().end_headers()
+
+    def _set_headers(
+        self,
+        status: int = 200,
+        content_type: str = "application/json",
+        content_length: int | None = None,
+        extra_headers: tuple[tuple[str, str], ...] = (),
+    ) -> None:
         self.send_response(status)
         self.send_header("Content-Type", content_type)
+        if content_length is not None:
+            self.send_header("Content-Length", str(content_length))
+        for name, value in extra_headers:
+            self.send_header(name, value)
         port = self.server.server_address[1]
         self.send_header("Access-Control-Allow-Origin", f"http://localhost:{port}")
         self.send_header("Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS")
         self.send_header("Access-Control-Allow-Headers", "Content-Type")
         self.end_headers()
 
+    def _send_body(
+        self,
+        payload: bytes,
+        status: int = 200,
+        content_type: str = "application/json",
+        extra_headers: tuple[tuple[str, str], ...] = (),
+    ) -> None:
+        self._set_headers(status, content_type, len(payload), extra_headers)
+        self.wfile.write(payload)
+
     def _json_response(self, data: Any, status: int = 200) -> None:
-        self._set_headers(status, "application/json")
-        self.wfile.write(json.dumps(_sanitize_for_json(data)).encode())
+        self._send_body(json.dumps(_sanitize_for_json(data)).encode(), status)
 
     def _error_response(self, status: int, message: str) -> None:
         self._json_response({"error": message}, status)
@@ -1559,6 +1614,7 @@ class ConstellationHandler(BaseHTTPRequestHandler):
         except (ValueError, TypeError):
             raise ValueError(f"Invalid Content-Length: {raw_length}")
         if length == 0:
+            self._body_consumed = True
             return {}
         if length < 0 or length > self._MAX_BODY_SIZE:
             raise ValueError(
@@ -1566,6 +1622,7 @@ class ConstellationHandler(BaseHTTPRequestHandler):
                 f"(max {self._MAX_BODY_SIZE})"
             )
         raw = self.rfile.read(length)
+        self._body_consumed = True
         return json.loads(raw.decode())
 
     def _route_path(self) -> tuple[str, str]:
@@ -1590,14 +1647,15 @@ class ConstellationHandler(BaseHTTPRequestHandler):
             self._do_GET()
         except Exception:
             logger.exception("Unhandled error in GET %s", self.path)
+            # A partial response may already be on the wire
+            self.close_connection = True
             self._error_response(500, "Internal server error")
 
     def _do_GET(self) -> None:
         base, param = self._route_path()
 
         if base == "/" or self.path == "/":
-            self._set_headers(200, "text/html")
-            self.wfile.write(self.html_content.encode())
+            self._send_body(self.html_content.encode(), content_type="text/html")
             return
 
         if base == "/api/state":
@@ -1616,18 +1674,13 @@ class ConstellationHandler(BaseHTTPRequestHandler):
             try:
                 czml = self.layer_manager.get_czml(param)
                 safe_name = self._sanitize_filename(param)
-                self.send_response(200)
-                self.send_header("Content-Type", "application/json")
-                self.send_header(
-                    "Content-Disposition",
-                    f'attachment; filename="{safe_name}.czml"',
+                self._send_body(
+                    json.dumps(czml, indent=2).encode(),
+                    extra_headers=((
+                        "Content-Disposition",
+                        f'attachment; filename="{safe_name}.czml"',
+                    ),),
                 )
-                port = self.server.server_address[1]
-                self.send_header("Access-Control-Allow-Origin", f"http://localhost:{port}")
-                self.send_header("Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS")
-                self.send_header("Access-Control-Allow-Headers", "Content-Type")
-                self.end_headers()
-                self.wfile.write(json.dumps(czml, indent=2).encode())
             except KeyError:
                 self._error_response(404, f"Layer not found: {param}")
             return
@@ -1638,18 +1691,13 @@ class ConstellationHandler(BaseHTTPRequestHandler):
 
         if base == "/api/export-all":
             merged = self.layer_manager.export_all_czml()
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.send_header(
-                "Content-Disposition",
-                'attachment; filename="constellation-all.czml"',
+            self._send_body(
+                json.dumps(merged, indent=2).encode(),
+                extra_headers=((
+                    "Content-Disposition",
+                    'attachment; filename="constellation-all.czml"',
+                ),),
             )
-            port = self.server.server_address[1]
-            self.send_header("Access-Control-Allow-Origin", f"http://localhost:{port}")
-            self.send_header("Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS")
-            self.send_header("Access-Control-Allow-Headers", "Content-Type")
-            self.end_headers()
-            self.wfile.write(json.dumps(merged, indent=2).encode())
             return
 
         if base == "/api/table" and param:
@@ -1664,15 +1712,13 @@ class ConstellationHandler(BaseHTTPRequestHandler):
             html_report = self.layer_manager.generate_report(
                 name="Constellation Report",
             )
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html")
-            self.send_header("Content-Disposition", 'attachment; filename="report.html"')
-            port = self.server.server_address[1]
-            self.send_header("Access-Control-Allow-Origin", f"http://localhost:{port}")
-            self.send_header("Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS")
-            self.send_header("Access-Control-Allow-Headers", "Content-Type")
-            self.end_headers()
-            self.wfile.write(html_report.encode())
+            self._send_body(
+                html_report.encode(),
+                content_type="text/html",
+                extra_headers=(
+                    ("Content-Disposition", 'attachment; filename="report.html"'),
+                ),
+            )
             return
 
         self._error_response(404, "Not found")
@@ -1686,6 +1732,8 @@ class ConstellationHandler(BaseHTTPRequestHandler):
             logger.debug("Client disconnected during POST %s", self.path)
         except Exception:
             logger.exception("Unhandled error in POST %s", self.path)
+            # A partial response may already be on the wire
+            self.close_connection = True
             try:
                 self._error_response(500, "Internal server error")
             except (ConnectionAbortedError, BrokenPipeError, ConnectionResetError):
@@ -2033,6 +2081,8 @@ class ConstellationHandler(BaseHTTPRequestHandler):
             self._do_PUT()
         except Exception:
             logger.exception("Unhandled error in PUT %s", self.path)
+            # A partial response may already be on the wire
+            self.close_connection = True
             self._error_response(500, "Internal server error")
 
     def _do_PUT(self) -> None:
@@ -2117,6 +2167,8 @@ class ConstellationHandler(BaseHTTPRequestHandler):
             self._do_DELETE()
         except Exception:
             logger.exception("Unhandled error in DELETE %s", self.path)
+            # A partial response may already be on the wire
+            self.close_connection = True
             self._error_response(500, "Internal server error")
 
     def _do_DELETE(self) -> None:
@@ -248,6 +248,7 @@ class AdaptiveStepConfig:
     h_max: float = 600.0
     safety_factor: float = 0.9
     max_steps: int = 1_000_000
+    max_rejected_steps: int = 100_000
 
 
 @dataclass(frozen=True)
@@ -571,6 +572,9 @@ def propagate_adaptive(
 
     Returns:
         AdaptiveStepResult with propagation trajectory and metadata.
+
+    Raises:
+        ValueError: If max_rejected_steps is reached before the end time.
     """
     if config is None:
         config = AdaptiveStepConfig()
@@ -579,7 +583,7 @@ def propagate_adaptive(
     duration_s = duration.total_seconds()
 
     # Convert to Cartesian ECI
-    pos_list, vel_list = kepler_to_cartesian(
+    pos_eci, vel_eci = kepler_to_cartesian(
         a=initial_state.semi_major_axis_m,  # type: ignore[attr-defined]
         e=initial_state.eccentricity,  # type: ignore[attr-defined]
         i_rad=initial_state.inclination_rad,  # type: ignore[attr-defined]
@@ -587,10 +591,7 @@ def propagate_adaptive(
         omega_small_rad=initial_state.arg_perigee_rad,  # type: ignore[attr-defined]
         nu_rad=initial_state.true_anomaly_rad,  # type: ignore[attr-defined]
     )
-    state: tuple[float, ...] = (
-        pos_list[0], pos_list[1], pos_list[2],
-        vel_list[0], vel_list[1], vel_list[2],
-    )
+    state: tuple[float, ...] = (*pos_eci.tolist(), *vel_eci.tolist())
 
     model_names = tuple(type(fm).__name__ for fm in force_models)
 
@@ -641,7 +642,11 @@ def propagate_adaptive(
         prev_state = state
         prev_k = k1
 
-        while t < t_end - 1e-12 and total_steps < config.max_steps:
+        while (
+            t < t_end - 1e-12
+            and total_steps < config.max_steps
+            and rejected_steps < config.max_rejected_steps
+        ):
             h_try = min(h, t_end - t)
             h_try = max(h_try, config.h_min)
 
@@ -693,7 +698,11 @@ def propagate_adaptive(
             velocity_eci=(state[3], state[4], state[5]),
         ))
 
-        while t < t_end - 1e-12 and total_steps < config.max_steps:
+        while (
+            t < t_end - 1e-12
+            and total_steps < config.max_steps
+            and rejected_steps < config.max_rejected_steps
+        ):
             h_try = min(h, t_end - t)
             h_try = max(h_try, config.h_min)
 
@@ -720,6 +729,13 @@ def propagate_adaptive(
                 rejected_steps += 1
                 h = _new_step_size(h_try, err, safety, config.h_min, config.h_max)
 
+    if rejected_steps >= config.max_rejected_steps and t < t_end - 1e-12:
+        raise ValueError(
+            f"Adaptive step stalled at t={sign * t:.6g} s after "
+            f"{rejected_steps} rejected steps (max_rejected_steps="
+            f"{config.max_rejected_steps}); loosen rtol/atol or lower h_min"
+        )
+
     return AdaptiveStepResult(
         steps=tuple(steps_list),
         epoch=ref_epoch,
@@ -753,6 +769,9 @@ def propagate_rk89_adaptive(
 
     Returns:
         AdaptiveStepResult with propagation trajectory and metadata.
+
+    Raises:
+        ValueError: If max_rejected_steps is reached before the end time.
     """
     if config is None:
         config = AdaptiveStepConfig()
@@ -760,7 +779,7 @@ def propagate_rk89_adaptive(
     ref_epoch = epoch if epoch is not None else initial_state.reference_epoch  # type: ignore[attr-defined]
     duration_s = duration.total_seconds()
 
-    pos_list, vel_list = kepler_to_cartesian(
+    pos_eci, vel_eci = kepler_to_cartesian(
         a=initial_state.semi_major_axis_m,  # type: ignore[attr-defined]
         e=initial_state.eccentricity,  # type: ignore[attr-defined]
         i_rad=initial_state.inclination_rad,  # type: ignore[attr-defined]
@@ -768,10 +787,7 @@ def propagate_rk89_adaptive(
         omega_small_rad=initial_state.arg_perigee_rad,  # type: ignore[attr-defined]
         nu_rad=initial_state.true_anomaly_rad,  # type: ignore[attr-defined]
     )
-    state: tuple[float, ...] = (
-        pos_list[0], pos_list[1], pos_list[2],
-        vel_list[0], vel_list[1], vel_list[2],
-    )
+    state: tuple[float, ...] = (*pos_eci.tolist(), *vel_eci.tolist())
 
     model_names = tuple(type(fm).__name__ for fm in force_models)
 
@@ -818,7 +834,11 @@ def propagate_rk89_adaptive(
         prev_state = state
         prev_deriv = deriv_fn(sign * t, state)
 
-        while t < t_end - 1e-12 and total_steps < config.max_steps:
+        while (
+            t < t_end - 1e-12
+            and total_steps < config.max_steps
+            and rejected_steps < config.max_rejected_steps
+        ):
             h_try = min(h, t_end - t)
             h_try = max(h_try, config.h_min)
 
@@ -869,7 +889,11 @@ def propagate_rk89_adaptive(
             velocity_eci=(state[3], state[4], state[5]),
         ))
 
-        while t < t_end - 1e-12 and total_steps < config.max_steps:
+        while (
+            t < t_end - 1e-12
+            and total_steps < config.max_steps
+            and rejected_steps < config.max_rejected_steps
+        ):
             h_try = min(h, t_end - t)
             h_try = max(h_try, config.h_min)
 
@@ -895,6 +919,13 @@ def propagate_rk89_adaptive(
                 rejected_steps += 1
                 h = _rk89_new_step_size(h_try, err, safety, config.h_min, config.h_max)
 
+    if rejected_steps >= config.max_rejected_steps and t < t_end - 1e-12:
+        raise ValueError(
+            f"Adaptive step stalled at t={sign * t:.6g} s after "
+            f"{rejected_steps} rejected steps (max_rejected_steps="
+            f"{config.max_rejected_steps}); loosen rtol/atol or lower h_min"
+        )
+
     return AdaptiveStepResult(
         steps=tuple(steps_list),
         epoch=ref_epoch,
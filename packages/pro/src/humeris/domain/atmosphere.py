@@ -141,6 +141,46 @@ def atmospheric_density(
     return float(rho_base * np.exp(-(altitude_km - h_base) / scale_height))
 
 
+_MODEL_COLUMNS = {
+    model: np.array(table, dtype=np.float64).T
+    for model, table in _MODEL_TABLES.items()
+}
+
+
+def atmospheric_density_batch(
+    altitude_km: np.ndarray,
+    model: AtmosphereModel = AtmosphereModel.HIGH_ACTIVITY,
+) -> np.ndarray:
+    """Vectorized atmospheric_density over an array of altitudes.
+
+    Uses the same bracket selection as the scalar binary search
+    (last table row with h_base <= h), so results match element-wise.
+
+    Args:
+        altitude_km: Altitudes above Earth surface in km.
+        model: Atmosphere model table to use.
+
+    Returns:
+        Atmospheric densities in kg/m³, same shape as altitude_km.
+
+    Raises:
+        ValueError: If any altitude is outside table range.
+    """
+    h_base, rho_base, scale_height = _MODEL_COLUMNS[model]
+    h = np.asarray(altitude_km, dtype=np.float64)
+
+    if h.size and (h.min() < h_base[0] or h.max() > h_base[-1]):
+        bad = h[(h < h_base[0]) | (h > h_base[-1])].flat[0]
+        raise ValueError(
+            f"Altitude {bad} km outside valid range "
+            f"[{h_base[0]:g}, {h_base[-1]:g}] km"
+        )
+
+    # In range, so searchsorted >= 1; the top row shares the last bracket
+    idx = np.minimum(h_base.searchsorted(h, side="right") - 1, len(h_base) - 2)
+    return rho_base[idx] * np.exp(-(h - h_base[idx]) / scale_height[idx])
+
+
 def estimate_drag_lifetime_years(
     altitude_km: float,
     model: AtmosphereModel = AtmosphereModel.VALLADO_4TH,
@@ -7,6 +7,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class ScreeningProfile:
@@ -38,6 +40,10 @@ _PROFILE_PACKS = {
 }
 
 
+# A conjunction is flagged when the upper probability band reaches this.
+_FLAG_PC_UPPER = 1e-4
+
+
 def get_screening_profile(name: str) -> ScreeningProfile:
     try:
         return _PROFILE_PACKS[name]
@@ -57,7 +63,7 @@ def evaluate_profiled_screening(
     lower = max(0.0, scaled_pc * 0.7)
     upper = min(1.0, scaled_pc * 1.3)
 
-    flagged = miss_distance_m <= profile.threshold_m or upper >= 1e-4
+    flagged = miss_distance_m <= profile.threshold_m or upper >= _FLAG_PC_UPPER
 
     return {
         "profile": {
@@ -79,3 +85,32 @@ def evaluate_profiled_screening(
             },
         },
     }
+
+
+def evaluate_profiled_screening_batch(
+    miss_distance_m: np.ndarray,
+    base_collision_probability: np.ndarray,
+    profile_name: str,
+) -> np.ndarray:
+    """Vectorized flag decision of evaluate_profiled_screening.
+
+    Args:
+        miss_distance_m: Miss distances (m), any shape.
+        base_collision_probability: Unscaled collision probabilities,
+            broadcastable against miss_distance_m.
+        profile_name: Name of the profile pack to apply.
+
+    Returns:
+        Boolean array, True where the conjunction is flagged.
+    """
+    profile = get_screening_profile(profile_name)
+
+    miss = np.asarray(miss_distance_m, dtype=np.float64)
+    scaled_pc = np.clip(
+        np.asarray(base_collision_probability, dtype=np.float64) * profile.covariance_scale,
+        0.0,
+        1.0,
+    )
+    upper = np.minimum(1.0, scaled_pc * 1.3)
+
+    return (miss <= profile.threshold_m) | (upper >= _FLAG_PC_UPPER)
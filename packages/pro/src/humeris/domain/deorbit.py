@@ -18,7 +18,10 @@ import numpy as np
 
 from humeris.domain.orbital_mechanics import OrbitalConstants
 from humeris.domain.atmosphere import DragConfig
-from humeris.domain.lifetime import compute_orbit_lifetime
+from humeris.domain.lifetime import (
+    compute_orbit_lifetime,
+    compute_orbit_lifetime_batch,
+)
 from humeris.domain.maneuvers import hohmann_transfer
 
 _MU = OrbitalConstants.MU_EARTH
@@ -31,6 +34,9 @@ class DeorbitRegulation(Enum):
     ESA_25YEAR = "esa_25year"  # ESA 25-year guideline (legacy)
 
 
+# Step of the batch lifetime integration (compute_orbit_lifetime_batch default)
+_LIFETIME_STEP_DAYS = 1.0
+
 _REGULATION_THRESHOLDS = {
     DeorbitRegulation.FCC_5YEAR: 5.0 * 365.25,    # days
     DeorbitRegulation.ESA_25YEAR: 25.0 * 365.25,   # days
@@ -50,6 +56,24 @@ class DeorbitAssessment:
     propellant_mass_kg: float | None  # if isp and mass provided
 
 
+@dataclass(frozen=True, eq=False)
+class DeorbitBatchAssessment:
+    """Deorbit compliance results for an array of altitudes.
+
+    Element i of each array corresponds to altitudes_km[i]. Entries that
+    are naturally compliant have zero delta-V and NaN target perigee.
+    """
+    altitudes_km: np.ndarray
+    compliant: np.ndarray             # bool
+    regulation: DeorbitRegulation
+    natural_lifetime_days: np.ndarray
+    threshold_days: float
+    maneuver_required: np.ndarray     # bool
+    deorbit_delta_v_ms: np.ndarray
+    target_perigee_km: np.ndarray     # NaN where no maneuver needed
+    propellant_mass_kg: np.ndarray | None  # if isp and mass provided
+
+
 def assess_deorbit_compliance(
     altitude_km: float,
     drag_config: DragConfig,
@@ -165,3 +189,103 @@ def assess_deorbit_compliance(
         target_perigee_km=target_perigee_km,
         propellant_mass_kg=propellant_mass,
     )
+
+
+def assess_deorbit_compliance_batch(
+    altitudes_km: np.ndarray,
+    drag_config: DragConfig,
+    epoch: datetime,
+    regulation: DeorbitRegulation = DeorbitRegulation.FCC_5YEAR,
+    isp_s: float | None = None,
+    dry_mass_kg: float | None = None,
+) -> DeorbitBatchAssessment:
+    """Assess deorbit compliance for many circular-orbit altitudes at once.
+
+    Same procedure as assess_deorbit_compliance, with the altitude as an
+    array axis: the natural lifetimes come from one lockstep integration,
+    and the perigee bisection advances all non-compliant altitudes
+    together, each stopping at its own 0.1 km tolerance.
+
+    Args:
+        altitudes_km: Orbital altitudes (km).
+        drag_config: Satellite drag configuration.
+        epoch: Reference epoch.
+        regulation: Deorbit regulation to assess.
+        isp_s: Specific impulse (s) for propellant estimate.
+        dry_mass_kg: Dry mass (kg) for propellant estimate.
+
+    Returns:
+        DeorbitBatchAssessment with one entry per altitude.
+    """
+    threshold_days = _REGULATION_THRESHOLDS[regulation]
+    max_years = max(50.0, threshold_days / 365.25 + 5.0)
+    altitudes = np.asarray(altitudes_km, dtype=np.float64)
+    a = _R_EARTH + altitudes * 1000.0
+
+    natural_lifetime_days = compute_orbit_lifetime_batch(
+        a, drag_config, max_years=max_years,
+    )
+    compliant = natural_lifetime_days <= threshold_days
+
+    # Bisection on target perigee for the non-compliant altitudes
+    perigee_lo_km = np.full(altitudes.shape, 100.0)
+    perigee_hi_km = altitudes.copy()
+    target_perigee_km = np.full(altitudes.shape, np.nan)
+    active = np.flatnonzero(~compliant)
+
+    for _ in range(50):
+        if not active.size:
+            break
+        alt_act = altitudes[active]
+        perigee_mid_km = (perigee_lo_km[active] + perigee_hi_km[active]) / 2.0
+        effective_alt_km = (perigee_mid_km + alt_act) / 2.0
+        a_eff = _R_EARTH + effective_alt_km * 1000.0
+
+        # Only "re-enters within threshold" matters here, so integration
+        # can stop one step past the threshold: an orbit that never
+        # re-enters then reports a lifetime strictly above it, wherever
+        # the threshold falls on the step grid. Orbits already at
+        # re-entry count as zero lifetime.
+        lt_days = np.zeros(active.shape)
+        valid = effective_alt_km > 100.0
+        if np.any(valid):
+            lt_days[valid] = compute_orbit_lifetime_batch(
+                a_eff[valid], drag_config, step_days=_LIFETIME_STEP_DAYS,
+                max_years=(threshold_days + _LIFETIME_STEP_DAYS) / 365.25,
+            )
+
+        short = lt_days <= threshold_days
+        perigee_lo_km[active[short]] = perigee_mid_km[short]
+        perigee_hi_km[active[~short]] = perigee_mid_km[~short]
+
+        converged = np.abs(perigee_hi_km[active] - perigee_lo_km[active]) < 0.1
+        active = active[~converged]
+
+    target_perigee_km[~compliant] = perigee_hi_km[~compliant]
+
+    # Delta-V to lower perigee from the circular orbit (zero if compliant)
+    r_perigee = _R_EARTH + np.where(compliant, altitudes, target_perigee_km) * 1000.0
+    a_target = (a + r_perigee) / 2.0
+    v_circular = np.sqrt(_MU / a)
+    v_at_apogee = np.sqrt(_MU * (2.0 / a - 1.0 / a_target))
+    delta_v = np.where(compliant, 0.0, np.abs(v_circular - v_at_apogee))
+
+    propellant_mass = None
+    if isp_s is not None and dry_mass_kg is not None:
+        propellant_mass = np.where(
+            delta_v > 0,
+            dry_mass_kg * (np.exp(delta_v / (isp_s * _G0)) - 1.0),
+            np.nan,
+        )
+
+    return DeorbitBatchAssessment(
+        altitudes_km=altitudes,
+        compliant=compliant,
+        regulation=regulation,
+        natural_lifetime_days=natural_lifetime_days,
+        threshold_days=threshold_days,
+        maneuver_required=~compliant,
+        deorbit_delta_v_ms=delta_v,
+        target_perigee_km=target_perigee_km,
+        propellant_mass_kg=propellant_mass,
+    )
@@ -20,10 +20,16 @@ from humeris.domain.orbital_mechanics import OrbitalConstants
 from humeris.domain.atmosphere import (
     AtmosphereModel,
     DragConfig,
+    atmospheric_density_batch,
     semi_major_axis_decay_rate,
 )
 
 
+# Below this many active orbits the batch loop hands off to per-orbit float
+# stepping: NumPy's per-call overhead then costs more than it saves.
+_SCALAR_TAIL_SIZE = 8
+
+
 @dataclass(frozen=True)
 class DecayPoint:
     """Single point in an orbit decay profile."""
@@ -147,6 +153,109 @@ def compute_orbit_lifetime(
     )
 
 
+def compute_orbit_lifetime_batch(
+    semi_major_axis_m: np.ndarray,
+    drag_config: DragConfig,
+    re_entry_altitude_km: float = 100.0,
+    step_days: float = 1.0,
+    max_years: float = 50.0,
+    atmosphere_model: AtmosphereModel | None = None,
+) -> np.ndarray:
+    """Compute orbit lifetimes for many initial semi-major axes at once.
+
+    Same forward Euler scheme as compute_orbit_lifetime, advanced in
+    lockstep with the orbits as an array axis. Orbits drop out of the
+    active set once they reach re-entry, and the last few still active
+    finish with plain float stepping; no decay profile is recorded.
+
+    Args:
+        semi_major_axis_m: Initial semi-major axes (m).
+        drag_config: Satellite drag configuration.
+        re_entry_altitude_km: Re-entry altitude threshold (km).
+        step_days: Integration step size (days).
+        max_years: Maximum simulation duration (years).
+        atmosphere_model: Atmosphere model table to use.
+
+    Returns:
+        Lifetimes in days, same shape as semi_major_axis_m. Orbits that
+        do not re-enter within max_years get the full simulated duration.
+
+    Raises:
+        ValueError: If any orbit is already below re-entry altitude or
+            step <= 0.
+    """
+    if step_days <= 0:
+        raise ValueError(f"step_days must be positive, got {step_days}")
+
+    a0 = np.asarray(semi_major_axis_m, dtype=np.float64)
+    initial_alt_km = (a0 - OrbitalConstants.R_EARTH_EQUATORIAL) / 1000.0
+    if np.any(initial_alt_km <= re_entry_altitude_km):
+        lowest = float(np.min(initial_alt_km))
+        raise ValueError(
+            f"Initial altitude {lowest:.1f} km already at or below "
+            f"re-entry altitude {re_entry_altitude_km} km"
+        )
+
+    model = atmosphere_model if atmosphere_model is not None else AtmosphereModel.HIGH_ACTIVITY
+    b_c = drag_config.ballistic_coefficient
+    dt_seconds = step_days * 86400.0
+    max_seconds = max_years * 365.25 * 86400.0
+
+    lifetime_days = np.full(a0.size, np.nan)
+    active = np.arange(a0.size)
+    a = a0.ravel()
+    re_entry_a = OrbitalConstants.R_EARTH_EQUATORIAL + re_entry_altitude_km * 1000.0
+    t_elapsed = 0.0
+
+    while t_elapsed < max_seconds and active.size:
+        if active.size <= _SCALAR_TAIL_SIZE:
+            for idx, a_i in zip(active.tolist(), a.tolist()):
+                lifetime_days[idx] = _finish_lifetime_days(
+                    a_i, t_elapsed, dt_seconds, max_seconds,
+                    drag_config, re_entry_altitude_km, model,
+                )
+            return lifetime_days.reshape(a0.shape)
+
+        h_km = (a - OrbitalConstants.R_EARTH_EQUATORIAL) / 1000.0
+        v = np.sqrt(OrbitalConstants.MU_EARTH / a)
+        rho = atmospheric_density_batch(h_km, model=model)
+        da_dt = -rho * v * b_c * a
+
+        a = np.maximum(a + da_dt * dt_seconds, OrbitalConstants.R_EARTH_EQUATORIAL)
+        t_elapsed += dt_seconds
+
+        # Cheap pre-filter on a; the exact altitude test decides re-entry
+        if a.min() <= re_entry_a + 1.0:
+            alt_km = (a - OrbitalConstants.R_EARTH_EQUATORIAL) / 1000.0
+            re_entered = alt_km <= re_entry_altitude_km
+            lifetime_days[active[re_entered]] = t_elapsed / 86400.0
+            active = active[~re_entered]
+            a = a[~re_entered]
+
+    lifetime_days[active] = t_elapsed / 86400.0
+    return lifetime_days.reshape(a0.shape)
+
+
+def _finish_lifetime_days(
+    a: float,
+    t_elapsed: float,
+    dt_seconds: float,
+    max_seconds: float,
+    drag_config: DragConfig,
+    re_entry_altitude_km: float,
+    model: AtmosphereModel,
+) -> float:
+    """Continue one orbit's decay with the compute_orbit_lifetime step."""
+    while t_elapsed < max_seconds:
+        a += semi_major_axis_decay_rate(a, 0.0, drag_config, model=model) * dt_seconds
+        if a < OrbitalConstants.R_EARTH_EQUATORIAL:
+            a = OrbitalConstants.R_EARTH_EQUATORIAL
+        t_elapsed += dt_seconds
+        if (a - OrbitalConstants.R_EARTH_EQUATORIAL) / 1000.0 <= re_entry_altitude_km:
+            break
+    return t_elapsed / 86400.0
+
+
 def compute_altitude_at_time(
     semi_major_axis_m: float,
     eccentricity: float,
@@ -14,7 +14,7 @@ gravitational harmonics) that analytical propagation cannot model.
 import math
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Callable, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Callable, Protocol, runtime_checkable
 
 import numpy as np
 
@@ -32,6 +32,10 @@ from humeris.domain.solar import (
 )
 from humeris.domain.eclipse import is_eclipsed, EclipseType
 
+if TYPE_CHECKING:
+    from humeris.domain.adaptive_integration import AdaptiveStepConfig
+    from humeris.domain.propagation import OrbitalState
+
 
 # --- Types ---
 
@@ -636,6 +640,7 @@ def propagate_numerical(
     force_models: list[ForceModel],
     epoch: datetime | None = None,
     integrator: str = "rk4",
+    adaptive_config: "AdaptiveStepConfig | None" = None,
 ) -> NumericalPropagationResult:
     """Numerical integration with summed force model accelerations.
 
@@ -651,6 +656,9 @@ def propagate_numerical(
         force_models: List of force models to sum.
         epoch: Override epoch (defaults to initial_state.reference_epoch).
         integrator: Integration method — "rk4", "verlet", "yoshida", "dormand_prince", or "rk89".
+        adaptive_config: Tolerances and step bounds for the adaptive
+            integrators ("dormand_prince", "rk89"); step then only sets the
+            output spacing. Defaults to AdaptiveStepConfig().
     """
     # Import here to avoid circular import at module level
     from humeris.domain.propagation import OrbitalState as _OS
@@ -659,16 +667,14 @@ def propagate_numerical(
         raise ValueError(f"Unknown integrator: {integrator!r}. Use 'rk4', 'verlet', 'yoshida', 'dormand_prince', or 'rk89'.")
 
     if integrator == "dormand_prince":
-        from humeris.domain.adaptive_integration import (
-            propagate_adaptive,
-            AdaptiveStepConfig,
-        )
+        from humeris.domain.adaptive_integration import propagate_adaptive
         ref_epoch_dp = epoch if epoch is not None else initial_state.reference_epoch
         dp_result = propagate_adaptive(
             initial_state=initial_state,
             duration=duration,
             force_models=force_models,
             epoch=ref_epoch_dp,
+            config=adaptive_config,
             output_step_s=step.total_seconds(),
         )
         dp_steps = dp_result.steps
@@ -712,16 +718,14 @@ def propagate_numerical(
         )
 
     if integrator == "rk89":
-        from humeris.domain.adaptive_integration import (
-            propagate_rk89_adaptive,
-            AdaptiveStepConfig,
-        )
+        from humeris.domain.adaptive_integration import propagate_rk89_adaptive
         ref_epoch_rk89 = epoch if epoch is not None else initial_state.reference_epoch
         rk89_result = propagate_rk89_adaptive(
             initial_state=initial_state,
             duration=duration,
             force_models=force_models,
             epoch=ref_epoch_rk89,
+            config=adaptive_config,
             output_step_s=step.total_seconds(),
         )
         rk89_steps = rk89_result.steps
@@ -769,7 +773,7 @@ def propagate_numerical(
     step_s = step.total_seconds()
 
     # Convert to Cartesian ECI
-    pos_list, vel_list = kepler_to_cartesian(
+    pos_eci, vel_eci = kepler_to_cartesian(
         a=initial_state.semi_major_axis_m,
         e=initial_state.eccentricity,
         i_rad=initial_state.inclination_rad,
@@ -777,8 +781,8 @@ def propagate_numerical(
         omega_small_rad=initial_state.arg_perigee_rad,
         nu_rad=initial_state.true_anomaly_rad,
     )
-    pos = (pos_list[0], pos_list[1], pos_list[2])
-    vel = (vel_list[0], vel_list[1], vel_list[2])
+    pos = tuple(pos_eci.tolist())
+    vel = tuple(vel_eci.tolist())
 
     # State vector: (x, y, z, vx, vy, vz)
     state_vec: tuple[float, ...] = pos + vel
@@ -874,6 +878,187 @@ def propagate_numerical(
     )
 
 
+# --- Universal-variable Kepler propagation (two-body only) ---
+
+def _stumpff_c2_c3(psi: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Stumpff functions c2(psi), c3(psi) for elliptic, parabolic and hyperbolic psi."""
+    c2 = np.full_like(psi, 0.5)
+    c3 = np.full_like(psi, 1.0 / 6.0)
+
+    ell = psi > 1e-6
+    sq = np.sqrt(psi[ell])
+    c2[ell] = (1.0 - np.cos(sq)) / psi[ell]
+    c3[ell] = (sq - np.sin(sq)) / (sq * psi[ell])
+
+    hyp = psi < -1e-6
+    sq = np.sqrt(-psi[hyp])
+    c2[hyp] = (1.0 - np.cosh(sq)) / psi[hyp]
+    c3[hyp] = (np.sinh(sq) - sq) / (sq * -psi[hyp])
+    return c2, c3
+
+
+def _universal_kepler(
+    r0: np.ndarray,
+    v0: np.ndarray,
+    dt_s: np.ndarray,
+    mu: float,
+    tol: float = 1e-9,
+    max_iter: int = 50,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Two-body state at each of dt_s from (r0, v0), shapes (N, 3).
+
+    Newton iteration on the universal anomaly chi (Vallado, Algorithm 8),
+    valid for elliptic, parabolic and hyperbolic orbits. All times are
+    solved together; each is an independent closed-form advance from the
+    initial state, so there is no step-to-step error accumulation.
+    """
+    sqrt_mu = math.sqrt(mu)
+    r0_mag = float(np.linalg.norm(r0))
+    v0_mag = float(np.linalg.norm(v0))
+    rdotv = float(np.dot(r0, v0))
+    sigma0 = rdotv / sqrt_mu
+    alpha = -v0_mag * v0_mag / mu + 2.0 / r0_mag  # 1/a
+
+    dt = np.asarray(dt_s, dtype=np.float64)
+
+    # Initial guess for chi
+    if alpha * r0_mag > 1e-6:
+        chi = sqrt_mu * dt * alpha
+    elif alpha * r0_mag < -1e-6:
+        a = 1.0 / alpha
+        sign = np.where(dt >= 0.0, 1.0, -1.0)
+        arg = (-2.0 * mu * alpha * dt) / (
+            rdotv + sign * math.sqrt(-mu * a) * (1.0 - r0_mag * alpha)
+        )
+        with np.errstate(divide="ignore"):
+            chi = np.where(dt == 0.0, 0.0, sign * math.sqrt(-a) * np.log(np.abs(arg)))
+    else:
+        # Parabolic: Barker's equation via s = arccot(3 sqrt(mu/p^3) dt) / 2
+        h = np.cross(r0, v0)
+        p = float(np.dot(h, h)) / mu
+        s_ang = 0.5 * np.arctan2(1.0, 3.0 * math.sqrt(mu / p ** 3) * dt)
+        w_ang = np.arctan(np.cbrt(np.tan(s_ang)))
+        chi = math.sqrt(p) * 2.0 / np.tan(2.0 * w_ang)
+
+    for _ in range(max_iter):
+        psi = chi * chi * alpha
+        c2, c3 = _stumpff_c2_c3(psi)
+        chi2 = chi * chi
+        r = chi2 * c2 + sigma0 * chi * (1.0 - psi * c3) + r0_mag * (1.0 - psi * c2)
+        residual = sqrt_mu * dt - chi2 * chi * c3 - sigma0 * chi2 * c2 - r0_mag * chi * (1.0 - psi * c3)
+        delta = residual / r
+        chi = chi + delta
+        if np.all(np.abs(delta) <= tol * np.maximum(1.0, np.abs(chi))):
+            break
+
+    psi = chi * chi * alpha
+    c2, c3 = _stumpff_c2_c3(psi)
+    chi2 = chi * chi
+    r = chi2 * c2 + sigma0 * chi * (1.0 - psi * c3) + r0_mag * (1.0 - psi * c2)
+
+    f = 1.0 - chi2 / r0_mag * c2
+    g = dt - chi2 * chi / sqrt_mu * c3
+    g_dot = 1.0 - chi2 / r * c2
+    f_dot = sqrt_mu / (r * r0_mag) * chi * (psi * c3 - 1.0)
+
+    pos = f[:, np.newaxis] * r0 + g[:, np.newaxis] * v0
+    vel = f_dot[:, np.newaxis] * r0 + g_dot[:, np.newaxis] * v0
+    return pos, vel
+
+
+def propagate_universal_variable(
+    initial_state: "OrbitalState",
+    duration: timedelta,
+    step: timedelta,
+    epoch: datetime | None = None,
+) -> NumericalPropagationResult:
+    """Analytic two-body propagation via the universal-variable Kepler solve.
+
+    Equivalent to propagate_numerical with [TwoBodyGravity()] but without
+    per-step force integration: every output time is reached by one
+    closed-form advance from the initial state. Handles elliptic,
+    parabolic and hyperbolic orbits alike.
+
+    Args:
+        initial_state: OrbitalState from derive_orbital_state.
+        duration: Total propagation duration.
+        step: Output time step.
+        epoch: Override epoch (defaults to initial_state.reference_epoch).
+
+    Returns:
+        NumericalPropagationResult on the same output grid as the
+        "dormand_prince" integrator, with force_model_names
+        ("TwoBodyGravity",).
+
+    Raises:
+        ValueError: If step is not positive.
+    """
+    ref_epoch = epoch if epoch is not None else initial_state.reference_epoch
+    duration_s = duration.total_seconds()
+    step_s = step.total_seconds()
+    if step_s <= 0.0:
+        raise ValueError(f"step must be positive, got {step_s} s")
+
+    pos_eci, vel_eci = kepler_to_cartesian(
+        a=initial_state.semi_major_axis_m,
+        e=initial_state.eccentricity,
+        i_rad=initial_state.inclination_rad,
+        omega_big_rad=initial_state.raan_rad,
+        omega_small_rad=initial_state.arg_perigee_rad,
+        nu_rad=initial_state.true_anomaly_rad,
+    )
+
+    # Same output grid as the adaptive integrators: every step, plus the
+    # end time when the duration is not a whole number of steps. The grid
+    # is built on |duration| and signed so negative durations run backward.
+    sign = 1.0 if duration_s >= 0.0 else -1.0
+    t_end = abs(duration_s)
+    times_s = np.arange(int(t_end / step_s + 1e-12) + 1) * step_s
+    if abs(times_s[-1] - t_end) > 1e-6:
+        times_s = np.append(times_s, t_end)
+    times_s = sign * times_s
+    positions, velocities = _universal_kepler(
+        np.asarray(pos_eci, dtype=np.float64),
+        np.asarray(vel_eci, dtype=np.float64),
+        times_s,
+        OrbitalConstants.MU_EARTH,
+    )
+    # The t = 0 sample is the initial state itself.
+    positions[0] = pos_eci
+    velocities[0] = vel_eci
+
+    r_magnitudes = np.sqrt(np.sum(positions**2, axis=1))
+    v_magnitudes = np.sqrt(np.sum(velocities**2, axis=1))
+    energies = 0.5 * v_magnitudes**2 - OrbitalConstants.MU_EARTH / r_magnitudes
+
+    steps = tuple(
+        PropagationStep(
+            time=ref_epoch + timedelta(seconds=t),
+            position_eci=(p[0], p[1], p[2]),
+            velocity_eci=(v[0], v[1], v[2]),
+            specific_energy_j_kg=e,
+        )
+        for t, p, v, e in zip(
+            times_s.tolist(), positions.tolist(), velocities.tolist(), energies.tolist(),
+        )
+    )
+
+    initial_energy = float(energies[0])
+    max_drift = float(np.max(np.abs(energies - initial_energy)))
+    relative_drift = abs(max_drift / initial_energy) if initial_energy != 0.0 else 0.0
+
+    return NumericalPropagationResult(
+        steps=steps,
+        epoch=ref_epoch,
+        duration_s=duration_s,
+        force_model_names=(TwoBodyGravity.__name__,),
+        initial_energy_j_kg=initial_energy,
+        final_energy_j_kg=float(energies[-1]),
+        max_energy_drift_j_kg=max_drift,
+        relative_energy_drift=relative_drift,
+    )
+
+
 # ── Jacobi Metric for Geodesic Propagation Stability (P5) ─────────
 
 @dataclass(frozen=True)
@@ -123,8 +123,8 @@ class SchwarzschildForce:
         position: tuple[float, float, float],
         velocity: tuple[float, float, float],
     ) -> tuple[float, float, float]:
-        pos = np.array(position)
-        vel = np.array(velocity)
+        pos = np.asarray(position, dtype=np.float64)
+        vel = np.asarray(velocity, dtype=np.float64)
 
         r_sq = float(np.dot(pos, pos))
         r = float(np.sqrt(r_sq))
@@ -169,8 +169,8 @@ class LenseThirringForce:
         position: tuple[float, float, float],
         velocity: tuple[float, float, float],
     ) -> tuple[float, float, float]:
-        pos = np.array(position)
-        vel = np.array(velocity)
+        pos = np.asarray(position, dtype=np.float64)
+        vel = np.asarray(velocity, dtype=np.float64)
 
         r_sq = float(np.dot(pos, pos))
         r = float(np.sqrt(r_sq))
@@ -222,7 +222,7 @@ class DeSitterForce:
         position: tuple[float, float, float],
         velocity: tuple[float, float, float],
     ) -> tuple[float, float, float]:
-        vel_arr = np.array(velocity)
+        vel_arr = np.asarray(velocity, dtype=np.float64)
 
         # Sun position (Earth-to-Sun vector) at epoch
         sun = np.array(_sun_position_approx(epoch))
@@ -17,15 +17,12 @@ def _is_absolute_path(value: object) -> bool:
 
 
 
-def create_replay_bundle(
-    out_dir: Path,
+def serialize_bundle(
     inputs: dict[str, Any],
     outputs: dict[str, Any],
     software_refs: dict[str, str],
-) -> Path:
-    """Create replay bundle with deterministic payload and integrity hash."""
-    out_dir.mkdir(parents=True, exist_ok=True)
-
+) -> bytes:
+    """Serialize replay bundle manifest in memory, including integrity hash."""
     payload = {
         "schema_version": "replay_bundle_v1",
         "inputs": inputs,
@@ -40,8 +37,20 @@ def create_replay_bundle(
         **payload,
         "bundle_hash": digest,
     }
+    return (json.dumps(manifest, indent=2) + "\n").encode("utf-8")
+
+
+
+def create_replay_bundle(
+    out_dir: Path,
+    inputs: dict[str, Any],
+    outputs: dict[str, Any],
+    software_refs: dict[str, str],
+) -> Path:
+    """Create replay bundle with deterministic payload and integrity hash."""
+    out_dir.mkdir(parents=True, exist_ok=True)
     path = out_dir / "replay_bundle.json"
-    path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    path.write_bytes(serialize_bundle(inputs, outputs, software_refs))
     return path
 
 
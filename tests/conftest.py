@@ -0,0 +1,46 @@
+# Copyright (c) 2026 Jeroen Visser. All rights reserved.
+# Licensed under the terms in COMMERCIAL-LICENSE.md.
+# Free for personal, educational, and academic use.
+# Commercial use requires a paid license — see COMMERCIAL-LICENSE.md.
+"""Shared pytest fixtures."""
+from __future__ import annotations
+
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def humeris_mirror_out() -> dict[str, dict[str, float]]:
+    """GMAT mirror scenario output, propagated once per session.
+
+    run_humeris_mirror() is deterministic and is the most expensive call in
+    the GMAT parity suites; tests must treat the returned dict as read-only.
+    """
+    from humeris.adapters.gmat_mirror import run_humeris_mirror
+
+    return run_humeris_mirror()
+
+
+@pytest.fixture(scope="session")
+def leo_to_geo_hohmann():
+    """Hohmann transfer plan from a 300 km LEO to GEO altitude."""
+    from humeris.domain.maneuvers import hohmann_transfer
+    from humeris.domain.orbital_mechanics import OrbitalConstants
+
+    return hohmann_transfer(
+        OrbitalConstants.R_EARTH + 300_000.0,
+        OrbitalConstants.R_EARTH + 35_786_000.0,
+    )
+
+
+@pytest.fixture(scope="session")
+def subprocess_env(tmp_path_factory) -> dict[str, str]:
+    """Environment for child interpreters sharing one writable bytecode cache.
+
+    Keeps an existing PYTHONPYCACHEPREFIX; otherwise points every spawned
+    interpreter at the same session directory so only the first compiles.
+    """
+    env = dict(os.environ)
+    env.setdefault("PYTHONPYCACHEPREFIX", str(tmp_path_factory.mktemp("pyc")))
+    return env
@@ -522,6 +522,39 @@ class TestMaxSteps:
         # Should have stopped early
         assert result.total_steps <= 50
 
+    def test_max_rejected_steps_limit(self, leo_state, epoch):
+        """A step size the controller can never accept must not loop forever."""
+        # h_min == h_max pins every trial step at 3000 s, which the
+        # tolerance rejects each time.
+        config = AdaptiveStepConfig(
+            h_init=3000.0, h_min=3000.0, h_max=3000.0, max_rejected_steps=25,
+        )
+        with pytest.raises(ValueError, match="25 rejected steps"):
+            propagate_adaptive(
+                initial_state=leo_state,
+                duration=timedelta(days=1),
+                force_models=[TwoBodyGravity()],
+                epoch=epoch,
+                config=config,
+            )
+
+    def test_max_rejected_steps_limit_rk89(self, leo_state, epoch):
+        """The RK8(9) integrator reports a stall instead of truncating."""
+        from humeris.domain.adaptive_integration import propagate_rk89_adaptive
+
+        config = AdaptiveStepConfig(
+            h_init=3000.0, h_min=3000.0, h_max=3000.0, max_rejected_steps=25,
+        )
+        with pytest.raises(ValueError, match="max_rejected_steps=25"):
+            propagate_rk89_adaptive(
+                initial_state=leo_state,
+                duration=timedelta(days=1),
+                force_models=[TwoBodyGravity()],
+                epoch=epoch,
+                config=config,
+                output_step_s=60.0,
+            )
+
 
 # --- Backward propagation ---
 
@@ -664,6 +697,7 @@ class TestConfigDefaults:
         assert config.h_max == 600.0
         assert config.safety_factor == 0.9
         assert config.max_steps == 1_000_000
+        assert config.max_rejected_steps == 100_000
 
     def test_config_is_frozen(self):
         config = AdaptiveStepConfig()
@@ -776,6 +810,28 @@ class TestPropagateNumericalIntegration:
         )
         assert isinstance(result, NumericalPropagationResult)
 
+    def test_adaptive_config_is_forwarded(self, leo_state, epoch):
+        """adaptive_config reaches the DP integrator."""
+        # The default config integrates this hour cleanly; the pinned
+        # oversized step can only fail if the custom config is used.
+        kwargs = dict(
+            initial_state=leo_state,
+            duration=timedelta(seconds=3600),
+            step=timedelta(seconds=60),
+            force_models=[TwoBodyGravity()],
+            epoch=epoch,
+            integrator="dormand_prince",
+        )
+        assert len(propagate_numerical(**kwargs).steps) == 61
+        with pytest.raises(ValueError, match="max_rejected_steps=3"):
+            propagate_numerical(
+                **kwargs,
+                adaptive_config=AdaptiveStepConfig(
+                    h_init=3000.0, h_min=3000.0, h_max=3000.0,
+                    max_rejected_steps=3,
+                ),
+            )
+
     def test_unknown_integrator_still_errors(self, leo_state, epoch):
         """Invalid integrator name should still raise ValueError."""
         with pytest.raises(ValueError, match="Unknown integrator"):
@@ -6,6 +6,7 @@
 import ast
 import math
 
+import numpy as np
 import pytest
 
 from humeris.domain.orbital_mechanics import OrbitalConstants
@@ -101,6 +102,30 @@ class TestAtmosphericDensity:
             atmospheric_density(2001.0)
 
 
+class TestAtmosphericDensityBatch:
+
+    @pytest.mark.parametrize("model", list(AtmosphereModel))
+    def test_matches_scalar(self, model):
+        """Batch density equals the scalar lookup, including bracket edges."""
+        from humeris.domain.atmosphere import (
+            atmospheric_density,
+            atmospheric_density_batch,
+        )
+
+        top = 2000.0 if model is AtmosphereModel.HIGH_ACTIVITY else 1000.0
+        alts = np.array([100.0, 149.9, 150.0, 412.3, 700.0, top])
+        batch = atmospheric_density_batch(alts, model=model)
+        for h, rho in zip(alts, batch):
+            assert rho == atmospheric_density(float(h), model=model)
+
+    def test_out_of_range_raises(self):
+        """Any altitude outside the table raises ValueError."""
+        from humeris.domain.atmosphere import atmospheric_density_batch
+
+        with pytest.raises(ValueError):
+            atmospheric_density_batch(np.array([400.0, 2001.0]))
+
+
 # ── Atmosphere model configurability ───────────────────────────────
 
 class TestAtmosphereModel:
@@ -3,16 +3,20 @@
 """D-P0-02: CCSDS OMM/OEM interoperability and provenance contracts."""
 from __future__ import annotations
 
+from types import MappingProxyType
+
 import pytest
 
 from humeris.domain.ccsds_contracts import (
+    CcsdsEnvelope,
     CcsdsValidationError,
     envelope_from_record,
     roundtrip_envelope,
+    verify_envelope,
 )
 
 
-_OMM = {
+_OMM = MappingProxyType({
     "OBJECT_NAME": "ISS (ZARYA)",
     "OBJECT_ID": "1998-067A",
     "NORAD_CAT_ID": 25544,
@@ -23,9 +27,9 @@ _OMM = {
     "RA_OF_ASC_NODE": 120.0,
     "ARG_OF_PERICENTER": 85.0,
     "MEAN_ANOMALY": 10.0,
-}
+})
 
-_OEM = {
+_OEM = MappingProxyType({
     "OBJECT_NAME": "ISS (ZARYA)",
     "OBJECT_ID": "1998-067A",
     "CENTER_NAME": "EARTH",
@@ -38,22 +42,91 @@ _OEM = {
     "X_DOT": [0.1, 0.2],
     "Y_DOT": [0.3, 0.4],
     "Z_DOT": [0.5, 0.6],
-}
+})
+
+
+@pytest.fixture(scope="module", params=["sha256", "blake2b"])
+def omm_envelope(request):
+    return envelope_from_record(
+        "OMM", _OMM, source_timestamp="2026-02-16T00:00:00Z",
+        hash_algorithm=request.param,
+    )
+
+
+@pytest.fixture(scope="module", params=["sha256", "blake2b"])
+def oem_envelope(request):
+    return envelope_from_record("OEM", _OEM, hash_algorithm=request.param)
 
 
-def test_omm_roundtrip_preserves_semantics_and_provenance():
-    env = envelope_from_record("OMM", _OMM, source_timestamp="2026-02-16T00:00:00Z")
+def test_omm_roundtrip_preserves_semantics_and_provenance(omm_envelope):
+    env = omm_envelope
     out = roundtrip_envelope(env)
     assert out.payload["OBJECT_ID"] == _OMM["OBJECT_ID"]
     assert out.source_timestamp == "2026-02-16T00:00:00Z"
     assert out.provenance_hash == env.provenance_hash
+    assert out.hash_algorithm == env.hash_algorithm
 
 
-def test_oem_roundtrip_preserves_semantics_and_provenance():
-    env = envelope_from_record("OEM", _OEM)
+def test_oem_roundtrip_preserves_semantics_and_provenance(oem_envelope):
+    env = oem_envelope
     out = roundtrip_envelope(env)
     assert out.payload["REF_FRAME"] == "EME2000"
     assert out.provenance_hash == env.provenance_hash
+    assert out.hash_algorithm == env.hash_algorithm
+
+
+def test_roundtrip_is_idempotent_and_rejects_stale_hash(oem_envelope):
+    out = oem_envelope
+    for _ in range(3):
+        out = roundtrip_envelope(out)
+    assert out.payload == dict(_OEM)
+    assert out.provenance_hash == oem_envelope.provenance_hash
+
+    stale = CcsdsEnvelope(
+        message_type=out.message_type,
+        payload={**out.payload, "X": [1.0, 2.5]},
+        source_timestamp=out.source_timestamp,
+        provenance_hash=out.provenance_hash,
+        hash_algorithm=out.hash_algorithm,
+    )
+    with pytest.raises(CcsdsValidationError, match="mismatch after transform"):
+        roundtrip_envelope(stale)
+
+
+def test_roundtrip_rejects_payload_changed_by_json_key_coercion():
+    """Non-str keys become strings and re-sort, so the first round-trip fails."""
+    env = envelope_from_record("OMM", {**_OMM, "X": {2: "a", 10: "b"}})
+    with pytest.raises(CcsdsValidationError, match="mismatch after transform"):
+        roundtrip_envelope(env)
+
+
+def test_hash_algorithm_selects_distinct_digest():
+    sha = envelope_from_record("OMM", _OMM, source_timestamp="2026-02-16T00:00:00Z")
+    b2 = envelope_from_record(
+        "OMM", _OMM, source_timestamp="2026-02-16T00:00:00Z", hash_algorithm="blake2b",
+    )
+    assert sha.hash_algorithm == "sha256"
+    assert len(b2.provenance_hash) == len(sha.provenance_hash) == 64
+    assert b2.provenance_hash != sha.provenance_hash
+
+
+def test_unknown_hash_algorithm_fails_loudly():
+    with pytest.raises(CcsdsValidationError, match="Unsupported hash algorithm"):
+        envelope_from_record("OMM", _OMM, hash_algorithm="md5")
+
+
+def test_verify_envelope_checks_provenance(omm_envelope):
+    assert verify_envelope(omm_envelope) is omm_envelope
+
+    tampered = CcsdsEnvelope(
+        message_type=omm_envelope.message_type,
+        payload={**omm_envelope.payload, "MEAN_MOTION": 15.6},
+        source_timestamp=omm_envelope.source_timestamp,
+        provenance_hash=omm_envelope.provenance_hash,
+        hash_algorithm=omm_envelope.hash_algorithm,
+    )
+    with pytest.raises(CcsdsValidationError, match="provenance hash mismatch"):
+        verify_envelope(tampered)
 
 
 def test_malformed_near_valid_record_fails_loudly():
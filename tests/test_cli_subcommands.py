@@ -1,90 +1,86 @@
 # Copyright (c) 2026 Jeroen Visser. All rights reserved.
 # Licensed under the MIT License — see LICENSE.
 """Tests for CLI subcommand structure and backward compatibility."""
+import functools
 import subprocess
 import sys
 import unittest
 
 
+@functools.lru_cache(maxsize=None)
+def _cli(*args: str) -> subprocess.CompletedProcess:
+    """Run ``python -m humeris.cli ARGS`` once per unique argv.
+
+    Only for argv whose output is deterministic and has no side effects.
+    """
+    return subprocess.run(
+        [sys.executable, "-m", "humeris.cli", *args],
+        capture_output=True, text=True, timeout=10,
+    )
+
+
 class TestCliVersion(unittest.TestCase):
     """humeris --version prints version and exits."""
 
     def test_version_flag(self):
-        result = subprocess.run(
-            [sys.executable, "-m", "humeris.cli", "--version"],
-            capture_output=True, text=True, timeout=10,
-        )
+        result = _cli("--version")
         self.assertEqual(result.returncode, 0)
         self.assertIn("humeris-core", result.stdout)
 
     def test_version_is_semver(self):
-        result = subprocess.run(
-            [sys.executable, "-m", "humeris.cli", "--version"],
-            capture_output=True, text=True, timeout=10,
-        )
+        result = _cli("--version")
         version_str = result.stdout.strip().split()[-1]
         parts = version_str.split(".")
         self.assertGreaterEqual(len(parts), 2)
 
 
 class TestCliSubcommandHelp(unittest.TestCase):
-    """Each subcommand has --help."""
+    """Each subcommand exposes its options on the in-process parser."""
+
+    @classmethod
+    def setUpClass(cls):
+        from humeris.cli import build_parser
+        cls.parser = build_parser()
+
+    def _options(self, *path):
+        from humeris.cli import _get_subparser
+        sub = _get_subparser(self.parser, *path)
+        return {opt for action in sub._actions for opt in action.option_strings}
 
     def test_serve_help(self):
-        result = subprocess.run(
-            [sys.executable, "-m", "humeris.cli", "serve", "--help"],
-            capture_output=True, text=True, timeout=10,
-        )
-        self.assertEqual(result.returncode, 0)
-        self.assertIn("--port", result.stdout)
-        self.assertIn("--load-session", result.stdout)
-        self.assertIn("--headless", result.stdout)
+        opts = self._options("serve")
+        self.assertIn("--port", opts)
+        self.assertIn("--load-session", opts)
+        self.assertIn("--headless", opts)
 
     def test_generate_help(self):
-        result = subprocess.run(
-            [sys.executable, "-m", "humeris.cli", "generate", "--help"],
-            capture_output=True, text=True, timeout=10,
-        )
-        self.assertEqual(result.returncode, 0)
-        self.assertIn("--input", result.stdout)
-        self.assertIn("--output", result.stdout)
-        self.assertIn("--export-csv", result.stdout)
-        self.assertIn("--live-group", result.stdout)
+        opts = self._options("generate")
+        self.assertIn("--input", opts)
+        self.assertIn("--output", opts)
+        self.assertIn("--export-csv", opts)
+        self.assertIn("--live-group", opts)
 
     def test_import_help(self):
-        result = subprocess.run(
-            [sys.executable, "-m", "humeris.cli", "import", "--help"],
-            capture_output=True, text=True, timeout=10,
-        )
-        self.assertEqual(result.returncode, 0)
-        self.assertIn("opm", result.stdout)
-        self.assertIn("oem", result.stdout)
+        from humeris.cli import _get_subparser
+        help_text = _get_subparser(self.parser, "import").format_help()
+        self.assertIn("opm", help_text)
+        self.assertIn("oem", help_text)
 
     def test_import_opm_help(self):
-        result = subprocess.run(
-            [sys.executable, "-m", "humeris.cli", "import", "opm", "--help"],
-            capture_output=True, text=True, timeout=10,
-        )
-        self.assertEqual(result.returncode, 0)
-        self.assertIn("file", result.stdout)
+        from humeris.cli import _get_subparser
+        opm_parser = _get_subparser(self.parser, "import", "opm")
+        dests = {action.dest for action in opm_parser._actions}
+        self.assertIn("file", dests)
 
     def test_sweep_help(self):
-        result = subprocess.run(
-            [sys.executable, "-m", "humeris.cli", "sweep", "--help"],
-            capture_output=True, text=True, timeout=10,
-        )
-        self.assertEqual(result.returncode, 0)
-        self.assertIn("--param", result.stdout)
-        self.assertIn("--metric", result.stdout)
+        opts = self._options("sweep")
+        self.assertIn("--param", opts)
+        self.assertIn("--metric", opts)
 
     def test_root_help_shows_subcommands(self):
-        result = subprocess.run(
-            [sys.executable, "-m", "humeris.cli", "--help"],
-            capture_output=True, text=True, timeout=10,
-        )
-        self.assertEqual(result.returncode, 0)
+        help_text = self.parser.format_help()
         for cmd in ("serve", "generate", "import", "sweep"):
-            self.assertIn(cmd, result.stdout)
+            self.assertIn(cmd, help_text)
 
 
 class TestCliLegacyDeprecation(unittest.TestCase):
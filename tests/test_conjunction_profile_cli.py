@@ -5,48 +5,49 @@
 """CLI selection coverage for conjunction profile packs."""
 from __future__ import annotations
 
+import importlib.util
 import json
-import subprocess
-import sys
+from pathlib import Path
 
+import pytest
 
-def test_cli_profile_selection_outputs_probability_band():
-    proc = subprocess.run(
-        [
-            sys.executable,
-            "scripts/conjunction_profile_eval.py",
-            "--profile",
-            "nominal",
-            "--miss-distance-m",
-            "9000",
-            "--base-pc",
-            "2e-5",
-        ],
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    out = json.loads(proc.stdout)
+
+def _load_profile_eval_script_module():
+    script_path = Path("scripts/conjunction_profile_eval.py").resolve()
+    spec = importlib.util.spec_from_file_location("conjunction_profile_eval", script_path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_cli_profile_selection_outputs_probability_band(capsys):
+    module = _load_profile_eval_script_module()
+    rc = module.main([
+        "--profile",
+        "nominal",
+        "--miss-distance-m",
+        "9000",
+        "--base-pc",
+        "2e-5",
+    ])
+    assert rc == 0
+    out = json.loads(capsys.readouterr().out)
     assert out["profile"]["id"] == "nominal"
     band = out["output"]["collision_probability_band"]
     assert set(band.keys()) == {"lower", "nominal", "upper"}
 
 
-def test_cli_rejects_invalid_profile_value():
-    proc = subprocess.run(
-        [
-            sys.executable,
-            "scripts/conjunction_profile_eval.py",
+def test_cli_rejects_invalid_profile_value(capsys):
+    module = _load_profile_eval_script_module()
+    with pytest.raises(SystemExit) as exc_info:
+        module.main([
             "--profile",
             "invalid",
             "--miss-distance-m",
             "9000",
             "--base-pc",
             "2e-5",
-        ],
-        check=False,
-        capture_output=True,
-        text=True,
-    )
-    assert proc.returncode != 0
-    assert "invalid choice" in proc.stderr
+        ])
+    assert exc_info.value.code != 0
+    assert "invalid choice" in capsys.readouterr().err
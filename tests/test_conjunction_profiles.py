@@ -5,8 +5,12 @@
 """D-P0-03: Profile-driven conjunction screening behavior."""
 from __future__ import annotations
 
+import numpy as np
+import pytest
+
 from humeris.domain.conjunction_profiles import (
     evaluate_profiled_screening,
+    evaluate_profiled_screening_batch,
     get_screening_profile,
 )
 
@@ -26,3 +30,21 @@ def test_profile_output_includes_probability_band():
     band = out["output"]["collision_probability_band"]
     assert set(band.keys()) == {"lower", "nominal", "upper"}
     assert band["lower"] <= band["nominal"] <= band["upper"]
+
+
+@pytest.mark.parametrize("profile_name", ["conservative", "nominal", "aggressive"])
+def test_batch_flags_match_scalar_evaluation(profile_name):
+    miss = np.array([5000.0, 8000.0, 12000.0, 15000.0, 20000.0, 30000.0])
+    pc = np.array([1e-7, 1.5e-5, 9e-5, 5e-5, 2e-4, 1e-9])
+    flags = evaluate_profiled_screening_batch(miss, pc, profile_name)
+    expected = [
+        evaluate_profiled_screening(m, p, profile_name)["output"]["flagged"]
+        for m, p in zip(miss.tolist(), pc.tolist())
+    ]
+    assert flags.dtype == bool
+    assert flags.tolist() == expected
+
+
+def test_batch_rejects_unknown_profile():
+    with pytest.raises(ValueError, match="Unknown screening profile"):
+        evaluate_profiled_screening_batch(np.array([1.0]), np.array([0.0]), "bogus")
@@ -2,15 +2,18 @@
 # Licensed under the MIT License — see LICENSE.
 """Tests for coordinate frame conversions (ECI→ECEF→Geodetic)."""
 import math
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pytest
 
 from humeris.domain.orbital_mechanics import OrbitalConstants
 from humeris.domain.coordinate_frames import (
     gmst_rad,
+    gmst_rad_batch,
     eci_to_ecef,
     ecef_to_geodetic,
+    ecef_to_geodetic_batch,
     geodetic_to_ecef,
 )
 from humeris.domain.constellation import Satellite
@@ -205,6 +208,36 @@ class TestECEFtoGeodetic:
             assert -180.0 < lon <= 180.0
 
 
+# ── Batched GMST / ECEF → Geodetic ────────────────────────────────
+
+class TestBatchConversions:
+
+    def test_gmst_batch_matches_scalar(self):
+        """gmst_rad_batch agrees with gmst_rad at each offset."""
+        epoch = datetime(2026, 3, 20, 12, 0, 0, tzinfo=timezone.utc)
+        offsets = np.array([0.0, 60.0, 3600.0, 43200.0, 86400.0])
+        thetas = gmst_rad_batch(epoch, offsets)
+        for offset, theta in zip(offsets, thetas):
+            expected = gmst_rad(epoch + timedelta(seconds=float(offset)))
+            assert theta == pytest.approx(expected, abs=1e-9)
+
+    def test_geodetic_batch_matches_scalar(self):
+        """Closed-form ecef_to_geodetic_batch agrees with the iterative scalar path."""
+        points = np.array([
+            (6_378_137.0, 0.0, 0.0),
+            (0.0, 0.0, 6_356_752.3142),
+            (0.0, 0.0, -6_356_752.3142),
+            (4_000_000.0, 3_000_000.0, 4_500_000.0),
+            (-5_000_000.0, -2_000_000.0, -3_000_000.0),
+        ])
+        lats, lons, alts = ecef_to_geodetic_batch(points)
+        for row, lat, lon, alt in zip(points, lats, lons, alts):
+            lat_s, lon_s, alt_s = ecef_to_geodetic(tuple(row))
+            assert lat == pytest.approx(lat_s, abs=1e-9)
+            assert lon == pytest.approx(lon_s, abs=1e-9)
+            assert alt == pytest.approx(alt_s, abs=1e-3)
+
+
 # ── Geodetic → ECEF ──────────────────────────────────────────────
 
 class TestGeodeticToECEF:
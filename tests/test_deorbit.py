@@ -7,6 +7,7 @@ import ast
 import math
 from datetime import datetime, timezone
 
+import numpy as np
 import pytest
 
 from humeris.domain.atmosphere import DragConfig
@@ -14,7 +15,9 @@ from humeris.domain.orbital_mechanics import OrbitalConstants
 from humeris.domain.deorbit import (
     DeorbitAssessment,
     DeorbitRegulation,
+    DeorbitBatchAssessment,
     assess_deorbit_compliance,
+    assess_deorbit_compliance_batch,
 )
 
 
@@ -129,6 +132,57 @@ class TestAssessDeorbitCompliance:
             assert result_800.deorbit_delta_v_ms > result_600.deorbit_delta_v_ms
 
 
+class TestAssessDeorbitComplianceBatch:
+
+    def test_matches_scalar(self):
+        """Each batch entry equals the scalar assessment at that altitude."""
+        alts = [300.0, 550.0, 800.0]
+        batch = assess_deorbit_compliance_batch(
+            np.array(alts), TYPICAL_DRAG, EPOCH, isp_s=300.0, dry_mass_kg=250.0,
+        )
+        assert isinstance(batch, DeorbitBatchAssessment)
+        for i, h in enumerate(alts):
+            scalar = assess_deorbit_compliance(
+                h, TYPICAL_DRAG, EPOCH, isp_s=300.0, dry_mass_kg=250.0,
+            )
+            assert batch.compliant[i] == scalar.compliant
+            assert batch.natural_lifetime_days[i] == scalar.natural_lifetime_days
+            assert batch.deorbit_delta_v_ms[i] == scalar.deorbit_delta_v_ms
+            if scalar.maneuver_required:
+                assert batch.target_perigee_km[i] == scalar.target_perigee_km
+                assert batch.propellant_mass_kg[i] == scalar.propellant_mass_kg
+            else:
+                assert math.isnan(batch.target_perigee_km[i])
+
+    def test_matches_scalar_with_step_aligned_threshold(self, monkeypatch):
+        """A threshold on the lifetime step grid must not read as re-entry."""
+        import humeris.domain.deorbit as deorbit
+
+        monkeypatch.setitem(
+            deorbit._REGULATION_THRESHOLDS, DeorbitRegulation.FCC_5YEAR, 1826.0,
+        )
+        alts = [550.0, 800.0]
+        batch = assess_deorbit_compliance_batch(np.array(alts), TYPICAL_DRAG, EPOCH)
+        for i, h in enumerate(alts):
+            scalar = assess_deorbit_compliance(h, TYPICAL_DRAG, EPOCH)
+            assert batch.compliant[i] == scalar.compliant
+            if scalar.maneuver_required:
+                assert batch.target_perigee_km[i] == scalar.target_perigee_km
+
+    def test_identity_equality_and_hashable(self):
+        """Array fields: == is identity, and the result is hashable."""
+        batch = assess_deorbit_compliance_batch(np.array([300.0]), TYPICAL_DRAG, EPOCH)
+        other = assess_deorbit_compliance_batch(np.array([300.0]), TYPICAL_DRAG, EPOCH)
+        assert batch == batch
+        assert batch != other
+        assert isinstance(hash(batch), int)
+
+    def test_propellant_none_when_not_provided(self):
+        """Propellant array is None when isp/mass not provided."""
+        batch = assess_deorbit_compliance_batch(np.array([800.0]), TYPICAL_DRAG, EPOCH)
+        assert batch.propellant_mass_kg is None
+
+
 # ── Domain purity ─────────────────────────────────────────────────
 
 class TestDeorbitPurity:
@@ -5,21 +5,23 @@
 """Expanded GMAT-vs-Humeris comparative validation matrix."""
 from __future__ import annotations
 
+import functools
 import json
 import math
 from datetime import datetime, timedelta, timezone
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
+import numpy as np
 import pytest
 
 from humeris.adapters.celestrak import SGP4Adapter
-from humeris.adapters.gmat_mirror import run_humeris_mirror
 from humeris.domain.atmosphere import DragConfig
 from humeris.domain.ccsds_contracts import envelope_from_record, roundtrip_envelope
 from humeris.domain.compliance_profiles import evaluate_compliance_profile
-from humeris.domain.conjunction_profiles import evaluate_profiled_screening
-from humeris.domain.deorbit import DeorbitRegulation, assess_deorbit_compliance
-from humeris.domain.maneuvers import hohmann_transfer
+from humeris.domain.conjunction_profiles import evaluate_profiled_screening_batch
+from humeris.domain.deorbit import DeorbitRegulation, assess_deorbit_compliance_batch
 from humeris.domain.numerical_propagation import TwoBodyGravity, propagate_numerical
 from humeris.domain.orbital_mechanics import OrbitalConstants
 from humeris.domain.orbit_properties import state_vector_to_elements
@@ -27,28 +29,34 @@ from humeris.domain.propagation import OrbitalState
 
 
 _GMAT_REPO = Path("/home/jeroen/gmat")
+requires_gmat_repo = pytest.mark.skipif(
+    not _GMAT_REPO.exists(), reason="Local GMAT repo not available",
+)
 
 
-def _parse_keplerian_report(path: Path) -> list[dict[str, float]]:
-    lines = [ln.strip() for ln in path.read_text(encoding="utf-8").splitlines() if ln.strip()]
-    rows: list[dict[str, float]] = []
-    for ln in lines[1:]:
-        parts = ln.split()
-        vals = list(map(float, parts[4:]))
-        rows.append(
-            {
-                "sma_km": vals[0],
-                "ecc": vals[1],
-                "inc_deg": vals[2],
-                "raan_deg": vals[3],
-                "aop_deg": vals[4],
-                "ta_deg": vals[5],
-            }
-        )
-    return rows
-
-
-@pytest.mark.skipif(not _GMAT_REPO.exists(), reason="Local GMAT repo not available")
+_KEPLERIAN_REPORT_KEYS = ("sma_km", "ecc", "inc_deg", "raan_deg", "aop_deg", "ta_deg")
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_keplerian_report(path: Path) -> tuple[Mapping[str, float], ...]:
+    # Columns 0-3 are the epoch tokens; the six Keplerian elements follow.
+    # loadtxt streams the file through its C tokenizer in chunks, so no
+    # per-line str list is built and peak memory tracks the float array.
+    # The result is cached and shared, so rows are read-only views.
+    arr = np.loadtxt(path, skiprows=1, usecols=(4, 5, 6, 7, 8, 9), ndmin=2)
+    return tuple(
+        MappingProxyType(dict(zip(_KEPLERIAN_REPORT_KEYS, row)))
+        for row in arr.tolist()
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_manifest(path: Path) -> dict:
+    # json.loads detects UTF-8 in bytes, so skip the intermediate str.
+    return json.loads(path.read_bytes())
+
+
+@requires_gmat_repo
 def test_timeseries_parity_against_gmat_oem_reference():
     """Time-series endpoint parity against GMAT OEM propagation reference."""
     p = _GMAT_REPO / "docs/test-runs/run-0008-3b5fc7b-clean/cases/headless_oem_ephemeris_propagation/KeplerianElements.txt"
@@ -84,10 +92,10 @@ def test_timeseries_parity_against_gmat_oem_reference():
     assert abs(end["inclination_deg"] - end_gmat["inc_deg"]) < 0.02
 
 
-@pytest.mark.skipif(not _GMAT_REPO.exists(), reason="Local GMAT repo not available")
-def test_force_model_matrix_parity_floor_cases():
+@requires_gmat_repo
+def test_force_model_matrix_parity_floor_cases(humeris_mirror_out):
     """Comparative force-model matrix floor via mirrored GMAT scenario classes."""
-    out = run_humeris_mirror()
+    out = humeris_mirror_out
     assert set(out.keys()) >= {
         "basic_leo_two_body",
         "advanced_j2_raan_drift",
@@ -106,20 +114,17 @@ def test_force_model_matrix_parity_floor_cases():
     assert "SolarThirdBodyForce" in sun["forceModels"]
 
 
-@pytest.mark.skipif(not _GMAT_REPO.exists(), reason="Local GMAT repo not available")
-def test_maneuver_parity_sample_completion_and_humeris_dv_range():
+@requires_gmat_repo
+def test_maneuver_parity_sample_completion_and_humeris_dv_range(leo_to_geo_hohmann):
     """Maneuver cross-check: GMAT sample completion + Humeris transfer math sanity."""
     stdout_path = _GMAT_REPO / "docs/test-runs/run-0008-3b5fc7b-clean/cases/sample_hohmann_transfer/stdout.txt"
     text = stdout_path.read_text(encoding="utf-8")
     assert "Mission run completed" in text
 
-    r1 = OrbitalConstants.R_EARTH + 300_000.0
-    r2 = OrbitalConstants.R_EARTH + 35_786_000.0
-    plan = hohmann_transfer(r1, r2)
-    assert 3500.0 < plan.total_delta_v_ms < 4500.0
+    assert 3500.0 < leo_to_geo_hohmann.total_delta_v_ms < 4500.0
 
 
-@pytest.mark.skipif(not _GMAT_REPO.exists(), reason="Local GMAT repo not available")
+@requires_gmat_repo
 def test_conjunction_backtesting_profile_calibration_proxy():
     """Proxy backtest on historical-like conjunction tuples."""
     historical = [
@@ -127,25 +132,24 @@ def test_conjunction_backtesting_profile_calibration_proxy():
         {"miss": 25000.0, "base_pc": 1.0e-7, "observed_flag": False},
         {"miss": 12000.0, "base_pc": 9.0e-5, "observed_flag": True},
     ]
-    errors = []
-    for row in historical:
-        pred = evaluate_profiled_screening(row["miss"], row["base_pc"], "nominal")
-        predicted = bool(pred["output"]["flagged"])
-        errors.append(1.0 if predicted != row["observed_flag"] else 0.0)
-    assert sum(errors) / len(errors) <= 0.34
+    miss = np.array([r["miss"] for r in historical])
+    pc = np.array([r["base_pc"] for r in historical])
+    observed = np.array([r["observed_flag"] for r in historical])
+    predicted = evaluate_profiled_screening_batch(miss, pc, "nominal")
+    assert float((predicted != observed).mean()) <= 0.34
 
 
-@pytest.mark.skipif(not _GMAT_REPO.exists(), reason="Local GMAT repo not available")
+@requires_gmat_repo
 def test_deorbit_backtesting_against_reference_windows_proxy():
     """Proxy deorbit backtesting using known altitude lifetime expectations."""
     drag = DragConfig(cd=2.2, area_m2=0.3, mass_kg=200.0)
     epoch = datetime(2026, 2, 16, tzinfo=timezone.utc)
 
-    low = assess_deorbit_compliance(450.0, drag, epoch, regulation=DeorbitRegulation.FCC_5YEAR)
-    high = assess_deorbit_compliance(900.0, drag, epoch, regulation=DeorbitRegulation.FCC_5YEAR)
+    alts = np.array([450.0, 900.0])
+    res = assess_deorbit_compliance_batch(alts, drag, epoch, DeorbitRegulation.FCC_5YEAR)
 
-    assert low.natural_lifetime_days < high.natural_lifetime_days
-    assert low.natural_lifetime_days > 0.0
+    assert res.natural_lifetime_days[0] < res.natural_lifetime_days[1]
+    assert res.natural_lifetime_days[0] > 0.0
 
 
 def test_ephemeris_roundtrip_covariance_provenance_contract_cycles():
@@ -169,8 +173,8 @@ def test_ephemeris_roundtrip_covariance_provenance_contract_cycles():
     assert env.provenance_hash == p0
 
 
-@pytest.mark.skipif(not _GMAT_REPO.exists(), reason="Local GMAT repo not available")
-def test_cross_propagator_sanity_against_gmat_and_sgp4():
+@requires_gmat_repo
+def test_cross_propagator_sanity_against_gmat_and_sgp4(humeris_mirror_out):
     """Cross-propagator sanity (GMAT class + SGP4 + Humeris)."""
     sample = {
         "OBJECT_NAME": "ISS (ZARYA)",
@@ -192,9 +196,9 @@ def test_cross_propagator_sanity_against_gmat_and_sgp4():
         "MEAN_MOTION_DDOT": 0,
     }
     sat = SGP4Adapter().omm_to_satellite(sample)
-    r_km = math.sqrt(sum(p**2 for p in sat.position_eci)) / 1000.0
+    r_km = float(np.linalg.norm(sat.position_eci)) / 1000.0
 
-    gm = run_humeris_mirror()["basic_leo_two_body"]
+    gm = humeris_mirror_out["basic_leo_two_body"]
     assert abs(r_km - gm["startRMAG"]) < 1200.0
 
 
@@ -210,11 +214,11 @@ def test_compliance_profile_trace_contains_rule_ids_and_remediation():
     assert isinstance(out["remediation_options"], list)
 
 
-@pytest.mark.skipif(not _GMAT_REPO.exists(), reason="Local GMAT repo not available")
+@requires_gmat_repo
 def test_comparative_artifact_linkage_between_suites():
     """Ensure comparative artifacts can be linked across both repositories."""
     gm_manifest = _GMAT_REPO / "docs/test-runs/run-0008-3b5fc7b-clean/manifest.json"
     hum_latest = Path("docs/gmat-parity-runs/LATEST")
     assert gm_manifest.exists()
     assert hum_latest.exists()
-    _ = json.loads(gm_manifest.read_text(encoding="utf-8"))
+    _ = _load_manifest(gm_manifest)
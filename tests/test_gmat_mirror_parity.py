@@ -14,12 +14,11 @@ from humeris.adapters.gmat_mirror import (
     compare_against_gmat,
     find_gmat_run_dir,
     load_gmat_case_values,
-    run_humeris_mirror,
 )
 
 
-def test_humeris_mirror_runs_and_is_physically_consistent():
-    out = run_humeris_mirror()
+def test_humeris_mirror_runs_and_is_physically_consistent(humeris_mirror_out):
+    out = humeris_mirror_out
 
     basic = out["basic_leo_two_body"]
     assert abs(basic["elapsedSecs"] - 5400.0) < 1e-9
@@ -39,7 +38,7 @@ def test_humeris_mirror_runs_and_is_physically_consistent():
     assert abs(ou["endRMAG"] - ou["startRMAG"]) > 1000.0
 
 
-def test_compare_against_local_gmat_artifacts_if_available():
+def test_compare_against_local_gmat_artifacts_if_available(humeris_mirror_out):
     gmat_repo = Path("/home/jeroen/gmat")
     if not gmat_repo.exists():
         pytest.skip("Local GMAT testsuite repo not found at /home/jeroen/gmat")
@@ -50,7 +49,7 @@ def test_compare_against_local_gmat_artifacts_if_available():
         pytest.skip("No GMAT run artifacts found")
 
     gmat_values = load_gmat_case_values(run_dir)
-    humeris_values = run_humeris_mirror()
+    humeris_values = humeris_mirror_out
     comparison = compare_against_gmat(gmat_values, humeris_values)
 
     assert comparison["status"] in {"pass", "fail"}
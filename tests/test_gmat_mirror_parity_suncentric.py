@@ -5,12 +5,12 @@
 """RED/GREEN coverage for D-P0-01 Sun-centric parity extension."""
 from __future__ import annotations
 
+import functools
 import importlib.util
 from pathlib import Path
 
-from humeris.adapters.gmat_mirror import run_humeris_mirror
-
 
+@functools.lru_cache(maxsize=1)
 def _load_compare_script_module():
     script_path = Path("scripts/run_gmat_mirror_compare.py").resolve()
     spec = importlib.util.spec_from_file_location("run_gmat_mirror_compare", script_path)
@@ -20,8 +20,38 @@ def _load_compare_script_module():
     return module
 
 
-def test_suncentric_case_emits_required_metrics():
-    out = run_humeris_mirror()
+_REPORT_PAYLOAD = {
+    "status": "pass",
+    "timestamp_utc": "2026-02-16T23:00:00Z",
+    "constellation_repo": {"git": {"label": "x", "commit": "x", "dirty": "clean"}},
+    "gmat_repo": {
+        "git": {"label": "y", "commit": "y", "dirty": "clean"},
+        "repository_url": "https://example.invalid/gmat",
+        "run_id": "run-0000",
+    },
+    "comparison": {"cases": []},
+    "suncentric_extension": {
+        "assumption_differences": [
+            "Earth-mu mirror used for hyperbolic regime parity.",
+            "Dedicated Sun-centric force components remain approximated.",
+        ],
+        "residual_mismatch_budget": {
+            "ecc": "advisory",
+            "inc_deg": "advisory",
+            "rmag_km": "advisory",
+            "energy_sign": "bounded",
+        },
+        "delta_table": {
+            "ecc": 0.001,
+            "inc_deg": 0.01,
+            "rmag_km": 12.3,
+        },
+    },
+}
+
+
+def test_suncentric_case_emits_required_metrics(humeris_mirror_out):
+    out = humeris_mirror_out
     assert "advanced_oumuamua_suncentric" in out
 
     case = out["advanced_oumuamua_suncentric"]
@@ -57,36 +87,7 @@ def test_suncentric_case_emits_required_metrics():
 
 def test_report_includes_assumption_and_residual_sections():
     module = _load_compare_script_module()
-    payload = {
-        "status": "pass",
-        "timestamp_utc": "2026-02-16T23:00:00Z",
-        "constellation_repo": {"git": {"label": "x", "commit": "x", "dirty": "clean"}},
-        "gmat_repo": {
-            "git": {"label": "y", "commit": "y", "dirty": "clean"},
-            "repository_url": "https://example.invalid/gmat",
-            "run_id": "run-0000",
-        },
-        "comparison": {"cases": []},
-        "suncentric_extension": {
-            "assumption_differences": [
-                "Earth-mu mirror used for hyperbolic regime parity.",
-                "Dedicated Sun-centric force components remain approximated.",
-            ],
-            "residual_mismatch_budget": {
-                "ecc": "advisory",
-                "inc_deg": "advisory",
-                "rmag_km": "advisory",
-                "energy_sign": "bounded",
-            },
-            "delta_table": {
-                "ecc": 0.001,
-                "inc_deg": 0.01,
-                "rmag_km": 12.3,
-            },
-        },
-    }
-
-    report = module._build_report_markdown(payload)
+    report = module._build_report_markdown(_REPORT_PAYLOAD)
     assert "## Assumption Differences" in report
     assert "## Residual Mismatch Budget" in report
     assert "## Sun-centric Delta Table" in report
@@ -6,17 +6,21 @@ Tests for ground track computation.
 Verifies Keplerian propagation to geodetic coordinates for circular orbits.
 """
 import ast
+import functools
 import math
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pytest
 
 from humeris.domain.constellation import ShellConfig, generate_walker_shell
 from humeris.domain.ground_track import (
     AscendingNodePass,
     GroundTrackCrossing,
+    GROUND_TRACK_DTYPE,
     GroundTrackPoint,
     compute_ground_track,
+    compute_ground_track_batch,
     find_ascending_nodes,
     find_ground_track_crossings,
 )
@@ -44,7 +48,9 @@ class TestGroundTrackPoint:
         assert point.alt_km == 550.0
 
 
+@functools.lru_cache(maxsize=None)
 def _make_satellite(inclination_deg=53.0, altitude_km=500.0):
+    # Satellite is frozen, so one instance per parameter pair is shared.
     shell = ShellConfig(
         altitude_km=altitude_km, inclination_deg=inclination_deg,
         num_planes=1, sats_per_plane=1,
@@ -175,6 +181,109 @@ class TestGroundTrackEdgeCases:
         assert track[-1].time == start + timedelta(minutes=90)
 
 
+class TestGroundTrackMatchesPointwise:
+    """Array pipeline matches the per-point propagate_to chain."""
+
+    @pytest.mark.parametrize("include_j2", [False, True])
+    def test_matches_scalar_chain(self, include_j2):
+        from humeris.domain.coordinate_frames import (
+            ecef_to_geodetic,
+            eci_to_ecef,
+            gmst_rad,
+        )
+        from humeris.domain.propagation import derive_orbital_state, propagate_to
+
+        sat = _make_satellite(inclination_deg=97.4, altitude_km=550.0)
+        start = datetime(2026, 3, 20, 12, 0, 0, tzinfo=timezone.utc)
+        track = compute_ground_track(
+            sat, start, timedelta(hours=3), timedelta(seconds=37),
+            include_j2=include_j2,
+        )
+        state = derive_orbital_state(sat, start, include_j2=include_j2)
+        for point in track:
+            pos, vel = propagate_to(state, point.time)
+            pos_ecef, _ = eci_to_ecef(pos, vel, gmst_rad(point.time))
+            lat, lon, alt = ecef_to_geodetic(pos_ecef)
+            assert point.lat_deg == pytest.approx(lat, abs=1e-9)
+            assert point.lon_deg == pytest.approx(lon, abs=1e-9)
+            assert point.alt_km == pytest.approx(alt / 1000.0, abs=1e-6)
+
+
+class TestGroundTrackStructuredArray:
+    """return_array=True yields the same points in a structured array."""
+
+    def test_dtype_and_length(self):
+        sat = _make_satellite()
+        start = datetime(2026, 3, 20, 12, 0, 0, tzinfo=timezone.utc)
+        arr = compute_ground_track(
+            sat, start, timedelta(minutes=90), timedelta(minutes=1),
+            return_array=True,
+        )
+        assert arr.dtype == GROUND_TRACK_DTYPE
+        assert arr.dtype.itemsize == 32
+        assert arr.shape == (91,)
+
+    def test_matches_point_list(self):
+        sat = _make_satellite()
+        start = datetime(2026, 3, 20, 12, 0, 0, tzinfo=timezone.utc)
+        duration, step = timedelta(minutes=90), timedelta(seconds=45)
+        points = compute_ground_track(sat, start, duration, step)
+        arr = compute_ground_track(sat, start, duration, step, return_array=True)
+        assert len(arr) == len(points)
+        for point, row in zip(points, arr):
+            assert row['time'] == np.datetime64(point.time.replace(tzinfo=None), 'ns')
+            assert row['lat_deg'] == point.lat_deg
+            assert row['lon_deg'] == point.lon_deg
+            assert row['alt_km'] == point.alt_km
+
+
+class TestComputeGroundTrackBatch:
+    """Shell-wide batch path agrees with per-satellite ground tracks."""
+
+    def test_shape(self):
+        sats = generate_walker_shell(ShellConfig(
+            altitude_km=550.0, inclination_deg=53.0,
+            num_planes=3, sats_per_plane=4,
+            phase_factor=1, raan_offset_deg=0,
+            shell_name='Batch',
+        ))
+        start = datetime(2026, 3, 20, 12, 0, 0, tzinfo=timezone.utc)
+        tracks = compute_ground_track_batch(
+            sats, start, timedelta(minutes=90), timedelta(minutes=1),
+        )
+        assert tracks.shape == (12, 91, 3)
+
+    @pytest.mark.parametrize("include_j2", [False, True])
+    def test_matches_per_satellite(self, include_j2):
+        sats = generate_walker_shell(ShellConfig(
+            altitude_km=550.0, inclination_deg=53.0,
+            num_planes=3, sats_per_plane=4,
+            phase_factor=1, raan_offset_deg=0,
+            shell_name='Batch',
+        ))
+        start = datetime(2026, 3, 20, 12, 0, 0, tzinfo=timezone.utc)
+        duration, step = timedelta(hours=2), timedelta(minutes=2)
+        tracks = compute_ground_track_batch(
+            sats, start, duration, step, include_j2=include_j2,
+        )
+        for sat, row in zip(sats, tracks):
+            track = compute_ground_track(
+                sat, start, duration, step, include_j2=include_j2,
+            )
+            assert len(track) == row.shape[0]
+            for point, (lat, lon, alt_km) in zip(track, row):
+                assert point.lat_deg == pytest.approx(lat, abs=1e-9)
+                assert point.lon_deg == pytest.approx(lon, abs=1e-9)
+                assert point.alt_km == pytest.approx(alt_km, abs=1e-9)
+
+    def test_zero_step_raises(self):
+        start = datetime(2026, 3, 20, 12, 0, 0, tzinfo=timezone.utc)
+        with pytest.raises(ValueError):
+            compute_ground_track_batch(
+                [_make_satellite()], start, timedelta(minutes=90), timedelta(0),
+            )
+
+
 class TestComputeGroundTrackNumerical:
     """Tests for compute_ground_track_numerical."""
 
@@ -241,6 +350,23 @@ class TestComputeGroundTrackNumerical:
         assert len(result) == 1
         assert isinstance(result[0], GroundTrackPoint)
 
+    def test_matches_pointwise_pipeline(self, numerical_result):
+        """Batched conversion matches gmst_rad -> eci_to_ecef -> ecef_to_geodetic per step."""
+        from humeris.domain.coordinate_frames import (
+            gmst_rad, eci_to_ecef, ecef_to_geodetic,
+        )
+        from humeris.domain.ground_track import compute_ground_track_numerical
+
+        result = compute_ground_track_numerical(numerical_result.steps)
+        for pt, step in zip(result, numerical_result.steps):
+            pos_ecef, _ = eci_to_ecef(
+                step.position_eci, step.velocity_eci, gmst_rad(step.time),
+            )
+            lat, lon, alt_m = ecef_to_geodetic(pos_ecef)
+            assert pt.lat_deg == pytest.approx(lat, abs=1e-9)
+            assert pt.lon_deg == pytest.approx(lon, abs=1e-9)
+            assert pt.alt_km == pytest.approx(alt_m / 1000.0, abs=1e-6)
+
     def test_consistent_with_analytical(self, epoch):
         """Numerical ground track matches analytical within tolerance for two-body."""
         from humeris.domain.propagation import derive_orbital_state
@@ -385,26 +511,34 @@ class TestFindGroundTrackCrossings:
         assert crossings == []
 
 
+_ALLOWED_TOP = frozenset({'math', 'numpy', 'dataclasses', 'datetime'})
+_ALLOWED_INTERNAL_PREFIX = 'humeris.domain'
+
+
+@functools.lru_cache(maxsize=1)
+def _ground_track_tree() -> ast.Module:
+    """Parse ground_track.py once for all purity checks."""
+    import humeris.domain.ground_track as mod
+
+    with open(mod.__file__, encoding="utf-8") as f:
+        return ast.parse(f.read())
+
+
 class TestGroundTrackPurity:
     """Domain purity: ground_track.py must only import from stdlib and domain."""
 
     def test_no_external_imports(self):
-        import humeris.domain.ground_track as mod
-        source_path = mod.__file__
-        with open(source_path, encoding="utf-8") as f:
-            tree = ast.parse(f.read())
-
-        allowed_top = {'math', 'numpy', 'dataclasses', 'datetime'}
-        allowed_internal_prefix = 'humeris.domain'
-
-        for node in ast.walk(tree):
+        imports = (
+            node for node in ast.walk(_ground_track_tree())
+            if isinstance(node, (ast.Import, ast.ImportFrom))
+        )
+        for node in imports:
             if isinstance(node, ast.Import):
                 for alias in node.names:
                     top = alias.name.split('.')[0]
-                    assert top in allowed_top or alias.name.startswith(allowed_internal_prefix), \
+                    assert top in _ALLOWED_TOP or alias.name.startswith(_ALLOWED_INTERNAL_PREFIX), \
                         f"Forbidden import: {alias.name}"
-            elif isinstance(node, ast.ImportFrom):
-                if node.module and node.level == 0:
-                    top = node.module.split('.')[0]
-                    assert top in allowed_top or node.module.startswith(allowed_internal_prefix), \
-                        f"Forbidden import from: {node.module}"
+            elif node.module and node.level == 0:
+                top = node.module.split('.')[0]
+                assert top in _ALLOWED_TOP or node.module.startswith(_ALLOWED_INTERNAL_PREFIX), \
+                    f"Forbidden import from: {node.module}"
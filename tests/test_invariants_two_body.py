@@ -7,16 +7,19 @@
 These verify mathematical properties that must always hold for the
 Keplerian-to-Cartesian transformation, independent of specific inputs.
 
-Invariants A1-A6 from the formal invariant specification.
+Invariants A1-A6 from the formal invariant specification; A7 re-checks
+them on randomly drawn elements and ties the batched path to the scalar one.
 """
 
 import math
 
+import numpy as np
 import pytest
 
 from humeris.domain.orbital_mechanics import (
     OrbitalConstants,
     kepler_to_cartesian,
+    kepler_to_cartesian_batch,
 )
 
 
@@ -152,3 +155,44 @@ class TestA6PlaneNormalVsInclination:
         i_computed = math.acos(max(-1.0, min(1.0, h[2] / h_mag)))
         assert abs(i_computed - i) < 1e-10, \
             f"{label}: i_computed={math.degrees(i_computed)}, i_input={math.degrees(i)}"
+
+
+def _random_elements(n: int, seed: int) -> np.ndarray:
+    """Draw (n, 6) elements: a in [6.5e6, 4e7] m, e in [0, 0.7], angles in [0, 2pi)."""
+    rng = np.random.default_rng(seed)
+    return np.column_stack([
+        rng.uniform(6.5e6, 4.0e7, n),
+        rng.uniform(0.0, 0.7, n),
+        rng.uniform(0.0, math.pi, n),
+        rng.uniform(0.0, 2 * math.pi, n),
+        rng.uniform(0.0, 2 * math.pi, n),
+        rng.uniform(0.0, 2 * math.pi, n),
+    ])
+
+
+_RANDOM_ELEMENTS = _random_elements(200, seed=42)
+
+
+class TestA7RandomizedElements:
+    """A7: Energy and |h| invariants hold across random valid elliptical elements,
+    and the batched conversion never diverges from the scalar one."""
+
+    def test_specific_energy(self):
+        for a, e, i, raan, argp, nu in _RANDOM_ELEMENTS:
+            pos, vel = kepler_to_cartesian(a, e, i, raan, argp, nu)
+            energy = 0.5 * _mag(vel) ** 2 - MU / _mag(pos)
+            assert abs(energy - (-MU / (2 * a))) < 1e-9 * MU / a, (a, e, i, raan, argp, nu)
+
+    def test_angular_momentum_magnitude(self):
+        for a, e, i, raan, argp, nu in _RANDOM_ELEMENTS:
+            pos, vel = kepler_to_cartesian(a, e, i, raan, argp, nu)
+            h_expected = math.sqrt(MU * a * (1 - e ** 2))
+            assert abs(_mag(_cross(pos, vel)) - h_expected) / h_expected < 1e-10, \
+                (a, e, i, raan, argp, nu)
+
+    def test_batch_matches_scalar(self):
+        pos_b, vel_b = kepler_to_cartesian_batch(*_RANDOM_ELEMENTS.T)
+        pos_s = np.array([kepler_to_cartesian(*row)[0] for row in _RANDOM_ELEMENTS])
+        vel_s = np.array([kepler_to_cartesian(*row)[1] for row in _RANDOM_ELEMENTS])
+        np.testing.assert_allclose(pos_b, pos_s, rtol=1e-12, atol=1e-6)
+        np.testing.assert_allclose(vel_b, vel_s, rtol=1e-12, atol=1e-9)
@@ -129,6 +129,29 @@ class TestJ2MeanMotionCorrection:
         assert 0 < relative_diff < 0.01
 
 
+class TestJ2RatesArrayInput:
+
+    @pytest.mark.parametrize("name", [
+        "j2_raan_rate", "j2_arg_perigee_rate", "j2_mean_motion_correction",
+    ])
+    def test_array_matches_scalar(self, name):
+        """Array inputs broadcast and agree exactly with per-element calls."""
+        import numpy as np
+        from humeris.domain import orbital_mechanics
+
+        fn = getattr(orbital_mechanics, name)
+        a = OrbitalConstants.R_EARTH + np.array([400e3, 550e3, 1200e3])
+        n = np.sqrt(OrbitalConstants.MU_EARTH / a**3)
+        i_rad = np.radians([28.5, 53.0, 97.6])
+        e = np.array([0.0, 0.001, 0.02])
+
+        result = fn(n, a, e, i_rad)
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (3,)
+        for k in range(3):
+            assert result[k] == fn(float(n[k]), float(a[k]), float(e[k]), float(i_rad[k]))
+
+
 # ── Domain purity ────────────────────────────────────────────────────
 
 # ── J3 constant ─────────────────────────────────────────────────────
@@ -43,8 +43,12 @@ def test_json_io_rejects_tampered_provenance(tmp_path: Path):
     p = tmp_path / "tampered.json"
 
     JsonSimulationWriter().write_ccsds_envelope(env, str(p))
-    text = p.read_text(encoding="utf-8")
-    p.write_text(text.replace(env.provenance_hash, "0" * 64), encoding="utf-8")
+    # Overwrite the 64 hex digits of the stored hash in place.
+    offset = p.read_bytes().find(env.provenance_hash.encode("ascii"))
+    assert offset >= 0
+    with open(p, "r+b") as f:
+        f.seek(offset)
+        f.write(b"0" * 64)
 
     with pytest.raises(ValueError, match="provenance hash mismatch"):
         JsonSimulationReader().read_ccsds_envelope(str(p))
@@ -5,12 +5,14 @@ Tests for KML satellite exporter.
 
 Verifies KML structure, satellite positions, orbit paths, and return count.
 """
+import functools
 import math
-import os
-import tempfile
 import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
+from pathlib import Path
+from typing import NamedTuple
 
+import numpy as np
 import pytest
 
 from humeris.domain.constellation import (
@@ -21,6 +23,8 @@ from humeris.domain.orbital_mechanics import OrbitalConstants
 from humeris.ports.export import SatelliteExporter
 from humeris.adapters.kml_exporter import KmlExporter
 
+pytestmark = pytest.mark.filterwarnings("error::DeprecationWarning")
+
 
 EPOCH = datetime(2026, 3, 20, 12, 0, 0, tzinfo=timezone.utc)
 
@@ -42,27 +46,113 @@ def _ns(tag: str) -> str:
     return f"{{{KML_NS}}}{tag}"
 
 
-@pytest.fixture
+# Prefixed ElementPath queries. ElementTree compiles each (path, namespaces)
+# pair once and serves repeat calls from its selector cache, so one query
+# replaces the per-folder find/findall chains.
+_NSMAP = {"k": KML_NS}
+_POINTS = "k:Document/k:Folder/k:Placemark[1]/k:Point"
+_POINT_COORDS = _POINTS + "/k:coordinates"
+_POINT_ALT_MODES = _POINTS + "/k:altitudeMode"
+_ORBIT_NAMES = "k:Document/k:Folder/k:Placemark[2]/k:name"
+_LINESTRINGS = "k:Document/k:Folder/k:Placemark[2]/k:LineString"
+_ORBIT_COORDS = _LINESTRINGS + "/k:coordinates"
+_ORBIT_ALT_MODES = _LINESTRINGS + "/k:altitudeMode"
+
+
+def _nth_coordinates(path: str, n: int) -> str:
+    """Text of the n-th <coordinates> element (0-based), streamed.
+
+    Stops reading once it is found instead of building the whole tree.
+    """
+    seen = 0
+    for _, elem in ET.iterparse(path, events=("end",)):
+        if elem.tag == _ns("coordinates"):
+            if seen == n:
+                return elem.text.strip()
+            seen += 1
+        elem.clear()
+    raise AssertionError(f"fewer than {n + 1} <coordinates> elements in {path}")
+
+
+# J2000 epoch where GMST ≈ 280.46° — puts the ECI X-axis at lon ≈ 79.5°
+_J2000_EPOCH = datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@functools.cache
+def _j2000_expected_lon() -> float:
+    """Geodetic longitude of the ECI X-axis at J2000: -GMST in [-180, 180]."""
+    from humeris.domain.coordinate_frames import gmst_rad
+
+    gmst = math.degrees(gmst_rad(_J2000_EPOCH))
+    lon = (-gmst) % 360.0
+    return lon - 360.0 if lon > 180.0 else lon
+
+
+class _ParsedKml(NamedTuple):
+    """Shared parse of the module-level export."""
+    path: Path
+    tree: ET.ElementTree
+    root: ET.Element
+    doc: ET.Element
+    folders: list[ET.Element]
+
+
+@pytest.fixture(scope="module")
 def satellites():
+    """Walker shell for SHELL, generated once per module."""
     return generate_walker_shell(SHELL)
 
 
-@pytest.fixture
-def kml_path():
-    """Provide a temp file path, cleaned up after test."""
-    fd, path = tempfile.mkstemp(suffix=".kml")
-    os.close(fd)
-    yield path
-    if os.path.exists(path):
-        os.unlink(path)
+@pytest.fixture(scope="module")
+def kml_path(tmp_path_factory):
+    """Scratch path for tests that export on their own.
 
+    Shared across the module: every user writes the file before reading it.
+    """
+    return str(tmp_path_factory.mktemp("kml") / "out.kml")
 
-@pytest.fixture
-def kml_tree(satellites, kml_path):
-    """Export satellites to KML and return parsed ElementTree."""
+
+@pytest.fixture(scope="module")
+def kml(satellites, tmp_path_factory):
+    """Export satellites to KML once per module and parse the result."""
+    path = tmp_path_factory.mktemp("kml") / "constellation.kml"
     exporter = KmlExporter(name="TestConstellation")
-    exporter.export(satellites, kml_path, epoch=EPOCH)
-    return ET.parse(kml_path)
+    exporter.export(satellites, str(path), epoch=EPOCH)
+    # Feed the file in 64 KB chunks and pick Folders off the event stream.
+    # Folder subtrees are what the tests inspect, so none are cleared.
+    parser = ET.XMLPullParser(("end",))
+    folders = []
+    elem = None
+    with open(path, "rb") as f:
+        while chunk := f.read(65536):
+            parser.feed(chunk)
+            for _, elem in parser.read_events():
+                if elem.tag == _ns("Folder"):
+                    folders.append(elem)
+    parser.close()
+    root = elem
+    doc = root.find(_ns("Document"))
+    return _ParsedKml(path, ET.ElementTree(root), root, doc, folders)
+
+
+class _PlacemarkArrays(NamedTuple):
+    """Point and orbit-path coordinates as (lon, lat, alt) float arrays."""
+    points: np.ndarray  # (n_folders, 3)
+    orbits: np.ndarray  # (n_folders, n_path_points, 3)
+
+
+@pytest.fixture(scope="module")
+def placemarks(kml):
+    """Parse every coordinates element of the shared export exactly once."""
+    points = np.array([
+        tuple(map(float, el.text.strip().split(",")))
+        for el in kml.root.findall(_POINT_COORDS, _NSMAP)
+    ], dtype=np.float64)
+    orbits = np.array([
+        [tuple(map(float, t.split(","))) for t in el.text.split()]
+        for el in kml.root.findall(_ORBIT_COORDS, _NSMAP)
+    ], dtype=np.float64)
+    return _PlacemarkArrays(points, orbits)
 
 
 class TestKmlStructure:
@@ -75,48 +165,42 @@ class TestKmlStructure:
         exporter = KmlExporter()
         assert callable(getattr(exporter, "export", None))
 
-    def test_valid_xml(self, kml_tree):
-        root = kml_tree.getroot()
-        assert root.tag == _ns("kml")
+    def test_valid_xml(self, kml):
+        # Root and namespace sit in the first few hundred bytes; no parse needed.
+        with open(kml.path, "rb") as f:
+            head = f.read(4096)
+        assert b'<kml xmlns="http://www.opengis.net/kml/2.2">' in head
 
-    def test_document_element(self, kml_tree):
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        assert doc is not None
+    def test_document_element(self, kml):
+        with open(kml.path, "rb") as f:
+            head = f.read(4096)
+        assert b"<Document>" in head
 
-    def test_document_name(self, kml_tree):
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        name = doc.find(_ns("name"))
+    def test_kml_semantics(self, kml):
+        assert kml.root.tag == _ns("kml")
+        assert kml.doc is not None
+        assert list(kml.root) == [kml.doc]
+
+    def test_document_name(self, kml):
+        name = kml.doc.find(_ns("name"))
         assert name is not None
         assert name.text == "TestConstellation"
 
-    def test_style_element(self, kml_tree):
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        style = doc.find(_ns("Style"))
+    def test_style_element(self, kml):
+        style = kml.doc.find(_ns("Style"))
         assert style is not None
         assert style.get("id") == "sat-style"
 
-    def test_correct_number_of_folders(self, kml_tree, satellites):
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        folders = doc.findall(_ns("Folder"))
-        assert len(folders) == len(satellites)
+    def test_correct_number_of_folders(self, kml, satellites):
+        assert len(kml.folders) == len(satellites)
 
-    def test_satellite_names_in_folders(self, kml_tree, satellites):
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        folders = doc.findall(_ns("Folder"))
-        folder_names = [f.find(_ns("name")).text for f in folders]
+    def test_satellite_names_in_folders(self, kml, satellites):
+        folder_names = [f.find(_ns("name")).text for f in kml.folders]
         sat_names = [s.name for s in satellites]
         assert folder_names == sat_names
 
-    def test_each_folder_has_two_placemarks(self, kml_tree):
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        folders = doc.findall(_ns("Folder"))
-        for folder in folders:
+    def test_each_folder_has_two_placemarks(self, kml):
+        for folder in kml.folders:
             placemarks = folder.findall(_ns("Placemark"))
             assert len(placemarks) == 2
 
@@ -139,11 +223,8 @@ class TestKmlStructure:
         folders = doc.findall(_ns("Folder"))
         assert len(folders) == 0
 
-    def test_style_url_on_placemarks(self, kml_tree):
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        folders = doc.findall(_ns("Folder"))
-        for folder in folders:
+    def test_style_url_on_placemarks(self, kml):
+        for folder in kml.folders:
             for pm in folder.findall(_ns("Placemark")):
                 style_url = pm.find(_ns("styleUrl"))
                 assert style_url is not None
@@ -153,166 +234,56 @@ class TestKmlStructure:
 class TestSatellitePositions:
     """Position Placemarks contain correct geodetic coordinates."""
 
-    def test_point_coordinates_have_three_components(self, kml_tree):
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        folders = doc.findall(_ns("Folder"))
-        for folder in folders:
-            placemarks = folder.findall(_ns("Placemark"))
-            point_pm = placemarks[0]
-            point = point_pm.find(_ns("Point"))
-            assert point is not None
-            coords_text = point.find(_ns("coordinates")).text.strip()
-            parts = coords_text.split(",")
-            assert len(parts) == 3
-
-    def test_coordinates_are_valid_floats(self, kml_tree):
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        folders = doc.findall(_ns("Folder"))
-        for folder in folders:
-            placemarks = folder.findall(_ns("Placemark"))
-            point_pm = placemarks[0]
-            point = point_pm.find(_ns("Point"))
-            coords_text = point.find(_ns("coordinates")).text.strip()
-            parts = coords_text.split(",")
-            for part in parts:
-                float(part)  # must not raise
-
-    def test_altitude_approximately_550km(self, kml_tree):
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        folders = doc.findall(_ns("Folder"))
-        for folder in folders:
-            placemarks = folder.findall(_ns("Placemark"))
-            point_pm = placemarks[0]
-            point = point_pm.find(_ns("Point"))
-            coords_text = point.find(_ns("coordinates")).text.strip()
-            alt_m = float(coords_text.split(",")[2])
-            # Spherical approximation: altitude should be close to 550 km
-            assert abs(alt_m - 550_000) < 15_000
-
-    def test_latitude_within_bounds(self, kml_tree):
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        folders = doc.findall(_ns("Folder"))
-        for folder in folders:
-            placemarks = folder.findall(_ns("Placemark"))
-            point_pm = placemarks[0]
-            point = point_pm.find(_ns("Point"))
-            coords_text = point.find(_ns("coordinates")).text.strip()
-            lat = float(coords_text.split(",")[1])
-            assert -90.0 <= lat <= 90.0
-
-    def test_longitude_within_bounds(self, kml_tree):
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        folders = doc.findall(_ns("Folder"))
-        for folder in folders:
-            placemarks = folder.findall(_ns("Placemark"))
-            point_pm = placemarks[0]
-            point = point_pm.find(_ns("Point"))
-            coords_text = point.find(_ns("coordinates")).text.strip()
-            lon = float(coords_text.split(",")[0])
-            assert -180.0 <= lon <= 180.0
-
-    def test_altitude_mode_is_absolute(self, kml_tree):
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        folders = doc.findall(_ns("Folder"))
-        for folder in folders:
-            placemarks = folder.findall(_ns("Placemark"))
-            point_pm = placemarks[0]
-            point = point_pm.find(_ns("Point"))
-            alt_mode = point.find(_ns("altitudeMode"))
-            assert alt_mode is not None
-            assert alt_mode.text == "absolute"
+    def test_point_coordinates_have_three_components(self, kml, placemarks):
+        assert placemarks.points.shape == (len(kml.folders), 3)
+
+    def test_coordinates_are_valid_floats(self, placemarks):
+        assert np.isfinite(placemarks.points).all()
+
+    def test_altitude_approximately_550km(self, placemarks):
+        # Spherical approximation: altitude should be close to 550 km
+        assert np.abs(placemarks.points[:, 2] - 550_000).max() < 15_000
+
+    def test_latitude_within_bounds(self, placemarks):
+        assert (np.abs(placemarks.points[:, 1]) <= 90.0).all()
+
+    def test_longitude_within_bounds(self, placemarks):
+        assert (np.abs(placemarks.points[:, 0]) <= 180.0).all()
+
+    def test_altitude_mode_is_absolute(self, kml):
+        modes = [el.text for el in kml.root.findall(_POINT_ALT_MODES, _NSMAP)]
+        assert modes == ["absolute"] * len(kml.folders)
 
 
 class TestOrbitPaths:
     """Orbit path Placemarks contain correct LineString coordinates."""
 
-    def test_linestring_has_37_coordinate_tuples(self, kml_tree):
-        """36 steps (0,10,...,350) + 1 closing point = 37 tuples."""
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        folders = doc.findall(_ns("Folder"))
-        for folder in folders:
-            placemarks = folder.findall(_ns("Placemark"))
-            orbit_pm = placemarks[1]
-            linestring = orbit_pm.find(_ns("LineString"))
-            assert linestring is not None
-            coords_text = linestring.find(_ns("coordinates")).text.strip()
-            tuples = coords_text.split()
-            assert len(tuples) == 37
-
-    def test_orbit_coordinates_are_valid_floats(self, kml_tree):
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        folders = doc.findall(_ns("Folder"))
-        for folder in folders:
-            placemarks = folder.findall(_ns("Placemark"))
-            orbit_pm = placemarks[1]
-            linestring = orbit_pm.find(_ns("LineString"))
-            coords_text = linestring.find(_ns("coordinates")).text.strip()
-            for coord_tuple in coords_text.split():
-                parts = coord_tuple.split(",")
-                assert len(parts) == 3
-                for part in parts:
-                    float(part)  # must not raise
-
-    def test_orbit_path_closes(self, kml_tree):
+    def test_linestring_has_37_coordinate_tuples(self, kml, placemarks):
+        """36 steps (0,10,...,350) + 1 closing point = 37 (lon, lat, alt) tuples."""
+        assert placemarks.orbits.shape == (len(kml.folders), 37, 3)
+
+    def test_orbit_coordinates_are_valid_floats(self, placemarks):
+        assert np.isfinite(placemarks.orbits).all()
+
+    def test_orbit_path_closes(self, placemarks):
         """First and last coordinate tuples should match."""
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        folders = doc.findall(_ns("Folder"))
-        for folder in folders:
-            placemarks = folder.findall(_ns("Placemark"))
-            orbit_pm = placemarks[1]
-            linestring = orbit_pm.find(_ns("LineString"))
-            coords_text = linestring.find(_ns("coordinates")).text.strip()
-            tuples = coords_text.split()
-            assert tuples[0] == tuples[-1]
+        orbits = placemarks.orbits
+        # Tolerance rather than exact equality: independent of the
+        # exporter's float formatting precision.
+        assert np.allclose(orbits[:, 0], orbits[:, -1], rtol=0.0, atol=1e-6)
 
-    def test_orbit_altitude_consistent(self, kml_tree):
+    def test_orbit_altitude_consistent(self, placemarks):
         """All orbit path altitudes should be approximately equal (circular orbit)."""
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        folders = doc.findall(_ns("Folder"))
-        folder = folders[0]
-        placemarks = folder.findall(_ns("Placemark"))
-        orbit_pm = placemarks[1]
-        linestring = orbit_pm.find(_ns("LineString"))
-        coords_text = linestring.find(_ns("coordinates")).text.strip()
-        altitudes = []
-        for coord_tuple in coords_text.split():
-            alt = float(coord_tuple.split(",")[2])
-            altitudes.append(alt)
         # All altitudes should be within 1 km of each other (circular orbit)
-        alt_range = max(altitudes) - min(altitudes)
-        assert alt_range < 1000.0
+        assert np.ptp(placemarks.orbits[0, :, 2]) < 1000.0
 
-    def test_orbit_name_has_orbit_suffix(self, kml_tree, satellites):
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        folders = doc.findall(_ns("Folder"))
-        for folder, sat in zip(folders, satellites):
-            placemarks = folder.findall(_ns("Placemark"))
-            orbit_pm = placemarks[1]
-            name = orbit_pm.find(_ns("name"))
-            assert name.text == f"{sat.name} orbit"
+    def test_orbit_name_has_orbit_suffix(self, kml, satellites):
+        names = [el.text for el in kml.root.findall(_ORBIT_NAMES, _NSMAP)]
+        assert names == [f"{sat.name} orbit" for sat in satellites]
 
-    def test_orbit_altitude_mode_is_absolute(self, kml_tree):
-        root = kml_tree.getroot()
-        doc = root.find(_ns("Document"))
-        folders = doc.findall(_ns("Folder"))
-        for folder in folders:
-            placemarks = folder.findall(_ns("Placemark"))
-            orbit_pm = placemarks[1]
-            linestring = orbit_pm.find(_ns("LineString"))
-            alt_mode = linestring.find(_ns("altitudeMode"))
-            assert alt_mode is not None
-            assert alt_mode.text == "absolute"
+    def test_orbit_altitude_mode_is_absolute(self, kml):
+        modes = [el.text for el in kml.root.findall(_ORBIT_ALT_MODES, _NSMAP)]
+        assert modes == ["absolute"] * len(kml.folders)
 
 
 class TestReturnCount:
@@ -340,7 +311,6 @@ class TestEciToEcefRotation:
         The bug: current code outputs lon≈0° because it skips ECI→ECEF rotation.
         """
         from humeris.domain.constellation import Satellite
-        from humeris.domain.coordinate_frames import gmst_rad
 
         r = OrbitalConstants.R_EARTH + 550_000.0
         # Satellite on ECI X-axis: RA=0
@@ -353,25 +323,13 @@ class TestEciToEcefRotation:
             raan_deg=0.0,
             true_anomaly_deg=0.0,
         )
-        # Use J2000 epoch where GMST ≈ 280.46° — gives ~79.5° offset
-        epoch = datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         exporter = KmlExporter(name="GMST-Test", include_orbits=False)
-        exporter.export([sat], kml_path, epoch=epoch)
+        exporter.export([sat], kml_path, epoch=_J2000_EPOCH)
 
-        tree = ET.parse(kml_path)
-        root = tree.getroot()
-        doc = root.find(_ns("Document"))
-        folder = doc.find(_ns("Folder"))
-        pm = folder.find(_ns("Placemark"))
-        point = pm.find(_ns("Point"))
-        coords = point.find(_ns("coordinates")).text.strip()
+        coords = _nth_coordinates(kml_path, 0)
         lon_deg = float(coords.split(",")[0])
 
-        # Expected: lon = -GMST(epoch) mod 360, normalized to [-180, 180]
-        gmst = math.degrees(gmst_rad(epoch))
-        expected_lon = (-gmst) % 360.0
-        if expected_lon > 180.0:
-            expected_lon -= 360.0
+        expected_lon = _j2000_expected_lon()
 
         # GMST at J2000 ≈ 280.46° → expected lon ≈ 79.5°
         # Bug produces lon ≈ 0° (raw ECI). Tolerance: 1°.
@@ -383,7 +341,6 @@ class TestEciToEcefRotation:
     def test_orbit_path_longitude_rotated(self, kml_path):
         """Orbit path coordinates must also include GMST rotation."""
         from humeris.domain.constellation import Satellite
-        from humeris.domain.coordinate_frames import gmst_rad
 
         r = OrbitalConstants.R_EARTH + 550_000.0
         # Equatorial orbit — all points should have lat≈0, lon varies
@@ -396,28 +353,17 @@ class TestEciToEcefRotation:
             raan_deg=0.0,
             true_anomaly_deg=0.0,
         )
-        # Use J2000 epoch where GMST ≈ 280.46°
-        epoch = datetime(2000, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         exporter = KmlExporter(name="GMST-Orbit", include_orbits=True)
-        exporter.export([sat], kml_path, epoch=epoch)
+        exporter.export([sat], kml_path, epoch=_J2000_EPOCH)
 
-        tree = ET.parse(kml_path)
-        root = tree.getroot()
-        doc = root.find(_ns("Document"))
-        folder = doc.find(_ns("Folder"))
-        placemarks = folder.findall(_ns("Placemark"))
-        orbit_pm = placemarks[1]  # second placemark is the orbit
-        linestring = orbit_pm.find(_ns("LineString"))
-        coords_text = linestring.find(_ns("coordinates")).text.strip()
+        # Second <coordinates> belongs to the orbit Placemark
+        coords_text = _nth_coordinates(kml_path, 1)
 
         # First point (angle=0) is at ECI X-axis → should have GMST offset
         first_tuple = coords_text.split()[0]
         first_lon = float(first_tuple.split(",")[0])
 
-        gmst = math.degrees(gmst_rad(epoch))
-        expected_lon = (-gmst) % 360.0
-        if expected_lon > 180.0:
-            expected_lon -= 360.0
+        expected_lon = _j2000_expected_lon()
 
         assert abs(first_lon - expected_lon) < 1.0, (
             f"Orbit path lon {first_lon:.2f}° not rotated by GMST, "
@@ -7,6 +7,7 @@ import ast
 import math
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pytest
 
 from humeris.domain.orbital_mechanics import OrbitalConstants
@@ -159,6 +160,51 @@ class TestComputeOrbitLifetime:
             compute_orbit_lifetime(_sma(400), 0.0, STARLINK_DRAG, EPOCH, step_days=-1.0)
 
 
+class TestComputeOrbitLifetimeBatch:
+
+    def test_matches_scalar(self):
+        """Batch lifetimes equal per-orbit compute_orbit_lifetime."""
+        from humeris.domain.lifetime import (
+            compute_orbit_lifetime,
+            compute_orbit_lifetime_batch,
+        )
+
+        alts = [300.0, 400.0, 550.0]
+        batch = compute_orbit_lifetime_batch(
+            np.array([_sma(h) for h in alts]), STARLINK_DRAG, max_years=10.0,
+        )
+        for h, days in zip(alts, batch):
+            scalar = compute_orbit_lifetime(
+                _sma(h), 0.0, STARLINK_DRAG, EPOCH, max_years=10.0,
+            )
+            assert days == scalar.lifetime_days
+
+    def test_matches_scalar_through_lockstep_and_tail(self):
+        """More orbits than the scalar tail: lockstep first, then per-orbit finish."""
+        from humeris.domain.lifetime import (
+            _SCALAR_TAIL_SIZE,
+            compute_orbit_lifetime,
+            compute_orbit_lifetime_batch,
+        )
+
+        alts = np.linspace(250.0, 500.0, _SCALAR_TAIL_SIZE + 4)
+        batch = compute_orbit_lifetime_batch(
+            _sma(alts), STARLINK_DRAG, max_years=2.0,
+        )
+        for h, days in zip(alts.tolist(), batch):
+            scalar = compute_orbit_lifetime(
+                _sma(h), 0.0, STARLINK_DRAG, EPOCH, max_years=2.0,
+            )
+            assert days == scalar.lifetime_days
+
+    def test_below_reentry_raises(self):
+        """Any orbit already below re-entry altitude raises ValueError."""
+        from humeris.domain.lifetime import compute_orbit_lifetime_batch
+
+        with pytest.raises(ValueError):
+            compute_orbit_lifetime_batch(np.array([_sma(400), _sma(90)]), STARLINK_DRAG)
+
+
 # ── compute_altitude_at_time ─────────────────────────────────────────
 
 class TestComputeAltitudeAtTime:
@@ -5,8 +5,12 @@
 """D-P2-01: Digital twin continuity checks across mission phases."""
 from __future__ import annotations
 
+import pytest
+
 from humeris.domain.mission_digital_twin import TwinState, validate_twin_continuity
 
+pytestmark = pytest.mark.filterwarnings("error::DeprecationWarning")
+
 
 def test_digital_twin_validates_three_phase_continuity():
     states = [
@@ -8,6 +8,7 @@ import ast
 import math
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pytest
 
 from humeris.domain.orbital_mechanics import OrbitalConstants, kepler_to_cartesian
@@ -26,6 +27,7 @@ from humeris.domain.numerical_propagation import (
     stormer_verlet_step,
     yoshida4_step,
     propagate_numerical,
+    propagate_universal_variable,
 )
 
 
@@ -666,6 +668,86 @@ class TestPropagateNumerical:
         assert e_final < e_initial
 
 
+class TestPropagateUniversalVariable:
+
+    def test_matches_dormand_prince_two_body(self, leo_state, epoch):
+        """Analytic LEO state after one orbit matches adaptive two-body integration."""
+        period_s = 2 * math.pi / leo_state.mean_motion_rad_s
+        duration = timedelta(seconds=period_s)
+        step = timedelta(seconds=30)
+        numerical = propagate_numerical(
+            leo_state, duration, step, [TwoBodyGravity()],
+            epoch=epoch, integrator="dormand_prince",
+        )
+        analytic = propagate_universal_variable(leo_state, duration, step, epoch=epoch)
+
+        assert len(analytic.steps) == len(numerical.steps)
+        assert analytic.steps[-1].time == numerical.steps[-1].time
+        for a_c, n_c in zip(analytic.steps[-1].position_eci, numerical.steps[-1].position_eci):
+            assert a_c == pytest.approx(n_c, abs=1.0)
+        assert analytic.relative_energy_drift < 1e-12
+
+    def test_hyperbolic_stays_hyperbolic(self, epoch):
+        """Hyperbolic state keeps positive energy and recedes over 120 days."""
+        from humeris.domain.propagation import OrbitalState
+
+        a_m = -1.3e11
+        state = OrbitalState(
+            semi_major_axis_m=a_m,
+            eccentricity=1.2,
+            inclination_rad=math.radians(122.74),
+            raan_rad=math.radians(24.6),
+            arg_perigee_rad=math.radians(241.7),
+            true_anomaly_rad=math.radians(40.0),
+            mean_motion_rad_s=math.sqrt(OrbitalConstants.MU_EARTH / abs(a_m) ** 3),
+            reference_epoch=epoch,
+        )
+        result = propagate_universal_variable(
+            state, timedelta(days=120), timedelta(hours=1),
+        )
+        r = [math.sqrt(sum(c ** 2 for c in s.position_eci)) for s in result.steps]
+        assert all(s.specific_energy_j_kg > 0 for s in result.steps)
+        assert r[-1] > r[0]
+        assert result.relative_energy_drift < 1e-10
+        assert result.force_model_names == ("TwoBodyGravity",)
+
+    def test_parabolic_energy_zero(self, epoch):
+        """Universal solve covers the parabolic case (alpha = 0)."""
+        from humeris.domain.numerical_propagation import _universal_kepler
+
+        mu = OrbitalConstants.MU_EARTH
+        r0 = 7.0e6
+        pos, vel = _universal_kepler(
+            np.array([r0, 0.0, 0.0]),
+            np.array([0.0, math.sqrt(2 * mu / r0), 0.0]),
+            np.array([600.0, 5000.0]),
+            mu,
+        )
+        r = np.linalg.norm(pos, axis=1)
+        energy = 0.5 * np.sum(vel ** 2, axis=1) - mu / r
+        assert np.all(np.abs(energy) < 1e-6 * mu / r0)
+        assert r[1] > r[0] > r0
+
+    def test_backward_matches_dormand_prince(self, leo_state, epoch):
+        """Negative duration propagates backward on the same grid as dormand_prince."""
+        duration = timedelta(seconds=-1000)
+        step = timedelta(seconds=60)
+        numerical = propagate_numerical(
+            leo_state, duration, step, [TwoBodyGravity()],
+            epoch=epoch, integrator="dormand_prince",
+        )
+        analytic = propagate_universal_variable(leo_state, duration, step, epoch=epoch)
+
+        assert [s.time for s in analytic.steps] == [s.time for s in numerical.steps]
+        assert analytic.steps[-1].time == epoch + duration
+        for a_c, n_c in zip(analytic.steps[-1].position_eci, numerical.steps[-1].position_eci):
+            assert a_c == pytest.approx(n_c, abs=1.0)
+
+    def test_non_positive_step_raises(self, leo_state):
+        with pytest.raises(ValueError, match="step must be positive"):
+            propagate_universal_variable(leo_state, timedelta(hours=1), timedelta(0))
+
+
 # --- Domain purity ---
 
 class TestSolarRadiationPressureShadow:
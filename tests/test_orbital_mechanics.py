@@ -2,16 +2,20 @@
 # Licensed under the MIT License — see LICENSE.
 """Tests for orbital mechanics edge cases.
 
-Covers kepler_to_cartesian, sso_inclination_deg, and j2_raan_rate
+Covers kepler_to_cartesian, kepler_to_cartesian_batch, sso_inclination_deg,
+and j2_raan_rate
 with boundary and edge-case inputs.
 """
 import math
 
+import numpy as np
 import pytest
 
 from humeris.domain.orbital_mechanics import (
     OrbitalConstants,
+    OrbitalElementBatch,
     kepler_to_cartesian,
+    kepler_to_cartesian_batch,
     sso_inclination_deg,
     j2_raan_rate,
 )
@@ -42,6 +46,16 @@ class TestOrbitalMechanicsEdgeCases:
             f"Expected altitude ~{alt_km} km, got {computed_alt_km:.2f} km"
         )
 
+    def test_kepler_to_cartesian_returns_float64_arrays(self):
+        """Position and velocity come back as (3,) float64 arrays."""
+        a = OrbitalConstants.R_EARTH + 550_000.0
+        pos_eci, vel_eci = kepler_to_cartesian(a, 0.0, math.radians(53.0), 0.0, 0.0, 0.0)
+
+        for vec in (pos_eci, vel_eci):
+            assert isinstance(vec, np.ndarray)
+            assert vec.shape == (3,)
+            assert vec.dtype == np.float64
+
     def test_sso_inclination_550km(self):
         """SSO inclination at 550 km should be approximately 97.4 deg."""
         inc_deg = sso_inclination_deg(550.0)
@@ -79,3 +93,107 @@ class TestOrbitalMechanicsEdgeCases:
         assert abs(rate) < 1e-10, (
             f"Polar RAAN rate should be ~0, got {rate}"
         )
+
+
+class TestKeplerToCartesianBatch:
+    """Broadcasting behaviour of the vectorized Kepler conversion."""
+
+    A = OrbitalConstants.R_EARTH + 550_000.0
+
+    def test_true_anomaly_grid_gives_time_series(self):
+        """Scalar elements with a (T,) anomaly grid give (T, 3) outputs."""
+        nu = np.linspace(0.0, 2.0 * np.pi, 25)
+        pos, vel = kepler_to_cartesian_batch(self.A, 0.01, 0.9, 0.3, 0.2, nu)
+        assert pos.shape == (25, 3)
+        assert vel.shape == (25, 3)
+
+    def test_matches_scalar_path(self):
+        nu = np.linspace(0.0, 2.0 * np.pi, 13)
+        pos, vel = kepler_to_cartesian_batch(self.A, 0.05, 1.1, 0.4, 2.0, nu)
+        for k, nu_k in enumerate(nu):
+            p_ref, v_ref = kepler_to_cartesian(self.A, 0.05, 1.1, 0.4, 2.0, float(nu_k))
+            np.testing.assert_allclose(pos[k], p_ref, rtol=1e-12, atol=1e-6)
+            np.testing.assert_allclose(vel[k], v_ref, rtol=1e-12, atol=1e-9)
+
+    def test_satellites_by_time_broadcast(self):
+        """(N, 1) RAANs against a (T,) anomaly grid give (N, T, 3)."""
+        raan = np.linspace(0.0, np.pi, 4)[:, None]
+        nu = np.linspace(0.0, np.pi, 7)
+        pos, vel = kepler_to_cartesian_batch(self.A, 0.0, 0.9, raan, 0.0, nu)
+        assert pos.shape == (4, 7, 3)
+        assert vel.shape == (4, 7, 3)
+
+    def test_raan_only_array_broadcasts_all_components(self):
+        """Row 3 of the rotation does not depend on RAAN; shape must still broadcast."""
+        raan = np.linspace(0.0, np.pi, 5)
+        pos, _ = kepler_to_cartesian_batch(self.A, 0.0, 0.9, raan, 0.0, 0.3)
+        assert pos.shape == (5, 3)
+        np.testing.assert_allclose(pos[:, 2], pos[0, 2])
+
+
+class TestOrbitalElementBatch:
+    """Structure-of-arrays element container."""
+
+    RECORDS = [
+        {"a": 6_921_000.0, "e": 0.0, "i_rad": 0.93, "omega_big_rad": 0.0,
+         "omega_small_rad": 0.0, "nu_rad": 0.0},
+        {"a": 7_000_000.0, "e": 0.01, "i_rad": 1.7, "omega_big_rad": 1.2,
+         "omega_small_rad": 0.4, "nu_rad": 2.5},
+        {"a": 26_560_000.0, "e": 0.02, "i_rad": 0.96, "omega_big_rad": 3.0,
+         "omega_small_rad": 5.0, "nu_rad": 4.0},
+    ]
+
+    def test_from_records_builds_contiguous_float64_columns(self):
+        batch = OrbitalElementBatch.from_records(self.RECORDS)
+        for col in (batch.a, batch.e, batch.i_rad, batch.omega_big_rad,
+                    batch.omega_small_rad, batch.nu_rad):
+            assert col.dtype == np.float64
+            assert col.shape == (3,)
+            assert col.flags["C_CONTIGUOUS"]
+        assert batch.e[1] == 0.01
+
+    def test_to_cartesian_matches_scalar_path(self):
+        batch = OrbitalElementBatch.from_records(self.RECORDS)
+        pos, vel = batch.to_cartesian()
+        assert pos.shape == (3, 3)
+        for k, rec in enumerate(self.RECORDS):
+            p_ref, v_ref = kepler_to_cartesian(**rec)
+            np.testing.assert_allclose(pos[k], p_ref, rtol=1e-12)
+            np.testing.assert_allclose(vel[k], v_ref, rtol=1e-12)
+
+    def test_empty_records(self):
+        batch = OrbitalElementBatch.from_records([])
+        pos, _ = batch.to_cartesian()
+        assert pos.shape == (0, 3)
+
+    def test_direct_construction_coerces_fields(self):
+        strided = np.arange(6, dtype=np.int64)[::2]
+        batch = OrbitalElementBatch(
+            a=[7.0e6, 7.1e6, 7.2e6], e=strided, i_rad=strided,
+            omega_big_rad=strided, omega_small_rad=strided, nu_rad=strided,
+        )
+        for name in ("a", "e", "i_rad", "omega_big_rad", "omega_small_rad", "nu_rad"):
+            col = getattr(batch, name)
+            assert col.dtype == np.float64
+            assert col.flags["C_CONTIGUOUS"]
+
+    def test_mismatched_shapes_raise(self):
+        with pytest.raises(ValueError, match="share one shape"):
+            OrbitalElementBatch(
+                a=np.ones(3), e=np.zeros(2), i_rad=np.zeros(3),
+                omega_big_rad=np.zeros(3), omega_small_rad=np.zeros(3),
+                nu_rad=np.zeros(3),
+            )
+
+    def test_identity_equality_and_hashable(self):
+        batch = OrbitalElementBatch.from_records(self.RECORDS)
+        other = OrbitalElementBatch.from_records(self.RECORDS)
+        assert batch == batch
+        assert batch != other
+        assert isinstance(hash(batch), int)
+
+    def test_from_records_returns_subclass(self):
+        class Tagged(OrbitalElementBatch):
+            pass
+
+        assert type(Tagged.from_records(self.RECORDS)) is Tagged
@@ -5,12 +5,13 @@
 """Cross-run profile behavior history tracking tests."""
 from __future__ import annotations
 
+import functools
 import importlib.util
 import json
 from pathlib import Path
 
 
-
+@functools.lru_cache(maxsize=1)
 def _load_compare_script_module():
     script_path = Path("scripts/run_gmat_mirror_compare.py").resolve()
     spec = importlib.util.spec_from_file_location("run_gmat_mirror_compare", script_path)
@@ -136,6 +136,49 @@ class TestDeriveOrbitalState:
         assert state.j2_mean_motion_correction != 0.0
 
 
+class TestDeriveOrbitalStatesBatch:
+
+    @pytest.mark.parametrize("include_j2", [False, True])
+    def test_matches_per_satellite_derivation(self, include_j2):
+        """Batch path agrees field-by-field with derive_orbital_state."""
+        import dataclasses
+        from humeris.domain.propagation import (
+            derive_orbital_state,
+            derive_orbital_states_batch,
+        )
+
+        shell = ShellConfig(
+            altitude_km=550, inclination_deg=97.6,
+            num_planes=4, sats_per_plane=6,
+            phase_factor=1, raan_offset_deg=0,
+            shell_name='Test',
+        )
+        sats = generate_walker_shell(shell)
+        # Mix of satellites with and without their own epoch
+        sats = [
+            dataclasses.replace(s, epoch=_EPOCH - timedelta(minutes=i))
+            if i % 2 else s
+            for i, s in enumerate(sats)
+        ]
+
+        batch = derive_orbital_states_batch(sats, _EPOCH, include_j2=include_j2)
+        assert len(batch) == len(sats)
+        for sat, got in zip(sats, batch):
+            want = derive_orbital_state(sat, _EPOCH, include_j2=include_j2)
+            assert got.reference_epoch == want.reference_epoch
+            for f in dataclasses.fields(want):
+                if f.name == 'reference_epoch':
+                    continue
+                assert getattr(got, f.name) == pytest.approx(
+                    getattr(want, f.name), rel=1e-13, abs=1e-300,
+                ), f.name
+
+    def test_empty_input(self):
+        from humeris.domain.propagation import derive_orbital_states_batch
+
+        assert derive_orbital_states_batch([], _EPOCH) == []
+
+
 # ── propagate_to ─────────────────────────────────────────────────────
 
 class TestPropagateTo:
@@ -3,14 +3,39 @@
 """Tests for relativistic force models (Schwarzschild, Lense-Thirring, de Sitter)."""
 
 import ast
+import functools
 import math
 from datetime import datetime, timezone
 
+import numpy as np
 import pytest
 
+from humeris.domain.relativistic_forces import (
+    DeSitterForce,
+    LenseThirringForce,
+    SchwarzschildForce,
+    _C_LIGHT,
+    _GM_EARTH,
+    _GM_SUN,
+    _sun_position_approx,
+)
+
+pytestmark = pytest.mark.filterwarnings("error::DeprecationWarning")
+
+# Reference states as arrays, so the force models skip the tuple conversion.
+LEO_POS = np.array([6778137.0, 0.0, 0.0])
+LEO_VEL = np.array([0.0, 7668.0, 0.0])
+MEO_POS = np.array([26578137.0, 0.0, 0.0])
+MEO_VEL = np.array([0.0, 3870.0, 0.0])
+
+# Force models hold no state, so one instance of each serves every test.
+SCHWARZSCHILD_FORCE = SchwarzschildForce()
+LENSE_THIRRING_FORCE = LenseThirringForce()
+DE_SITTER_FORCE = DeSitterForce()
+
 
 def _vec_mag(v):
-    return math.sqrt(sum(c ** 2 for c in v))
+    return math.hypot(*v)
 
 
 class TestSchwarzschildForce:
@@ -18,118 +43,70 @@ class TestSchwarzschildForce:
 
     def test_magnitude_at_leo(self):
         """Schwarzschild acceleration at LEO ~3e-9 m/s²."""
-        from humeris.domain.relativistic_forces import SchwarzschildForce
-
-        force = SchwarzschildForce()
+        force = SCHWARZSCHILD_FORCE
         dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        pos = (6778137.0, 0.0, 0.0)
-        vel = (0.0, 7668.0, 0.0)
-        acc = force.acceleration(dt, pos, vel)
+        acc = force.acceleration(dt, LEO_POS, LEO_VEL)
         mag = _vec_mag(acc)
         assert 1e-10 < mag < 1e-7
 
     def test_direction_circular_purely_radial(self):
         """Schwarzschild is purely radial for circular orbits (r·v=0)."""
-        from humeris.domain.relativistic_forces import SchwarzschildForce
-
-        force = SchwarzschildForce()
+        force = SCHWARZSCHILD_FORCE
         dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        pos = (6778137.0, 0.0, 0.0)
-        vel = (0.0, 7668.0, 0.0)
-        acc = force.acceleration(dt, pos, vel)
+        acc = force.acceleration(dt, LEO_POS, LEO_VEL)
         # Radial component non-zero, along-track zero for circular orbit
         assert acc[0] != 0.0
         assert acc[1] == 0.0
 
     def test_direction_eccentric_has_along_track(self):
         """Schwarzschild has along-track component for eccentric orbits (r·v≠0)."""
-        from humeris.domain.relativistic_forces import SchwarzschildForce
-
-        force = SchwarzschildForce()
+        force = SCHWARZSCHILD_FORCE
         dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
         # Slightly non-circular: r·v = 6778137 * 500 ≠ 0
-        pos = (6778137.0, 0.0, 0.0)
-        vel = (500.0, 7668.0, 0.0)
-        acc = force.acceleration(dt, pos, vel)
+        vel = np.array([500.0, 7668.0, 0.0])
+        acc = force.acceleration(dt, LEO_POS, vel)
         assert acc[0] != 0.0
         assert acc[1] != 0.0
 
     def test_increases_closer_to_earth(self):
         """Schwarzschild is stronger at lower altitude."""
-        from humeris.domain.relativistic_forces import SchwarzschildForce
-
-        force = SchwarzschildForce()
+        force = SCHWARZSCHILD_FORCE
         dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
         # LEO
-        acc_leo = force.acceleration(dt, (6778137.0, 0.0, 0.0), (0.0, 7668.0, 0.0))
+        acc_leo = force.acceleration(dt, LEO_POS, LEO_VEL)
         # MEO
-        acc_meo = force.acceleration(dt, (26578137.0, 0.0, 0.0), (0.0, 3870.0, 0.0))
+        acc_meo = force.acceleration(dt, MEO_POS, MEO_VEL)
         assert _vec_mag(acc_leo) > _vec_mag(acc_meo)
 
     def test_constants_verification(self):
         """Verify GM_E and c are correct."""
-        from humeris.domain.relativistic_forces import (
-            _GM_EARTH,
-            _C_LIGHT,
-        )
         assert abs(_GM_EARTH - 3.986004418e14) < 1e8
         assert _C_LIGHT == 299792458.0
 
-    def test_force_model_compliance(self):
-        """Has the ForceModel interface."""
-        from humeris.domain.relativistic_forces import SchwarzschildForce
-        force = SchwarzschildForce()
-        assert hasattr(force, "acceleration")
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        result = force.acceleration(dt, (7000000.0, 0.0, 0.0), (0.0, 7500.0, 0.0))
-        assert len(result) == 3
-
 
 class TestLenseThirringForce:
     """Frame-dragging from Earth rotation."""
 
     def test_magnitude_at_leo(self):
         """Lense-Thirring ~2e-10 m/s² at equatorial LEO."""
-        from humeris.domain.relativistic_forces import LenseThirringForce
-
-        force = LenseThirringForce()
+        force = LENSE_THIRRING_FORCE
         dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        acc = force.acceleration(dt, (6778137.0, 0.0, 0.0), (0.0, 7668.0, 0.0))
+        acc = force.acceleration(dt, LEO_POS, LEO_VEL)
         mag = _vec_mag(acc)
         assert 1e-12 < mag < 1e-8
 
-    def test_force_model_compliance(self):
-        from humeris.domain.relativistic_forces import LenseThirringForce
-        force = LenseThirringForce()
-        result = force.acceleration(
-            datetime(2024, 1, 1, tzinfo=timezone.utc),
-            (7000000.0, 0.0, 0.0), (0.0, 7500.0, 0.0),
-        )
-        assert len(result) == 3
-
 
 class TestDeSitterForce:
     """Geodesic precession from heliocentric motion."""
 
     def test_magnitude_at_leo(self):
         """de Sitter ~5e-13 m/s² at LEO."""
-        from humeris.domain.relativistic_forces import DeSitterForce
-
-        force = DeSitterForce()
+        force = DE_SITTER_FORCE
         dt = datetime(2024, 6, 15, tzinfo=timezone.utc)
-        acc = force.acceleration(dt, (6778137.0, 0.0, 0.0), (0.0, 7668.0, 0.0))
+        acc = force.acceleration(dt, LEO_POS, LEO_VEL)
         mag = _vec_mag(acc)
         assert 1e-15 < mag < 1e-10
 
-    def test_force_model_compliance(self):
-        from humeris.domain.relativistic_forces import DeSitterForce
-        force = DeSitterForce()
-        result = force.acceleration(
-            datetime(2024, 6, 15, tzinfo=timezone.utc),
-            (7000000.0, 0.0, 0.0), (0.0, 7500.0, 0.0),
-        )
-        assert len(result) == 3
-
     def test_iers_vector_triple_product(self):
         """IERS 2010 eq. 10.6: acceleration uses (R x V_E) x v, not V_E x (R x v).
 
@@ -137,12 +114,7 @@ class TestDeSitterForce:
         Using BAC-CAB: (R x V_E) x v = (R.v)*V_E - (V_E.v)*R.
         The wrong form V_E x (R x v) = (V_E.v)*R - (V_E.R)*v gives different results.
         """
-        import numpy as np
-        from humeris.domain.relativistic_forces import (
-            DeSitterForce, _GM_SUN, _C_LIGHT, _sun_position_approx,
-        )
-
-        force = DeSitterForce()
+        force = DE_SITTER_FORCE
         # Use a date where Earth velocity has a known non-trivial direction
         dt = datetime(2024, 3, 20, tzinfo=timezone.utc)  # equinox
         # Non-degenerate position and velocity (all components non-zero)
@@ -160,10 +132,9 @@ class TestDeSitterForce:
         sun2 = np.array(_sun_position_approx(dt2))
         Ve = -(sun2 - sun) / 3600.0
 
-        # IERS correct form: (R x V_E) x v
+        # IERS correct form: (R x V_E) x v, expanded by BAC-CAB
         v_arr = np.array(vel)
-        RxVe = np.cross(sun, Ve)
-        iers_cross = np.cross(RxVe, v_arr)
+        iers_cross = np.dot(sun, v_arr) * Ve - np.dot(Ve, v_arr) * sun
 
         coeff = -3.0 * _GM_SUN / (2.0 * _C_LIGHT**2 * R**3)
         expected = coeff * iers_cross
@@ -172,61 +143,74 @@ class TestDeSitterForce:
         np.testing.assert_allclose(acc, expected, rtol=1e-6)
 
 
+@pytest.mark.parametrize(
+    "force_cls", [SchwarzschildForce, LenseThirringForce, DeSitterForce],
+)
+def test_force_model_compliance(force_cls):
+    """Has the ForceModel interface and accepts plain tuples."""
+    force = force_cls()
+    assert hasattr(force, "acceleration")
+    result = force.acceleration(
+        datetime(2024, 1, 1, tzinfo=timezone.utc),
+        (7000000.0, 0.0, 0.0), (0.0, 7500.0, 0.0),
+    )
+    assert len(result) == 3
+
+
+@pytest.fixture(scope="module")
+def all_relativistic_accels():
+    """LEO accelerations from each force model, evaluated once."""
+    dt = datetime(2024, 6, 15, tzinfo=timezone.utc)
+    return {
+        "s": SCHWARZSCHILD_FORCE.acceleration(dt, LEO_POS, LEO_VEL),
+        "lt": LENSE_THIRRING_FORCE.acceleration(dt, LEO_POS, LEO_VEL),
+        "ds": DE_SITTER_FORCE.acceleration(dt, LEO_POS, LEO_VEL),
+    }
+
+
 class TestCombinedRelativistic:
     """Combined relativistic effects."""
 
-    def test_schwarzschild_dominates(self):
+    def test_schwarzschild_dominates(self, all_relativistic_accels):
         """Schwarzschild >> Lense-Thirring >> de Sitter."""
-        from humeris.domain.relativistic_forces import (
-            SchwarzschildForce,
-            LenseThirringForce,
-            DeSitterForce,
-        )
-
-        dt = datetime(2024, 6, 15, tzinfo=timezone.utc)
-        pos = (6778137.0, 0.0, 0.0)
-        vel = (0.0, 7668.0, 0.0)
-
-        s = _vec_mag(SchwarzschildForce().acceleration(dt, pos, vel))
-        lt = _vec_mag(LenseThirringForce().acceleration(dt, pos, vel))
-        ds = _vec_mag(DeSitterForce().acceleration(dt, pos, vel))
+        s = _vec_mag(all_relativistic_accels["s"])
+        lt = _vec_mag(all_relativistic_accels["lt"])
+        ds = _vec_mag(all_relativistic_accels["ds"])
 
         assert s > lt
         assert lt > ds or lt > 0  # LT should be measurable
 
-    def test_all_finite(self):
-        from humeris.domain.relativistic_forces import (
-            SchwarzschildForce,
-            LenseThirringForce,
-            DeSitterForce,
-        )
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        pos = (6778137.0, 0.0, 0.0)
-        vel = (0.0, 7668.0, 0.0)
-        for F in [SchwarzschildForce, LenseThirringForce, DeSitterForce]:
-            acc = F().acceleration(dt, pos, vel)
+    def test_all_finite(self, all_relativistic_accels):
+        for acc in all_relativistic_accels.values():
             assert all(math.isfinite(a) for a in acc)
 
 
+_ALLOWED_TOP = frozenset({
+    "math", "numpy", "datetime", "dataclasses", "typing", "json",
+    "pathlib", "os", "functools", "enum", "collections",
+    "abc", "copy", "struct", "bisect", "operator",
+})
+
+
+@functools.lru_cache(maxsize=1)
+def _relativistic_forces_tree() -> ast.Module:
+    """Parse relativistic_forces.py once for all purity checks."""
+    import humeris.domain.relativistic_forces as mod
+
+    with open(mod.__file__, encoding="utf-8") as f:
+        return ast.parse(f.read())
+
+
 class TestDomainPurity:
     def test_no_external_imports(self):
-        import humeris.domain.relativistic_forces as _mod
-        source_path = _mod.__file__
-        with open(source_path, encoding="utf-8") as f:
-            tree = ast.parse(f.read())
-        allowed = {
-            "math", "numpy", "datetime", "dataclasses", "typing", "json",
-            "pathlib", "os", "functools", "enum", "collections",
-            "abc", "copy", "struct", "bisect", "operator",
-        }
-        for node in ast.walk(tree):
+        for node in ast.walk(_relativistic_forces_tree()):
             if isinstance(node, ast.Import):
                 for alias in node.names:
                     top = alias.name.split(".")[0]
-                    assert top in allowed or top == "humeris", \
+                    assert top in _ALLOWED_TOP or top == "humeris", \
                         f"Forbidden import: {alias.name}"
             elif isinstance(node, ast.ImportFrom):
                 if node.module:
                     top = node.module.split(".")[0]
-                    assert top in allowed or top == "humeris", \
+                    assert top in _ALLOWED_TOP or top == "humeris", \
                         f"Forbidden import from: {node.module}"
@@ -5,20 +5,48 @@
 """D-P1-02: Deterministic replay bundle generation and replay."""
 from __future__ import annotations
 
+import hashlib
+import json
 from pathlib import Path
 
 import pytest
 
-from humeris.domain.replay_bundle import create_replay_bundle, replay_bundle
+from humeris.domain.replay_bundle import (
+    create_replay_bundle,
+    replay_bundle,
+    serialize_bundle,
+)
 
+pytestmark = pytest.mark.filterwarnings("error::DeprecationWarning")
 
+
+_INPUTS = {"scenario": "advanced_oumuamua_suncentric", "config": "relative/path.json"}
+_OUTPUTS = {"metric": 1.234}
+_SOFTWARE_REFS = {"constellation_generator": "6fb66bc", "gmat": "d9025c0"}
+
+
+def test_serialize_bundle_is_deterministic():
+    data = serialize_bundle(_INPUTS, _OUTPUTS, _SOFTWARE_REFS)
+    assert data == serialize_bundle(_INPUTS, _OUTPUTS, _SOFTWARE_REFS)
+
+    parsed = json.loads(data)
+    assert parsed["inputs"]["scenario"] == "advanced_oumuamua_suncentric"
+    assert parsed["software_refs"]["gmat"] == "d9025c0"
+
+    bundle_hash = parsed.pop("bundle_hash")
+    encoded = json.dumps(parsed, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    assert bundle_hash == hashlib.sha256(encoded).hexdigest()
+
+
+@pytest.mark.slow
 def test_replay_bundle_roundtrip_is_deterministic(tmp_path: Path):
     path = create_replay_bundle(
         out_dir=tmp_path,
-        inputs={"scenario": "advanced_oumuamua_suncentric", "config": "relative/path.json"},
-        outputs={"metric": 1.234},
-        software_refs={"constellation_generator": "6fb66bc", "gmat": "d9025c0"},
+        inputs=_INPUTS,
+        outputs=_OUTPUTS,
+        software_refs=_SOFTWARE_REFS,
     )
+    assert path.read_bytes() == serialize_bundle(_INPUTS, _OUTPUTS, _SOFTWARE_REFS)
     out = replay_bundle(path)
     assert out["inputs"]["scenario"] == "advanced_oumuamua_suncentric"
     assert out["software_refs"]["gmat"] == "d9025c0"
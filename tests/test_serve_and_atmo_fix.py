@@ -9,6 +9,7 @@ Tests for:
 - R-CLI-02: serve mode pre-loads default shells
 """
 
+import functools
 import math
 import subprocess
 import sys
@@ -20,6 +21,7 @@ import pytest
 from humeris.domain.constellation import ShellConfig, generate_walker_shell
 from humeris.domain.propagation import derive_orbital_state, OrbitalState
 from humeris.adapters.czml_exporter import _satellite_description
+from humeris import cli as humeris_cli
 
 
 EPOCH = datetime(2026, 3, 20, 12, 0, 0, tzinfo=timezone.utc)
@@ -28,58 +30,64 @@ EPOCH = datetime(2026, 3, 20, 12, 0, 0, tzinfo=timezone.utc)
 # === R-ADAPTER-01: CZML exporter altitude range fix ===
 
 
+# Single-satellite shells keyed by altitude: 2200 km is above the
+# atmosphere table max, 550 km is inside it.
+_DESCRIPTION_SHELLS = {
+    2200: ShellConfig(
+        altitude_km=2200,
+        inclination_deg=97.8,
+        num_planes=1,
+        sats_per_plane=1,
+        phase_factor=0,
+        raan_offset_deg=0,
+        shell_name="HighAlt",
+    ),
+    550: ShellConfig(
+        altitude_km=550,
+        inclination_deg=53,
+        num_planes=1,
+        sats_per_plane=1,
+        phase_factor=0,
+        raan_offset_deg=0,
+        shell_name="MidRange",
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def state_cache():
+    """OrbitalState per altitude, derived at most once per module."""
+    @functools.lru_cache(maxsize=None)
+    def _state_for(altitude_km: int) -> OrbitalState:
+        sats = generate_walker_shell(_DESCRIPTION_SHELLS[altitude_km])
+        return derive_orbital_state(sats[0], EPOCH)
+
+    return _state_for
+
+
 class TestCzmlHighAltitude:
     """CZML exporter must not crash for altitudes above atmosphere table."""
 
-    @pytest.fixture
-    def high_altitude_state(self):
-        """OrbitalState at ~2200 km altitude (above atmosphere table max)."""
-        shell = ShellConfig(
-            altitude_km=2200,
-            inclination_deg=97.8,
-            num_planes=1,
-            sats_per_plane=1,
-            phase_factor=0,
-            raan_offset_deg=0,
-            shell_name="HighAlt",
-        )
-        sats = generate_walker_shell(shell)
-        return derive_orbital_state(sats[0], EPOCH)
-
-    def test_description_does_not_raise_for_2200km(self, high_altitude_state):
+    def test_description_does_not_raise_for_2200km(self, state_cache):
         """_satellite_description must not raise ValueError at 2200 km."""
-        desc = _satellite_description(high_altitude_state, EPOCH)
+        desc = _satellite_description(state_cache(2200), EPOCH)
         assert isinstance(desc, str)
         assert len(desc) > 0
 
-    def test_description_contains_html_table(self, high_altitude_state):
-        """Description still produces valid HTML table at high altitude."""
-        desc = _satellite_description(high_altitude_state, EPOCH)
-        assert "<table" in desc
-        assert "Orbit" in desc
-        assert "Altitude" in desc
-
-    def test_description_shows_density_info(self, high_altitude_state):
-        """Density field is present even for out-of-range altitudes."""
-        desc = _satellite_description(high_altitude_state, EPOCH)
-        assert "density" in desc.lower() or "Atm." in desc
-
-    def test_description_at_550km_still_works(self):
-        """Mid-range altitude within atmosphere table range."""
-        shell = ShellConfig(
-            altitude_km=550,
-            inclination_deg=53,
-            num_planes=1,
-            sats_per_plane=1,
-            phase_factor=0,
-            raan_offset_deg=0,
-            shell_name="MidRange",
-        )
-        sats = generate_walker_shell(shell)
-        state = derive_orbital_state(sats[0], EPOCH)
-        desc = _satellite_description(state, EPOCH)
-        assert "<table" in desc
-        assert "kg/m" in desc
+    @pytest.mark.parametrize("altitude_km,expected_substr", [
+        # Valid HTML table at high altitude
+        (2200, "<table"),
+        (2200, "Orbit"),
+        (2200, "Altitude"),
+        # Density field present even for out-of-range altitudes
+        (2200, "Atm. density"),
+        # Mid-range altitude within atmosphere table range
+        (550, "<table"),
+        (550, "kg/m"),
+    ])
+    def test_description_contains(self, state_cache, altitude_km, expected_substr):
+        desc = _satellite_description(state_cache(altitude_km), EPOCH)
+        assert expected_substr in desc
 
 
 # === R-CLI-01: CLI --serve flag ===
@@ -88,41 +96,30 @@ class TestCzmlHighAltitude:
 class TestCliServeFlag:
     """CLI must accept --serve without requiring --input."""
 
-    def test_serve_help_text(self):
-        """'serve' subcommand appears in help output."""
-        result = subprocess.run(
-            [sys.executable, "-m", "humeris.cli", "--help"],
-            capture_output=True, text=True, timeout=10,
-        )
-        assert "serve" in result.stdout
-
-    def test_port_help_text(self):
-        """--port appears in 'serve' subcommand help."""
-        result = subprocess.run(
-            [sys.executable, "-m", "humeris.cli", "serve", "--help"],
-            capture_output=True, text=True, timeout=10,
-        )
-        assert "--port" in result.stdout
+    def test_serve_and_port_help_text(self):
+        """'serve' appears in top-level help; --port in 'serve' help."""
+        parser = humeris_cli.build_parser()
+        assert "serve" in parser.format_help()
+        assert "--port" in humeris_cli._get_subparser(parser, "serve").format_help()
 
     def test_serve_without_input_no_error(self):
         """--serve without --input must not produce argparse error."""
-        script = (
-            "import sys\n"
-            "sys.argv = ['humeris', '--serve']\n"
-            "from unittest.mock import patch\n"
-            "with patch('humeris.cli._run_serve'):\n"
-            "    from humeris.cli import main\n"
-            "    main()\n"
-        )
-        result = subprocess.run(
-            [sys.executable, "-c", script],
-            capture_output=True, text=True, timeout=10,
-        )
-        assert "error: the following arguments are required: --input/-i" not in result.stderr
-        assert result.returncode == 0
+        with patch.object(humeris_cli, "_run_serve") as run_serve, \
+                patch.object(sys, "argv", ["humeris", "--serve"]):
+            humeris_cli.main()
+        run_serve.assert_called_once()
 
     def test_serve_with_port(self):
         """--serve --port 9999 passes port to serve function."""
+        with patch.object(humeris_cli, "_run_serve") as run_serve, \
+                patch.object(sys, "argv", ["humeris", "--serve", "--port", "9999"]):
+            humeris_cli.main()
+        assert run_serve.call_args.kwargs["port"] == 9999
+
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("cli_subprocess")
+    def test_serve_subprocess_smoke(self, subprocess_env):
+        """Real interpreter: legacy --serve reaches the serve entry point."""
         script = (
             "import sys\n"
             "sys.argv = ['humeris', '--serve', '--port', '9999']\n"
@@ -133,8 +130,9 @@ class TestCliServeFlag:
         )
         result = subprocess.run(
             [sys.executable, "-c", script],
-            capture_output=True, text=True, timeout=10,
+            capture_output=True, timeout=10, env=subprocess_env,
         )
+        assert b"error: the following arguments are required: --input/-i" not in result.stderr
         assert result.returncode == 0
 
 
@@ -146,7 +144,7 @@ class TestCliServeDefaults:
 
     def test_default_shells_defined(self):
         """get_default_shells returns shells including 500/450/400 km."""
-        from humeris.cli import get_default_shells
+        from humeris.defaults import get_default_shells
         shells = get_default_shells()
         altitudes = {s.altitude_km for s in shells if s.altitude_km in (500, 450, 400)}
         assert altitudes == {500, 450, 400}
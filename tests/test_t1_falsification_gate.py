@@ -11,66 +11,76 @@ Execution is opt-in to avoid surprising baseline CI:
     HUMERIS_T1_FALSIFY=1 pytest tests/test_t1_falsification_gate.py -q
 """
 
+import dataclasses
 import importlib.util
 import math
 import os
 from datetime import datetime
 
-import numpy as np
 import pytest
 
+_ENABLE = os.getenv("HUMERIS_T1_FALSIFY", "0") == "1"
+if not _ENABLE:
+    # Skip before the numeric imports below so baseline collection stays cheap.
+    pytest.skip(
+        "Set HUMERIS_T1_FALSIFY=1 to run Tier-1 falsification gates.",
+        allow_module_level=True,
+    )
+
+import numpy as np
+
 from humeris.domain.competing_risks import RiskProfile, compute_competing_risks
 from humeris.domain.control_analysis import compute_cw_controllability
 from humeris.domain.functorial_composition import compose_forces
 from humeris.domain.gramian_reconfiguration import compute_fuel_cost_index
-from humeris.domain.hodge_cusum import compute_topology_snapshot, monitor_topology_cusum
+from humeris.domain.hodge_cusum import (
+    compute_topology_snapshot,
+    monitor_topology_cusum,
+)
 
+# Resolved once: find_spec walks every sys.path finder.
+_KSCS_SPEC = importlib.util.find_spec("humeris.domain.koopman_conjunction")
 
-_ENABLE = os.getenv("HUMERIS_T1_FALSIFY", "0") == "1"
-pytestmark = pytest.mark.skipif(
-    not _ENABLE,
-    reason="Set HUMERIS_T1_FALSIFY=1 to run Tier-1 falsification gates.",
-)
 
+class _RowForce:
+    """Constant force reading one row of a shared (N, 3) acceleration array."""
 
-class _ConstantForce:
-    def __init__(self, acc):
-        self._acc = acc
+    def __init__(self, accs, row):
+        self._acc = tuple(accs[row].tolist())
 
     def acceleration(self, epoch, position, velocity):
         return self._acc
 
 
-def _ring_4():
-    return [
-        [0, 1, 0, 1],
-        [1, 0, 1, 0],
-        [0, 1, 0, 1],
-        [1, 0, 1, 0],
-    ]
-
+_RING_4 = np.array([
+    [0, 1, 0, 1],
+    [1, 0, 1, 0],
+    [0, 1, 0, 1],
+    [1, 0, 1, 0],
+], dtype=np.int8)
 
-def _broken_ring_4():
-    return [
-        [0, 1, 0, 0],
-        [1, 0, 1, 0],
-        [0, 1, 0, 1],
-        [0, 0, 1, 0],
-    ]
+_BROKEN_RING_4 = np.array([
+    [0, 1, 0, 0],
+    [1, 0, 1, 0],
+    [0, 1, 0, 1],
+    [0, 0, 1, 0],
+], dtype=np.int8)
 
 
 def test_t1_functorial_superposition_is_exact():
     epoch = datetime(2026, 1, 1)
-    models = [
-        ("a", _ConstantForce((1e-6, 2e-6, -1e-6))),
-        ("b", _ConstantForce((3e-6, -4e-6, 2e-6))),
-        ("c", _ConstantForce((-2e-6, 1e-6, 5e-6))),
-    ]
+    accs = np.array([
+        [1e-6, 2e-6, -1e-6],
+        [3e-6, -4e-6, 2e-6],
+        [-2e-6, 1e-6, 5e-6],
+    ], dtype=np.float64)
+    models = [(name, _RowForce(accs, i)) for i, name in enumerate("abc")]
     result = compose_forces(models, epoch, (0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
-    expected = np.array([2e-6, -1e-6, 6e-6], dtype=np.float64)
-    got = np.array(result.total_acceleration, dtype=np.float64)
+    expected = accs.sum(axis=0)
+    got = np.asarray(result.total_acceleration, dtype=np.float64)
+    diff = got - expected
 
-    assert np.linalg.norm(got - expected) < 1e-18, (
+    assert diff @ diff < 1e-36, (
         "FALSIFIED[T1-01]: functorial composition deviates from exact linear "
         "superposition. Candidate for removal/deprecation."
     )
@@ -79,9 +89,14 @@ def test_t1_functorial_superposition_is_exact():
 
 
 def test_t1_hodge_cusum_rejects_transient_single_tick_change():
-    snapshots = [compute_topology_snapshot(_ring_4(), 4, i) for i in range(20)]
-    snapshots.append(compute_topology_snapshot(_broken_ring_4(), 4, 20))
-    snapshots.extend(compute_topology_snapshot(_ring_4(), 4, i) for i in range(21, 41))
+    # Features depend only on the adjacency, so compute each ring once and
+    # restamp the time index.
+    ring_snap = compute_topology_snapshot(_RING_4, 4, 0)
+    broken_snap = compute_topology_snapshot(_BROKEN_RING_4, 4, 20)
+    snapshots = [
+        broken_snap if i == 20 else dataclasses.replace(ring_snap, time_index=i)
+        for i in range(41)
+    ]
 
     result = monitor_topology_cusum(
         snapshots,
@@ -95,13 +110,16 @@ def test_t1_hodge_cusum_rejects_transient_single_tick_change():
     )
 
 
-def test_t1_gramian_cost_index_separates_cheap_vs_expensive_directions():
+@pytest.fixture(scope="module")
+def cw_analysis():
     # Representative LEO mean motion (~95 min period).
     n_rad_s = 2.0 * math.pi / (95.0 * 60.0)
-    analysis = compute_cw_controllability(n_rad_s=n_rad_s, duration_s=1800.0, step_s=10.0)
+    return compute_cw_controllability(n_rad_s=n_rad_s, duration_s=1800.0, step_s=10.0)
+
 
-    cheap_cost = compute_fuel_cost_index(analysis.max_energy_direction, analysis)
-    expensive_cost = compute_fuel_cost_index(analysis.min_energy_direction, analysis)
+def test_t1_gramian_cost_index_separates_cheap_vs_expensive_directions(cw_analysis):
+    cheap_cost = compute_fuel_cost_index(cw_analysis.max_energy_direction, cw_analysis)
+    expensive_cost = compute_fuel_cost_index(cw_analysis.min_energy_direction, cw_analysis)
 
     assert cheap_cost < 1.0, (
         "FALSIFIED[T1-03]: Gramian method does not identify a below-average "
@@ -118,7 +136,7 @@ def test_t1_gramian_cost_index_separates_cheap_vs_expensive_directions():
 
 
 def test_t1_koopman_kscs_removed_after_falsification_decision():
-    assert importlib.util.find_spec("humeris.domain.koopman_conjunction") is None, (
+    assert _KSCS_SPEC is None, (
         "FALSIFIED[T1-04]: KSCS module still present after removal decision."
     )
 
@@ -131,7 +149,9 @@ def test_t1_competing_risks_prevents_probability_mass_violation():
         RiskProfile(name="risk_b", hazard_rates=(hazard_per_day,), is_constant=True),
     ]
 
-    result = compute_competing_risks(risks, duration_years=5.0, dt_years=0.01)
+    # Constant hazards integrate exactly under the trapezoid rule, so a
+    # coarse grid gives the same survival as a fine one.
+    result = compute_competing_risks(risks, duration_years=5.0, dt_years=0.1)
     final_survival = float(result.overall_survival[-1])
     competing_total_failure = 1.0 - final_survival
 
@@ -139,6 +159,7 @@ def test_t1_competing_risks_prevents_probability_mass_violation():
     naive_sum = single_fail + single_fail
 
     assert naive_sum > 1.0  # sanity check for baseline failure mode
+    assert abs(final_survival - math.exp(-2.0 * 5.0)) < 1e-12  # S(t) = exp(-2ht)
     assert competing_total_failure <= 1.0 + 1e-12, (
         "FALSIFIED[T1-05]: competing-risks output violates probability mass."
     )
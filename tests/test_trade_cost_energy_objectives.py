@@ -5,6 +5,8 @@
 """D-P2-02: Mission-performance vs compute-cost Pareto frontier."""
 from __future__ import annotations
 
+import numpy as np
+
 from humeris.domain.trade_cost_energy import CostEnergyPoint, pareto_front_cost_energy
 
 
@@ -18,3 +20,37 @@ def test_cost_energy_pareto_front_contains_non_dominated_points():
     front = pareto_front_cost_energy(points)
     assert 3 not in front
     assert len(front) >= 2
+    assert front == _pareto_oracle(points)
+
+
+def _pareto_oracle(points: list[CostEnergyPoint]) -> list[int]:
+    """Non-dominated indices via NumPy broadcast (all columns maximized)."""
+    arr = np.array([
+        [p.mission_performance, -p.compute_cost_usd, -p.energy_kwh, -p.runtime_s]
+        for p in points
+    ], dtype=np.float64)
+    ge = (arr[:, None, :] >= arr[None, :, :]).all(axis=2)
+    gt = (arr[:, None, :] > arr[None, :, :]).any(axis=2)
+    dominated = (ge & gt).any(axis=0)  # [j, i]: j dominates i
+    return np.flatnonzero(~dominated).tolist()
+
+
+def _random_points(rng: np.random.Generator, n: int) -> list[CostEnergyPoint]:
+    objectives = rng.uniform(
+        low=[0.0, 1.0, 0.5, 10.0], high=[1.0, 20.0, 5.0, 200.0], size=(n, 4),
+    )
+    return [CostEnergyPoint(*row) for row in objectives.tolist()]
+
+
+def test_cost_energy_pareto_front_matches_dominance_on_random_sets():
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        points = _random_points(rng, int(rng.integers(2, 30)))
+        front = pareto_front_cost_energy(points)
+        assert front
+        assert front == _pareto_oracle(points)
+
+
+def test_cost_energy_pareto_front_matches_oracle_at_scale():
+    points = _random_points(np.random.default_rng(1), 1000)
+    assert pareto_front_cost_energy(points) == _pareto_oracle(points)
@@ -1,35 +1,39 @@
 # Copyright (c) 2026 Jeroen Visser. All rights reserved.
 # Licensed under the MIT License — see LICENSE.
 """Tests for humeris.version module."""
+import importlib.metadata
+import re
 import unittest
 
+_SEMVER_RE = re.compile(r"\d+(?:\.\d+)+")
+
 
 class TestVersion(unittest.TestCase):
     """Verify version module reads from installed metadata."""
 
-    def test_version_is_string(self):
+    @classmethod
+    def setUpClass(cls):
         from humeris.version import __version__
-        self.assertIsInstance(__version__, str)
+        cls.version = __version__
+        cls.expected = importlib.metadata.version("humeris-core")
+
+    def test_version_is_string(self):
+        self.assertIsInstance(self.version, str)
 
     def test_version_not_fallback(self):
         """Installed package should have a real version, not the fallback."""
-        from humeris.version import __version__
-        self.assertNotEqual(__version__, "0.0.0")
+        self.assertNotEqual(self.version, "0.0.0")
 
     def test_version_matches_pyproject(self):
         """Version must match what pyproject.toml declares."""
-        from humeris.version import __version__
-        import importlib.metadata
-        expected = importlib.metadata.version("humeris-core")
-        self.assertEqual(__version__, expected)
+        self.assertEqual(self.version, self.expected)
 
     def test_version_semver_format(self):
         """Version should be a valid semver-like string."""
-        from humeris.version import __version__
-        parts = __version__.split(".")
-        self.assertGreaterEqual(len(parts), 2)
-        for part in parts:
-            self.assertTrue(part.isdigit(), f"Non-numeric version part: {part}")
+        self.assertIsNotNone(
+            _SEMVER_RE.fullmatch(self.version),
+            f"Not a dotted numeric version: {self.version}",
+        )
 
 
 if __name__ == "__main__":
@@ -6,40 +6,79 @@
 
 HTTP server serving Cesium viewer with on-demand CZML generation,
 dynamic constellation management, and analysis layer control.
+
+The HTTP tests share one server per pytest process on an OS-assigned
+loopback port, so the file parallelizes under pytest-xdist:
+
+    pytest -n auto tests/test_viewer_server.py
 """
 
 import ast
+import functools
 import json
 import sys
 import threading
-import time
 import urllib.request
 import urllib.error
 from datetime import datetime, timedelta, timezone
-from http.client import HTTPResponse
+from http.client import HTTPConnection, HTTPResponse
 from unittest.mock import patch
 
 import pytest
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 from humeris.domain.constellation import (
     ShellConfig,
     generate_walker_shell,
 )
-from humeris.domain.propagation import derive_orbital_state
+from humeris.domain.propagation import (
+    derive_orbital_state,
+    derive_orbital_states_batch,
+)
 
 
 EPOCH = datetime(2026, 3, 20, 12, 0, 0, tzinfo=timezone.utc)
 
+# Clients dial IPv4 loopback directly: the server binds "localhost" as
+# AF_INET, and resolving "localhost" can try ::1 first.
+_HOST = "127.0.0.1"
 
-def _make_states(n_planes=2, n_sats=2, altitude_km=550):
-    """Create a small set of orbital states for testing."""
+
+@functools.lru_cache(maxsize=None)
+def _cached_states(n_planes, n_sats, altitude_km):
     shell = ShellConfig(
         altitude_km=altitude_km, inclination_deg=53,
         num_planes=n_planes, sats_per_plane=n_sats,
         phase_factor=1, raan_offset_deg=0, shell_name="Test",
     )
     sats = generate_walker_shell(shell)
-    return [derive_orbital_state(s, EPOCH) for s in sats]
+    return tuple(derive_orbital_states_batch(sats, EPOCH))
+
+
+def _make_states(n_planes=2, n_sats=2, altitude_km=550):
+    """Create a small set of orbital states for testing.
+
+    States are derived once per parameter set; OrbitalState is frozen, so
+    each caller gets a fresh list over the shared instances.
+    """
+    return list(_cached_states(n_planes, n_sats, altitude_km))
+
+
+@pytest.fixture
+def small_states():
+    """4 sats (2 planes x 2) at 550 km."""
+    return _make_states()
+
+
+@pytest.fixture
+def large_states():
+    """120 sats (6 planes x 20): above the topology/precession caps."""
+    return _make_states(n_planes=6, n_sats=20)
 
 
 # ---------------------------------------------------------------------------
@@ -50,7 +89,7 @@ def _make_states(n_planes=2, n_sats=2, altitude_km=550):
 class TestLayerState:
     """Tests for LayerState dataclass."""
 
-    def test_layer_state_creation(self):
+    def test_layer_state_creation(self, small_states):
         from humeris.adapters.viewer_server import LayerState
         layer = LayerState(
             layer_id="walker-1",
@@ -59,7 +98,7 @@ class TestLayerState:
             layer_type="walker",
             mode="animated",
             visible=True,
-            states=_make_states(),
+            states=small_states,
             params={"altitude_km": 550},
             czml=[{"id": "document", "version": "1.0"}],
         )
@@ -93,13 +132,13 @@ class TestLayerState:
 class TestLayerManager:
     """Tests for layer management functions."""
 
-    def test_add_layer(self):
+    def test_add_layer(self, small_states):
         from humeris.adapters.viewer_server import (
             LayerManager,
             LayerState,
         )
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         layer_id = mgr.add_layer(
             name="Constellation:Walker",
             category="Constellation",
@@ -110,11 +149,11 @@ class TestLayerManager:
         assert layer_id is not None
         assert layer_id in mgr.layers
 
-    def test_add_layer_auto_mode_animated_small(self):
+    def test_add_layer_auto_mode_animated_small(self, small_states):
         """<=100 sats default to animated mode."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=2, n_sats=2)  # 4 sats
+        states = small_states  # 4 sats
         layer_id = mgr.add_layer(
             name="Constellation:Small",
             category="Constellation",
@@ -124,11 +163,11 @@ class TestLayerManager:
         )
         assert mgr.layers[layer_id].mode == "animated"
 
-    def test_add_layer_auto_mode_snapshot_large(self):
+    def test_add_layer_auto_mode_snapshot_large(self, large_states):
         """>100 sats default to snapshot mode."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=6, n_sats=20)  # 120 sats
+        states = large_states  # 120 sats
         layer_id = mgr.add_layer(
             name="Constellation:Large",
             category="Constellation",
@@ -138,11 +177,11 @@ class TestLayerManager:
         )
         assert mgr.layers[layer_id].mode == "snapshot"
 
-    def test_add_layer_explicit_mode(self):
+    def test_add_layer_explicit_mode(self, small_states):
         """Explicit mode overrides auto-detection."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         layer_id = mgr.add_layer(
             name="Test",
             category="Constellation",
@@ -153,11 +192,11 @@ class TestLayerManager:
         )
         assert mgr.layers[layer_id].mode == "snapshot"
 
-    def test_add_layer_generates_czml(self):
+    def test_add_layer_generates_czml(self, small_states):
         """Adding a layer generates CZML packets."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         layer_id = mgr.add_layer(
             name="Constellation:Walker",
             category="Constellation",
@@ -169,10 +208,10 @@ class TestLayerManager:
         assert len(czml) > 0
         assert czml[0]["id"] == "document"
 
-    def test_remove_layer(self):
+    def test_remove_layer(self, small_states):
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         layer_id = mgr.add_layer(
             name="Test", category="Test", layer_type="walker",
             states=states, params={},
@@ -187,10 +226,26 @@ class TestLayerManager:
         with pytest.raises(KeyError):
             mgr.remove_layer("nonexistent")
 
-    def test_update_layer_visibility(self):
+    def test_clear_layers(self, small_states):
+        from humeris.adapters.viewer_server import LayerManager
+        mgr = LayerManager(epoch=EPOCH)
+        for _ in range(2):
+            mgr.add_layer(
+                name="Test", category="Test", layer_type="walker",
+                states=small_states, params={}, mode="snapshot",
+            )
+        mgr.clear_layers()
+        assert mgr.layers == {}
+        layer_id = mgr.add_layer(
+            name="Test", category="Test", layer_type="walker",
+            states=small_states, params={}, mode="snapshot",
+        )
+        assert layer_id == "layer-1"
+
+    def test_update_layer_visibility(self, small_states):
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         layer_id = mgr.add_layer(
             name="Test", category="Test", layer_type="walker",
             states=states, params={},
@@ -198,11 +253,11 @@ class TestLayerManager:
         mgr.update_layer(layer_id, visible=False)
         assert mgr.layers[layer_id].visible is False
 
-    def test_update_layer_mode_regenerates_czml(self):
+    def test_update_layer_mode_regenerates_czml(self, small_states):
         """Switching mode regenerates CZML."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         layer_id = mgr.add_layer(
             name="Constellation:Test",
             category="Constellation",
@@ -224,11 +279,11 @@ class TestLayerManager:
         with pytest.raises(KeyError):
             mgr.update_layer("nonexistent", visible=False)
 
-    def test_get_state_returns_all_layers_metadata(self):
+    def test_get_state_returns_all_layers_metadata(self, small_states):
         """get_state() returns layer metadata without CZML data."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         mgr.add_layer(
             name="Constellation:A", category="Constellation",
             layer_type="walker", states=states, params={},
@@ -249,10 +304,10 @@ class TestLayerManager:
             # No CZML data in state response
             assert "czml" not in layer_info
 
-    def test_get_czml_for_layer(self):
+    def test_get_czml_for_layer(self, small_states):
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         layer_id = mgr.add_layer(
             name="Test", category="Test", layer_type="walker",
             states=states, params={},
@@ -268,11 +323,11 @@ class TestLayerManager:
         with pytest.raises(KeyError):
             mgr.get_czml("nonexistent")
 
-    def test_unique_layer_ids(self):
+    def test_unique_layer_ids(self, small_states):
         """Each add_layer call produces a unique ID."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         ids = set()
         for i in range(5):
             layer_id = mgr.add_layer(
@@ -288,115 +343,128 @@ class TestLayerManager:
 # ---------------------------------------------------------------------------
 
 
+# (layer_type, mode, params, min_packets, generator): one layer per case,
+# built lazily and shared by every test that inspects it. mode=None keeps
+# the manager's default mode selection. generator is the packet function
+# _generate_czml routes the case to.
+_DISPATCH_CASES = [
+    ("walker", "snapshot", {}, 2, "snapshot_packets"),
+    ("walker", "animated", {}, 2, "constellation_packets"),
+    ("eclipse", "snapshot", {}, 1, "eclipse_snapshot_packets"),
+    ("eclipse", "animated", {}, 1, "eclipse_constellation_packets"),
+    ("coverage", "snapshot", {"lat_step_deg": 30.0, "lon_step_deg": 30.0}, 1,
+     "coverage_packets"),
+    ("ground_track", "snapshot", {}, 1, "ground_track_packets"),
+    ("sensor", None, {}, 2, "sensor_footprint_packets"),
+    ("isl", None, {}, 2, "isl_topology_packets"),
+    ("fragility", None, {}, 2, "fragility_constellation_packets"),
+    ("hazard", None, {}, 2, "hazard_evolution_packets"),
+    ("network_eclipse", None, {}, 2, "network_eclipse_packets"),
+    ("coverage_connectivity", None, {}, 1, "coverage_connectivity_packets"),
+    ("precession", None, {}, 2, "constellation_packets"),
+    ("conjunction", None, {}, 2, "conjunction_replay_packets"),
+]
+_DISPATCH_IDS = [f"{t}-{m or 'default'}" for t, m, *_ in _DISPATCH_CASES]
+_STUB_CZML = [{"id": "document"}, {"id": "stub"}]
+
+_DISPATCH_PARAMS = {(t, m): p for t, m, p, *_ in _DISPATCH_CASES}
+
+
+@pytest.fixture(scope="module")
+def czml_layers():
+    """Return czml_for(layer_type, mode): CZML from one shared LayerManager.
+
+    Each (layer_type, mode) layer is added at most once per module.
+    """
+    from humeris.adapters.viewer_server import LayerManager
+    mgr = LayerManager(epoch=EPOCH)
+    states = _make_states()
+    layer_ids = {}
+
+    def czml_for(layer_type, mode):
+        key = (layer_type, mode)
+        if key not in layer_ids:
+            kwargs = {} if mode is None else {"mode": mode}
+            layer_ids[key] = mgr.add_layer(
+                name=f"Test:{layer_type}",
+                category="Constellation" if layer_type == "walker" else "Analysis",
+                layer_type=layer_type,
+                states=states,
+                params=dict(_DISPATCH_PARAMS[key]),
+                **kwargs,
+            )
+        return mgr.layers[layer_ids[key]].czml
+
+    return czml_for
+
+
+@pytest.fixture
+def stub_generators(monkeypatch):
+    """Replace every dispatched packet generator with a two-packet stub.
+
+    Returns a dict of generator name -> Mock so tests can check routing.
+    """
+    from unittest.mock import Mock
+    import humeris.adapters.viewer_server as viewer_server
+    stubs = {}
+    for *_, generator in _DISPATCH_CASES:
+        if generator not in stubs:
+            stubs[generator] = Mock(return_value=_STUB_CZML)
+            monkeypatch.setattr(viewer_server, generator, stubs[generator])
+    return stubs
+
+
 class TestCzmlDispatch:
     """Tests for CZML generation dispatch based on layer type and mode."""
 
-    def test_walker_snapshot_dispatch(self):
-        from humeris.adapters.viewer_server import LayerManager
-        mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        layer_id = mgr.add_layer(
-            name="Constellation:Walker",
-            category="Constellation",
-            layer_type="walker",
-            states=states,
-            params={},
-            mode="snapshot",
-        )
-        czml = mgr.layers[layer_id].czml
-        # Snapshot packets: document + 1 per sat, no path/interpolation
+    @pytest.mark.parametrize(
+        "layer_type,mode,generator",
+        [(t, m, g) for t, m, *_, g in _DISPATCH_CASES],
+        ids=_DISPATCH_IDS,
+    )
+    def test_dispatch(self, stub_generators, small_states, layer_type, mode, generator):
+        """Each (layer_type, mode) is routed to its packet generator."""
+        from humeris.adapters.viewer_server import _generate_czml
+        czml = _generate_czml(
+            layer_type, mode, small_states, EPOCH, "Test",
+            dict(_DISPATCH_PARAMS[(layer_type, mode)]),
+        )
+        assert czml == _STUB_CZML
+        called = [name for name, stub in stub_generators.items() if stub.called]
+        assert called == [generator]
+
+    @pytest.mark.parametrize(
+        "layer_type,mode,min_packets",
+        [
+            pytest.param(
+                t, m, n,
+                marks=pytest.mark.slow if t == "coverage_connectivity" else (),
+            )
+            for t, m, _, n, _ in _DISPATCH_CASES
+        ],
+        ids=_DISPATCH_IDS,
+    )
+    def test_generator_smoke(self, czml_layers, layer_type, mode, min_packets):
+        """Unmocked end-to-end: the real generator yields a CZML document."""
+        czml = czml_layers(layer_type, mode)
+        assert len(czml) >= min_packets
         assert czml[0]["id"] == "document"
+
+    def test_walker_snapshot_packets(self, czml_layers):
         # Snapshot points use point.pixelSize, not path
-        sat_packet = czml[1]
+        sat_packet = czml_layers("walker", "snapshot")[1]
         assert "point" in sat_packet
         assert "position" in sat_packet
 
-    def test_walker_animated_dispatch(self):
-        from humeris.adapters.viewer_server import LayerManager
-        mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        layer_id = mgr.add_layer(
-            name="Constellation:Walker",
-            category="Constellation",
-            layer_type="walker",
-            states=states,
-            params={},
-            mode="animated",
-        )
-        czml = mgr.layers[layer_id].czml
-        assert czml[0]["id"] == "document"
+    def test_walker_animated_packets(self, czml_layers):
         # Animated packets have time-varying position (cartographicDegrees array)
-        sat_packet = czml[1]
+        sat_packet = czml_layers("walker", "animated")[1]
         assert "position" in sat_packet
 
-    def test_eclipse_snapshot_dispatch(self):
+    def test_ground_station_layer(self, small_states):
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        layer_id = mgr.add_layer(
-            name="Analysis:Eclipse",
-            category="Analysis",
-            layer_type="eclipse",
-            states=states,
-            params={},
-            mode="snapshot",
-        )
-        czml = mgr.layers[layer_id].czml
-        assert len(czml) > 0
-        assert czml[0]["id"] == "document"
-
-    def test_eclipse_animated_dispatch(self):
-        from humeris.adapters.viewer_server import LayerManager
-        mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        layer_id = mgr.add_layer(
-            name="Analysis:Eclipse",
-            category="Analysis",
-            layer_type="eclipse",
-            states=states,
-            params={},
-            mode="animated",
-        )
-        czml = mgr.layers[layer_id].czml
-        assert len(czml) > 0
-        assert czml[0]["id"] == "document"
-
-    def test_coverage_dispatch(self):
-        from humeris.adapters.viewer_server import LayerManager
-        mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        layer_id = mgr.add_layer(
-            name="Analysis:Coverage",
-            category="Analysis",
-            layer_type="coverage",
-            states=states,
-            params={"lat_step_deg": 30.0, "lon_step_deg": 30.0},
-            mode="snapshot",
-        )
-        czml = mgr.layers[layer_id].czml
-        assert len(czml) > 0
-        assert czml[0]["id"] == "document"
-
-    def test_ground_track_dispatch(self):
-        from humeris.adapters.viewer_server import LayerManager
-        mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        layer_id = mgr.add_layer(
-            name="Analysis:GroundTrack",
-            category="Analysis",
-            layer_type="ground_track",
-            states=states,
-            params={},
-            mode="snapshot",
-        )
-        czml = mgr.layers[layer_id].czml
-        assert len(czml) > 0
-        assert czml[0]["id"] == "document"
-
-    def test_ground_station_layer(self):
-        from humeris.adapters.viewer_server import LayerManager
-        mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         layer_id = mgr.add_ground_station(
             name="Svalbard",
             lat_deg=78.23,
@@ -408,110 +476,6 @@ class TestCzmlDispatch:
         assert layer.category == "Ground Station"
         assert len(layer.czml) > 0
 
-    def test_sensor_dispatch(self):
-        """Sensor footprint layer generates CZML with entity packets."""
-        from humeris.adapters.viewer_server import LayerManager
-        mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        layer_id = mgr.add_layer(
-            name="Analysis:Sensor", category="Analysis",
-            layer_type="sensor", states=states, params={},
-        )
-        czml = mgr.layers[layer_id].czml
-        assert len(czml) > 1
-        assert czml[0]["id"] == "document"
-
-    def test_isl_dispatch(self):
-        """ISL topology layer generates CZML with entity packets."""
-        from humeris.adapters.viewer_server import LayerManager
-        mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        layer_id = mgr.add_layer(
-            name="Analysis:ISL", category="Analysis",
-            layer_type="isl", states=states, params={},
-        )
-        czml = mgr.layers[layer_id].czml
-        assert len(czml) > 1
-        assert czml[0]["id"] == "document"
-
-    def test_fragility_dispatch(self):
-        """Fragility layer generates CZML with entity packets."""
-        from humeris.adapters.viewer_server import LayerManager
-        mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        layer_id = mgr.add_layer(
-            name="Analysis:Fragility", category="Analysis",
-            layer_type="fragility", states=states, params={},
-        )
-        czml = mgr.layers[layer_id].czml
-        assert len(czml) > 1
-        assert czml[0]["id"] == "document"
-
-    def test_hazard_dispatch(self):
-        """Hazard evolution layer generates CZML with entity packets."""
-        from humeris.adapters.viewer_server import LayerManager
-        mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        layer_id = mgr.add_layer(
-            name="Analysis:Hazard", category="Analysis",
-            layer_type="hazard", states=states, params={},
-        )
-        czml = mgr.layers[layer_id].czml
-        assert len(czml) > 1
-        assert czml[0]["id"] == "document"
-
-    def test_network_eclipse_dispatch(self):
-        """Network eclipse layer generates CZML with entity packets."""
-        from humeris.adapters.viewer_server import LayerManager
-        mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        layer_id = mgr.add_layer(
-            name="Analysis:Network Eclipse", category="Analysis",
-            layer_type="network_eclipse", states=states, params={},
-        )
-        czml = mgr.layers[layer_id].czml
-        assert len(czml) > 1
-        assert czml[0]["id"] == "document"
-
-    def test_coverage_connectivity_dispatch(self):
-        """Coverage connectivity layer generates CZML (doc + possible entities)."""
-        from humeris.adapters.viewer_server import LayerManager
-        mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        layer_id = mgr.add_layer(
-            name="Analysis:Coverage Connectivity", category="Analysis",
-            layer_type="coverage_connectivity", states=states, params={},
-        )
-        czml = mgr.layers[layer_id].czml
-        assert len(czml) >= 1
-        assert czml[0]["id"] == "document"
-
-    def test_precession_dispatch(self):
-        """Precession layer generates CZML with entity packets."""
-        from humeris.adapters.viewer_server import LayerManager
-        mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        layer_id = mgr.add_layer(
-            name="Analysis:Precession", category="Analysis",
-            layer_type="precession", states=states, params={},
-        )
-        czml = mgr.layers[layer_id].czml
-        assert len(czml) > 1
-        assert czml[0]["id"] == "document"
-
-    def test_conjunction_dispatch(self):
-        """Conjunction replay layer generates CZML with entity packets."""
-        from humeris.adapters.viewer_server import LayerManager
-        mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        layer_id = mgr.add_layer(
-            name="Analysis:Conjunction", category="Analysis",
-            layer_type="conjunction", states=states, params={},
-        )
-        czml = mgr.layers[layer_id].czml
-        assert len(czml) > 1
-        assert czml[0]["id"] == "document"
-
 
 # ---------------------------------------------------------------------------
 # HTTP server + API
@@ -519,7 +483,7 @@ class TestCzmlDispatch:
 
 
 def _start_server(port):
-    """Start viewer server on given port, return (server, thread)."""
+    """Start viewer server on given port, return (server, manager)."""
     from humeris.adapters.viewer_server import (
         create_viewer_server,
         LayerManager,
@@ -527,54 +491,111 @@ def _start_server(port):
     mgr = LayerManager(epoch=EPOCH)
     server = create_viewer_server(mgr, port=port)
     thread = threading.Thread(target=server.serve_forever, daemon=True)
+    # HTTPServer.__init__ binds and listens synchronously; connections made
+    # before serve_forever() starts wait in the backlog, so no readiness check.
     thread.start()
-    # Wait for server to be ready
-    for _ in range(50):
-        try:
-            urllib.request.urlopen(f"http://localhost:{port}/api/state", timeout=1)
-            break
-        except (urllib.error.URLError, ConnectionRefusedError):
-            time.sleep(0.05)
     return server, mgr
 
 
-def _api_request(port, method, path, body=None, timeout=30):
-    """Make HTTP request to server, return (status, parsed_json_or_text)."""
-    url = f"http://localhost:{port}{path}"
+# One client connection per (thread, server port), reused across requests.
+# The server keeps HTTP/1.1 connections alive; when it does close one
+# (error responses, unread request bodies) http.client reconnects on the
+# next request.
+_CONNECTIONS: list[HTTPConnection] = []
+_thread_conns = threading.local()
+
+
+def _connection(port) -> HTTPConnection:
+    conns = _thread_conns.__dict__.setdefault("by_port", {})
+    conn = conns.get(port)
+    if conn is None:
+        conn = conns[port] = HTTPConnection(_HOST, port)
+        _CONNECTIONS.append(conn)
+    return conn
+
+
+def _api_request(port, method, path, body=None, timeout=30, *, parse=True):
+    """Make HTTP request to server, return (status, parsed_json_or_text).
+
+    With parse=False the body is drained (the response must still be read)
+    but not decoded, and (status, None) is returned.
+    """
+    conn = _connection(port)
+    conn.timeout = timeout
     data = json.dumps(body).encode() if body is not None else None
-    req = urllib.request.Request(url, data=data, method=method)
-    if data is not None:
-        req.add_header("Content-Type", "application/json")
+    headers = {"Content-Type": "application/json"} if data is not None else {}
     try:
-        resp = urllib.request.urlopen(req, timeout=timeout)
-        content = resp.read().decode()
-        try:
-            return resp.status, json.loads(content)
-        except json.JSONDecodeError:
-            return resp.status, content
-    except urllib.error.HTTPError as e:
-        content = e.read().decode()
-        try:
-            return e.code, json.loads(content)
-        except json.JSONDecodeError:
-            return e.code, content
+        conn.request(method, path, body=data, headers=headers)
+        resp = conn.getresponse()
+        content = resp.read()
+    except Exception:
+        conn.close()
+        raise
+    if not parse:
+        return resp.status, None
+    try:
+        return resp.status, _loads(content)
+    except ValueError:
+        return resp.status, content.decode()
 
 
-@pytest.fixture
-def server_port():
-    """Find a free port for testing."""
+_WALKER_PARAMS = {
+    "altitude_km": 550, "inclination_deg": 53,
+    "num_planes": 2, "sats_per_plane": 2,
+    "phase_factor": 1, "raan_offset_deg": 0,
+}
+
+
+def _walker(shell_name, **overrides):
+    """POST /api/constellation body for a small Walker shell."""
+    return {
+        "type": "walker",
+        "params": {**_WALKER_PARAMS, "shell_name": shell_name, **overrides},
+    }
+
+
+@pytest.fixture(scope="session")
+def _http_server():
+    """One viewer server per pytest process on a free port; yields (server, port).
+
+    Under pytest-xdist each worker is its own process, so each gets its own
+    server and nothing is shared across workers. The probed port can be
+    taken by another worker before the server binds it; retry on a fresh
+    port when that happens.
+    """
     import socket
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(("", 0))
-        return s.getsockname()[1]
+    for attempt in range(5):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind((_HOST, 0))
+            port = s.getsockname()[1]
+        try:
+            server, _ = _start_server(port)
+            break
+        except OSError:
+            if attempt == 4:
+                raise
+    assert server.socket.getsockname()[1] == port
+    yield server, port
+    for conn in _CONNECTIONS:
+        conn.close()
+    _CONNECTIONS.clear()
+    server.shutdown()
+    server.server_close()
 
 
 @pytest.fixture
-def running_server(server_port):
-    """Start server, yield (port, manager), shutdown after test."""
-    server, mgr = _start_server(server_port)
-    yield server_port, mgr
-    server.shutdown()
+def running_server(_http_server):
+    """Yield (port, manager) with a fresh LayerManager bound to the shared server.
+
+    The socket and serve thread are created once per session; only the
+    manager is replaced per test, which also resets duration/step settings
+    and constraints that clear_layers() would leave behind.
+    """
+    from humeris.adapters.viewer_server import LayerManager
+    server, port = _http_server
+    mgr = LayerManager(epoch=EPOCH)
+    server.RequestHandlerClass.layer_manager = mgr
+    yield port, mgr
 
 
 class TestHttpApi:
@@ -594,18 +615,7 @@ class TestHttpApi:
 
     def test_post_constellation_walker(self, running_server):
         port, mgr = running_server
-        status, body = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550,
-                "inclination_deg": 53,
-                "num_planes": 2,
-                "sats_per_plane": 2,
-                "phase_factor": 1,
-                "raan_offset_deg": 0,
-                "shell_name": "Test-Walker",
-            },
-        })
+        status, body = _api_request(port, "POST", "/api/constellation", _walker("Test-Walker"))
         assert status == 201
         assert "layer_id" in body
 
@@ -617,15 +627,7 @@ class TestHttpApi:
     def test_post_analysis_eclipse(self, running_server):
         port, mgr = running_server
         # First add a constellation as source
-        status, body = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 2, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "Source",
-            },
-        })
+        status, body = _api_request(port, "POST", "/api/constellation", _walker("Source"))
         source_id = body["layer_id"]
 
         # Add eclipse analysis
@@ -640,15 +642,7 @@ class TestHttpApi:
     def test_post_ground_station(self, running_server):
         port, mgr = running_server
         # Need a constellation for ground station access computation
-        _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 2, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "Src",
-            },
-        })
+        _api_request(port, "POST", "/api/constellation", _walker("Src"))
         status, body = _api_request(port, "POST", "/api/ground-station", {
             "name": "Svalbard",
             "lat": 78.23,
@@ -659,15 +653,7 @@ class TestHttpApi:
 
     def test_get_czml_for_layer(self, running_server):
         port, mgr = running_server
-        status, body = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 2, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "Test",
-            },
-        })
+        status, body = _api_request(port, "POST", "/api/constellation", _walker("Test"))
         layer_id = body["layer_id"]
         status, czml = _api_request(port, "GET", f"/api/czml/{layer_id}")
         assert status == 200
@@ -676,15 +662,7 @@ class TestHttpApi:
 
     def test_put_layer_update_mode(self, running_server):
         port, mgr = running_server
-        status, body = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 2, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "Test",
-            },
-        })
+        status, body = _api_request(port, "POST", "/api/constellation", _walker("Test"))
         layer_id = body["layer_id"]
         status, body = _api_request(port, "PUT", f"/api/layer/{layer_id}", {
             "mode": "snapshot",
@@ -694,15 +672,7 @@ class TestHttpApi:
 
     def test_put_layer_update_visibility(self, running_server):
         port, mgr = running_server
-        status, body = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 2, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "Test",
-            },
-        })
+        status, body = _api_request(port, "POST", "/api/constellation", _walker("Test"))
         layer_id = body["layer_id"]
         status, body = _api_request(port, "PUT", f"/api/layer/{layer_id}", {
             "visible": False,
@@ -712,17 +682,9 @@ class TestHttpApi:
 
     def test_delete_layer(self, running_server):
         port, mgr = running_server
-        status, body = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 2, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "Test",
-            },
-        })
+        status, body = _api_request(port, "POST", "/api/constellation", _walker("Test"))
         layer_id = body["layer_id"]
-        status, body = _api_request(port, "DELETE", f"/api/layer/{layer_id}")
+        status, _ = _api_request(port, "DELETE", f"/api/layer/{layer_id}", parse=False)
         assert status == 200
 
         # Verify removed
@@ -731,35 +693,35 @@ class TestHttpApi:
 
     def test_get_czml_nonexistent_returns_404(self, running_server):
         port, mgr = running_server
-        status, body = _api_request(port, "GET", "/api/czml/nonexistent")
+        status, _ = _api_request(port, "GET", "/api/czml/nonexistent", parse=False)
         assert status == 404
 
     def test_delete_nonexistent_returns_404(self, running_server):
         port, mgr = running_server
-        status, body = _api_request(port, "DELETE", "/api/layer/nonexistent")
+        status, _ = _api_request(port, "DELETE", "/api/layer/nonexistent", parse=False)
         assert status == 404
 
     def test_post_constellation_invalid_type_returns_400(self, running_server):
         port, mgr = running_server
-        status, body = _api_request(port, "POST", "/api/constellation", {
+        status, _ = _api_request(port, "POST", "/api/constellation", {
             "type": "invalid_type",
             "params": {},
-        })
+        }, parse=False)
         assert status == 400
 
     def test_post_analysis_missing_source_returns_400(self, running_server):
         port, mgr = running_server
-        status, body = _api_request(port, "POST", "/api/analysis", {
+        status, _ = _api_request(port, "POST", "/api/analysis", {
             "type": "eclipse",
             "source_layer": "nonexistent",
             "params": {},
-        })
+        }, parse=False)
         assert status == 404
 
     def test_cors_headers_present(self, running_server):
         """CORS headers allow local browser access."""
         port, mgr = running_server
-        url = f"http://localhost:{port}/api/state"
+        url = f"http://{_HOST}:{port}/api/state"
         resp = urllib.request.urlopen(url, timeout=5)
         assert resp.headers.get("Access-Control-Allow-Origin") == f"http://localhost:{port}"
 
@@ -768,6 +730,39 @@ class TestHttpApi:
         status, body = _api_request(port, "GET", "/api/state")
         assert "epoch" in body
 
+    def test_connection_kept_alive(self, running_server):
+        """Sequential requests reuse one socket and carry Content-Length."""
+        port, mgr = running_server
+        conn = HTTPConnection(_HOST, port, timeout=5)
+        try:
+            conn.request("GET", "/api/state")
+            resp = conn.getresponse()
+            body = resp.read()
+            assert resp.version == 11
+            assert int(resp.headers["Content-Length"]) == len(body)
+            sock = conn.sock
+            conn.request("GET", "/")
+            resp = conn.getresponse()
+            resp.read()
+            assert resp.status == 200
+            assert conn.sock is sock
+        finally:
+            conn.close()
+
+    def test_unread_request_body_closes_connection(self, running_server):
+        """A body the route never read must not be parsed as the next request."""
+        port, mgr = running_server
+        conn = HTTPConnection(_HOST, port, timeout=5)
+        try:
+            conn.request("POST", "/api/nonexistent", body=b'{"x": 1}',
+                         headers={"Content-Type": "application/json"})
+            resp = conn.getresponse()
+            resp.read()
+            assert resp.status == 404
+            assert resp.headers["Connection"] == "close"
+        finally:
+            conn.close()
+
 
 # ---------------------------------------------------------------------------
 # Purity
@@ -791,12 +786,12 @@ class TestThreadedServer:
 class TestCapMetadata:
     """Verify cap metadata is surfaced when satellite count is capped."""
 
-    def test_state_includes_capped_from_for_isl(self):
+    def test_state_includes_capped_from_for_isl(self, large_states):
         """When ISL caps satellite count, state response shows original count."""
         from humeris.adapters.viewer_server import LayerManager, _MAX_TOPOLOGY_SATS
         mgr = LayerManager(epoch=EPOCH)
         # Create enough states to trigger capping
-        states = _make_states(n_planes=6, n_sats=20)  # 120 > _MAX_TOPOLOGY_SATS
+        states = large_states  # 120 > _MAX_TOPOLOGY_SATS
         assert len(states) > _MAX_TOPOLOGY_SATS
 
         layer_id = mgr.add_layer(
@@ -809,11 +804,11 @@ class TestCapMetadata:
             "Layer state should include capped_from when satellite count is capped"
         assert layer_info["capped_from"] == len(states)
 
-    def test_state_includes_capped_from_for_precession(self):
+    def test_state_includes_capped_from_for_precession(self, large_states):
         """When precession caps satellite count, state response shows original count."""
         from humeris.adapters.viewer_server import LayerManager, _MAX_PRECESSION_SATS
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=6, n_sats=20)  # 120 > _MAX_PRECESSION_SATS
+        states = large_states  # 120 > _MAX_PRECESSION_SATS
         assert len(states) > _MAX_PRECESSION_SATS
 
         layer_id = mgr.add_layer(
@@ -825,11 +820,11 @@ class TestCapMetadata:
         assert "capped_from" in layer_info
         assert layer_info["capped_from"] == len(states)
 
-    def test_no_capped_from_when_under_limit(self):
+    def test_no_capped_from_when_under_limit(self, small_states):
         """No capped_from when satellite count is under the cap."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=2, n_sats=2)  # 4 sats
+        states = small_states  # 4 sats
         layer_id = mgr.add_layer(
             name="Analysis:ISL", category="Analysis",
             layer_type="isl", states=states, params={},
@@ -846,15 +841,7 @@ class TestErrorForwarding:
         """Analysis failure should include the actual error message, not generic text."""
         port, mgr = running_server
         # Add a source constellation first
-        status, body = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 2, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "Err-Test",
-            },
-        })
+        status, body = _api_request(port, "POST", "/api/constellation", _walker("Err-Test"))
         source_id = body["layer_id"]
 
         # Patch _generate_czml to raise an error
@@ -875,54 +862,28 @@ class TestErrorForwarding:
 class TestAnalysisParamsPassthrough:
     """Verify analysis params from request are passed to _generate_czml."""
 
-    def test_coverage_params_passed(self):
-        """Coverage analysis params (lat_step, lon_step, min_elev) should pass through."""
+    @pytest.mark.parametrize("layer_type,params", [
+        ("coverage", {"lat_step_deg": 20.0, "lon_step_deg": 20.0, "min_elevation_deg": 15.0}),
+        ("isl", {"max_range_km": 3000.0}),
+    ], ids=["coverage", "isl"])
+    def test_analysis_params_passed(self, small_states, layer_type, params):
+        """Analysis params (coverage grid/elevation, ISL range) should pass through."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        # First add a constellation as source
-        source_id = mgr.add_layer(
-            name="Constellation:Source", category="Constellation",
-            layer_type="walker", states=states, params={},
-        )
-        # Now add coverage with explicit params
         layer_id = mgr.add_layer(
-            name="Analysis:Coverage", category="Analysis",
-            layer_type="coverage", states=states,
-            params={"lat_step_deg": 20.0, "lon_step_deg": 20.0, "min_elevation_deg": 15.0},
+            name=f"Analysis:{layer_type}", category="Analysis",
+            layer_type=layer_type, states=small_states, params=dict(params),
         )
         layer = mgr.layers[layer_id]
         # The params should have been stored and used
-        assert layer.params.get("lat_step_deg") == 20.0
-        assert layer.params.get("lon_step_deg") == 20.0
-        assert layer.params.get("min_elevation_deg") == 15.0
-
-    def test_isl_max_range_passed(self):
-        """ISL analysis max_range_km param should pass through."""
-        from humeris.adapters.viewer_server import LayerManager
-        mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        layer_id = mgr.add_layer(
-            name="Analysis:ISL", category="Analysis",
-            layer_type="isl", states=states,
-            params={"max_range_km": 3000.0},
-        )
-        layer = mgr.layers[layer_id]
-        assert layer.params.get("max_range_km") == 3000.0
+        for key, value in params.items():
+            assert layer.params.get(key) == value
 
     def test_analysis_api_forwards_params(self, running_server):
         """POST /api/analysis should forward params to the layer."""
         port, mgr = running_server
         # Add source
-        status, body = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 2, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "ParamTest",
-            },
-        })
+        status, body = _api_request(port, "POST", "/api/constellation", _walker("ParamTest"))
         source_id = body["layer_id"]
 
         # Add coverage with params
@@ -940,35 +901,30 @@ class TestAnalysisParamsPassthrough:
         assert layer_info["params"].get("lat_step_deg") == 20.0
 
 
+@pytest.fixture(scope="module")
+def eclipse_layer_info():
+    """State entry for one eclipse layer, shared by the legend checks."""
+    from humeris.adapters.viewer_server import LayerManager
+    mgr = LayerManager(epoch=EPOCH)
+    layer_id = mgr.add_layer(
+        name="Analysis:Eclipse", category="Analysis",
+        layer_type="eclipse", states=_make_states(), params={},
+    )
+    state = mgr.get_state()
+    return [l for l in state["layers"] if l["layer_id"] == layer_id][0]
+
+
 class TestColorLegendData:
     """Verify color legend metadata is available in state response."""
 
-    def test_state_includes_legend_for_eclipse(self):
+    def test_state_includes_legend_for_eclipse(self, eclipse_layer_info):
         """Eclipse analysis layers should include legend color mapping."""
-        from humeris.adapters.viewer_server import LayerManager
-        mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        layer_id = mgr.add_layer(
-            name="Analysis:Eclipse", category="Analysis",
-            layer_type="eclipse", states=states, params={},
-        )
-        state = mgr.get_state()
-        layer_info = [l for l in state["layers"] if l["layer_id"] == layer_id][0]
-        assert "legend" in layer_info, \
+        assert "legend" in eclipse_layer_info, \
             "Eclipse layer should include legend data in state response"
 
-    def test_legend_has_entries(self):
+    def test_legend_has_entries(self, eclipse_layer_info):
         """Legend should have label+color entries."""
-        from humeris.adapters.viewer_server import LayerManager
-        mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
-        layer_id = mgr.add_layer(
-            name="Analysis:Eclipse", category="Analysis",
-            layer_type="eclipse", states=states, params={},
-        )
-        state = mgr.get_state()
-        layer_info = [l for l in state["layers"] if l["layer_id"] == layer_id][0]
-        legend = layer_info["legend"]
+        legend = eclipse_layer_info["legend"]
         assert len(legend) > 0
         assert "label" in legend[0]
         assert "color" in legend[0]
@@ -980,15 +936,7 @@ class TestExportEndpoint:
     def test_export_czml_returns_downloadable(self, running_server):
         """GET /api/export/{layer_id} should return CZML as downloadable JSON."""
         port, mgr = running_server
-        status, body = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 2, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "Export-Test",
-            },
-        })
+        status, body = _api_request(port, "POST", "/api/constellation", _walker("Export-Test"))
         layer_id = body["layer_id"]
         status, czml = _api_request(port, "GET", f"/api/export/{layer_id}")
         assert status == 200
@@ -998,7 +946,7 @@ class TestExportEndpoint:
     def test_export_nonexistent_returns_404(self, running_server):
         """GET /api/export/nonexistent should return 404."""
         port, mgr = running_server
-        status, body = _api_request(port, "GET", "/api/export/nonexistent")
+        status, _ = _api_request(port, "GET", "/api/export/nonexistent", parse=False)
         assert status == 404
 
 
@@ -1009,15 +957,10 @@ class TestGroundStationSatLimit:
         """Ground station should use configurable sat limit, not hardcoded 6."""
         port, mgr = running_server
         # Add a large constellation
-        status, body = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 4, "sats_per_plane": 5,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "GS-Test",
-            },
-        })
+        status, body = _api_request(
+            port, "POST", "/api/constellation",
+            _walker("GS-Test", num_planes=4, sats_per_plane=5),
+        )
         source_id = body["layer_id"]
         source_layer = mgr.layers[source_id]
         assert len(source_layer.states) == 20
@@ -1040,15 +983,7 @@ class TestSessionSaveLoad:
         """POST /api/session/save should return serializable session data."""
         port, mgr = running_server
         # Add a constellation
-        _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 2, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "Save-Test",
-            },
-        })
+        _api_request(port, "POST", "/api/constellation", _walker("Save-Test"))
         status, body = _api_request(port, "POST", "/api/session/save")
         assert status == 200
         assert "session" in body
@@ -1058,32 +993,22 @@ class TestSessionSaveLoad:
         """POST /api/session/load should restore previously saved session."""
         port, mgr = running_server
         # Add a constellation
-        _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 2, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "Load-Test",
-            },
-        })
+        _api_request(port, "POST", "/api/constellation", _walker("Load-Test"))
         # Save
         _, save_resp = _api_request(port, "POST", "/api/session/save")
         session_data = save_resp["session"]
 
         # Clear all layers
-        _, state = _api_request(port, "GET", "/api/state")
-        for layer in state["layers"]:
-            _api_request(port, "DELETE", f"/api/layer/{layer['layer_id']}")
+        mgr.clear_layers()
 
         # Verify empty
         _, state = _api_request(port, "GET", "/api/state")
         assert len(state["layers"]) == 0
 
         # Load
-        status, body = _api_request(port, "POST", "/api/session/load", {
+        status, _ = _api_request(port, "POST", "/api/session/load", {
             "session": session_data,
-        })
+        }, parse=False)
         assert status == 200
 
         # Verify restored
@@ -1098,24 +1023,11 @@ class TestSessionLoadClears:
         """Loading a session should clear old layers, not append."""
         port, mgr = running_server
         # Add two constellations
-        _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 2, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "Existing-1",
-            },
-        })
-        _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 800, "inclination_deg": 97,
-                "num_planes": 2, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "Existing-2",
-            },
-        })
+        _api_request(port, "POST", "/api/constellation", _walker("Existing-1"))
+        _api_request(
+            port, "POST", "/api/constellation",
+            _walker("Existing-2", altitude_km=800, inclination_deg=97),
+        )
         _, state = _api_request(port, "GET", "/api/state")
         assert len(state["layers"]) == 2
 
@@ -1138,9 +1050,9 @@ class TestSessionLoadClears:
                 },
             }],
         }
-        status, body = _api_request(port, "POST", "/api/session/load", {
+        status, _ = _api_request(port, "POST", "/api/session/load", {
             "session": session_data,
-        })
+        }, parse=False)
         assert status == 200
 
         # Should have exactly 1 layer, not 3
@@ -1156,15 +1068,7 @@ class TestAnalysisRecompute:
         """PUT /api/analysis/{layer_id} should update params and regenerate CZML."""
         port, mgr = running_server
         # Add source
-        status, body = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 2, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "Recomp-Test",
-            },
-        })
+        status, body = _api_request(port, "POST", "/api/constellation", _walker("Recomp-Test"))
         source_id = body["layer_id"]
 
         # Add coverage analysis
@@ -1179,9 +1083,9 @@ class TestAnalysisRecompute:
         _, original_czml = _api_request(port, "GET", f"/api/czml/{analysis_id}")
 
         # Recompute with different params
-        status, body = _api_request(port, "PUT", f"/api/analysis/{analysis_id}", {
+        status, _ = _api_request(port, "PUT", f"/api/analysis/{analysis_id}", {
             "params": {"lat_step_deg": 30.0, "lon_step_deg": 30.0},
-        })
+        }, parse=False)
         assert status == 200
 
         # CZML should be different
@@ -1202,10 +1106,10 @@ class TestDurationStepSettings:
     def test_put_settings_updates_duration(self, running_server):
         """PUT /api/settings should update duration and step."""
         port, mgr = running_server
-        status, body = _api_request(port, "PUT", "/api/settings", {
+        status, _ = _api_request(port, "PUT", "/api/settings", {
             "duration_s": 14400,  # 4 hours
             "step_s": 120,  # 2 minutes
-        })
+        }, parse=False)
         assert status == 200
 
         # Verify state reflects new settings
@@ -1222,7 +1126,7 @@ class TestInputValidation:
         """Non-numeric Content-Length should return 400, not crash."""
         port, _ = running_server
         import http.client
-        conn = http.client.HTTPConnection("localhost", port, timeout=5)
+        conn = http.client.HTTPConnection(_HOST, port, timeout=5)
         conn.putrequest("POST", "/api/constellation")
         conn.putheader("Content-Type", "application/json")
         conn.putheader("Content-Length", "notanumber")
@@ -1234,14 +1138,14 @@ class TestInputValidation:
     def test_path_traversal_in_layer_id_rejected(self, running_server):
         """Layer ID with path traversal should be rejected."""
         port, _ = running_server
-        status, body = _api_request(port, "GET", "/api/czml/../../etc/passwd")
+        status, _ = _api_request(port, "GET", "/api/czml/../../etc/passwd", parse=False)
         assert status in (400, 404)
 
     def test_newline_in_layer_id_rejected(self, running_server):
         """Layer ID with newlines should be rejected."""
         port, _ = running_server
         import http.client
-        conn = http.client.HTTPConnection("localhost", port, timeout=5)
+        conn = http.client.HTTPConnection(_HOST, port, timeout=5)
         conn.request("GET", "/api/czml/layer-1%0d%0aInjected:header")
         resp = conn.getresponse()
         assert resp.status in (400, 404)
@@ -1250,7 +1154,7 @@ class TestInputValidation:
     def test_walker_negative_altitude_rejected(self, running_server):
         """Negative altitude should be rejected."""
         port, _ = running_server
-        status, body = _api_request(port, "POST", "/api/constellation", {
+        status, _ = _api_request(port, "POST", "/api/constellation", {
             "type": "walker",
             "params": {
                 "altitude_km": -100,
@@ -1258,13 +1162,13 @@ class TestInputValidation:
                 "num_planes": 2,
                 "sats_per_plane": 2,
             },
-        })
+        }, parse=False)
         assert status == 400
 
     def test_walker_excessive_sat_count_rejected(self, running_server):
         """Excessively large satellite count should be rejected."""
         port, _ = running_server
-        status, body = _api_request(port, "POST", "/api/constellation", {
+        status, _ = _api_request(port, "POST", "/api/constellation", {
             "type": "walker",
             "params": {
                 "altitude_km": 550,
@@ -1272,13 +1176,13 @@ class TestInputValidation:
                 "num_planes": 200,
                 "sats_per_plane": 200,
             },
-        })
+        }, parse=False)
         assert status == 400
 
     def test_walker_zero_planes_rejected(self, running_server):
         """Zero planes should be rejected."""
         port, _ = running_server
-        status, body = _api_request(port, "POST", "/api/constellation", {
+        status, _ = _api_request(port, "POST", "/api/constellation", {
             "type": "walker",
             "params": {
                 "altitude_km": 550,
@@ -1286,47 +1190,47 @@ class TestInputValidation:
                 "num_planes": 0,
                 "sats_per_plane": 2,
             },
-        })
+        }, parse=False)
         assert status == 400
 
     # BUG-016: Settings validation
     def test_settings_zero_duration_rejected(self, running_server):
         """Zero duration should be rejected."""
         port, _ = running_server
-        status, body = _api_request(port, "PUT", "/api/settings", {
+        status, _ = _api_request(port, "PUT", "/api/settings", {
             "duration_s": 0,
             "step_s": 60,
-        })
+        }, parse=False)
         assert status == 400
 
     def test_settings_negative_step_rejected(self, running_server):
         """Negative step should be rejected."""
         port, _ = running_server
-        status, body = _api_request(port, "PUT", "/api/settings", {
+        status, _ = _api_request(port, "PUT", "/api/settings", {
             "duration_s": 7200,
             "step_s": -10,
-        })
+        }, parse=False)
         assert status == 400
 
     # BUG-027: Ground station lat/lon validation
     def test_ground_station_invalid_latitude_rejected(self, running_server):
         """Latitude outside [-90, 90] should be rejected."""
         port, _ = running_server
-        status, body = _api_request(port, "POST", "/api/ground-station", {
+        status, _ = _api_request(port, "POST", "/api/ground-station", {
             "name": "Bad",
             "lat": 91.0,
             "lon": 0.0,
-        })
+        }, parse=False)
         assert status == 400
 
     def test_ground_station_invalid_longitude_rejected(self, running_server):
         """Longitude outside [-180, 180] should be rejected."""
         port, _ = running_server
-        status, body = _api_request(port, "POST", "/api/ground-station", {
+        status, _ = _api_request(port, "POST", "/api/ground-station", {
             "name": "Bad",
             "lat": 0.0,
             "lon": 181.0,
-        })
+        }, parse=False)
         assert status == 400
 
 
@@ -1398,9 +1302,7 @@ class TestSessionRestoreBugs:
             ],
         }
         # Clear existing layers
-        _, state = _api_request(port, "GET", "/api/state")
-        for layer in state["layers"]:
-            _api_request(port, "DELETE", f"/api/layer/{layer['layer_id']}")
+        mgr.clear_layers()
 
         # Load celestrak session
         status, body = _api_request(port, "POST", "/api/session/load", {
@@ -1414,23 +1316,15 @@ class TestSessionRestoreBugs:
         """Session load should restore analysis layers, not just constellations."""
         port, mgr = running_server
         # Add a constellation first
-        status, body = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 2, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "AnalysisSrc",
-            },
-        })
+        status, body = _api_request(port, "POST", "/api/constellation", _walker("AnalysisSrc"))
         source_id = body["layer_id"]
 
         # Add an analysis layer
-        status, body = _api_request(port, "POST", "/api/analysis", {
+        status, _ = _api_request(port, "POST", "/api/analysis", {
             "type": "eclipse",
             "source_layer": source_id,
             "params": {},
-        })
+        }, parse=False)
         assert status == 201
 
         # Save session
@@ -1444,14 +1338,12 @@ class TestSessionRestoreBugs:
             "Saved session should include analysis layers"
 
         # Clear all layers
-        _, state = _api_request(port, "GET", "/api/state")
-        for layer in state["layers"]:
-            _api_request(port, "DELETE", f"/api/layer/{layer['layer_id']}")
+        mgr.clear_layers()
 
         # Load session
-        status, body = _api_request(port, "POST", "/api/session/load", {
+        status, _ = _api_request(port, "POST", "/api/session/load", {
             "session": session_data,
-        })
+        }, parse=False)
         assert status == 200
 
         # Verify analysis layers are restored (not just constellations)
@@ -1464,15 +1356,7 @@ class TestSessionRestoreBugs:
         """Saved analysis layers should include source_layer_index for restore."""
         port, mgr = running_server
         # Add constellation + analysis
-        status, body = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 2, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "SaveSrc",
-            },
-        })
+        status, body = _api_request(port, "POST", "/api/constellation", _walker("SaveSrc"))
         source_id = body["layer_id"]
         _api_request(port, "POST", "/api/analysis", {
             "type": "coverage",
@@ -1498,23 +1382,18 @@ class TestCapToastInResponse:
         """POST /api/analysis response should include capped_from when truncated."""
         port, mgr = running_server
         # Add a large constellation
-        status, body = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 6, "sats_per_plane": 20,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "CapTest",
-            },
-        })
+        status, body = _api_request(
+            port, "POST", "/api/constellation",
+            _walker("CapTest", num_planes=6, sats_per_plane=20),
+        )
         source_id = body["layer_id"]
 
         # Add ISL analysis (triggers capping at _MAX_TOPOLOGY_SATS=100)
-        status, body = _api_request(port, "POST", "/api/analysis", {
+        status, _ = _api_request(port, "POST", "/api/analysis", {
             "type": "isl",
             "source_layer": source_id,
             "params": {},
-        })
+        }, parse=False)
         assert status == 201
 
         # Check state for the new layer
@@ -1533,7 +1412,7 @@ class TestMalformedInput:
         """Non-JSON body with valid Content-Length should return 400."""
         port, _ = running_server
         import http.client
-        conn = http.client.HTTPConnection("localhost", port, timeout=5)
+        conn = http.client.HTTPConnection(_HOST, port, timeout=5)
         body = b"not valid json"
         conn.request("POST", "/api/constellation",
                      body=body,
@@ -1546,7 +1425,7 @@ class TestMalformedInput:
         """OPTIONS request should return 204 with CORS headers."""
         port, _ = running_server
         import http.client
-        conn = http.client.HTTPConnection("localhost", port, timeout=5)
+        conn = http.client.HTTPConnection(_HOST, port, timeout=5)
         conn.request("OPTIONS", "/api/state")
         resp = conn.getresponse()
         assert resp.status == 204
@@ -1555,7 +1434,7 @@ class TestMalformedInput:
         """PATCH request should get an error response."""
         port, _ = running_server
         import http.client
-        conn = http.client.HTTPConnection("localhost", port, timeout=5)
+        conn = http.client.HTTPConnection(_HOST, port, timeout=5)
         conn.request("PATCH", "/api/state")
         resp = conn.getresponse()
         # Should get 501 (not implemented) or similar error
@@ -1564,19 +1443,11 @@ class TestMalformedInput:
     def test_put_layer_rename(self, running_server):
         """PUT /api/layer/{id} with name field should rename."""
         port, _ = running_server
-        status, body = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 2, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "RenameTest",
-            },
-        })
+        status, body = _api_request(port, "POST", "/api/constellation", _walker("RenameTest"))
         layer_id = body["layer_id"]
-        status, body = _api_request(port, "PUT", f"/api/layer/{layer_id}", {
+        status, _ = _api_request(port, "PUT", f"/api/layer/{layer_id}", {
             "name": "NewName",
-        })
+        }, parse=False)
         assert status == 200
         # Verify name changed in state
         _, state = _api_request(port, "GET", "/api/state")
@@ -1594,35 +1465,35 @@ class TestMalformedInput:
         })
         _, state = _api_request(port, "GET", "/api/state")
         source_id = state["layers"][0]["layer_id"]
-        status, body = _api_request(port, "POST", "/api/analysis", {
+        status, _ = _api_request(port, "POST", "/api/analysis", {
             "type": "nonexistent_type",
             "source_layer": source_id,
-        })
+        }, parse=False)
         assert status == 400
 
     def test_analysis_with_invalid_source_returns_404(self, running_server):
         """Analysis with missing source layer should return 404."""
         port, _ = running_server
-        status, body = _api_request(port, "POST", "/api/analysis", {
+        status, _ = _api_request(port, "POST", "/api/analysis", {
             "type": "eclipse",
             "source_layer": "layer-999",
-        })
+        }, parse=False)
         assert status == 404
 
     def test_delete_nonexistent_layer_returns_404(self, running_server):
         """DELETE on nonexistent layer should return 404."""
         port, _ = running_server
-        status, body = _api_request(port, "DELETE", "/api/layer/layer-999")
+        status, _ = _api_request(port, "DELETE", "/api/layer/layer-999", parse=False)
         assert status == 404
 
     def test_ground_station_without_constellation(self, running_server):
         """Ground station without any constellation should still succeed."""
         port, _ = running_server
-        status, body = _api_request(port, "POST", "/api/ground-station", {
+        status, _ = _api_request(port, "POST", "/api/ground-station", {
             "name": "NoConst",
             "lat": 51.5,
             "lon": -0.12,
-        })
+        }, parse=False)
         # Should succeed (empty access windows) or fail gracefully
         assert status in (201, 400, 500)
 
@@ -1630,7 +1501,7 @@ class TestMalformedInput:
         """Body exceeding 10MB should be rejected."""
         port, _ = running_server
         import http.client
-        conn = http.client.HTTPConnection("localhost", port, timeout=5)
+        conn = http.client.HTTPConnection(_HOST, port, timeout=5)
         # Claim a body of 11MB but only send a small amount
         conn.putrequest("POST", "/api/constellation")
         conn.putheader("Content-Type", "application/json")
@@ -1653,12 +1524,12 @@ class TestThreadSafety:
         assert isinstance(lm._lock, type(threading.RLock())), \
             "LayerManager._lock must be an RLock"
 
-    def test_concurrent_add_unique_ids(self):
+    def test_concurrent_add_unique_ids(self, small_states):
         """Concurrent add_layer calls must produce unique layer IDs."""
         from humeris.adapters.viewer_server import LayerManager
 
         lm = LayerManager(EPOCH)
-        states = _make_states()
+        states = small_states
         ids: list[str] = []
         errors: list[Exception] = []
 
@@ -1682,12 +1553,12 @@ class TestThreadSafety:
         assert len(ids) == 20, f"Expected 20 IDs, got {len(ids)}"
         assert len(set(ids)) == 20, f"Duplicate IDs: {ids}"
 
-    def test_concurrent_add_remove_no_crash(self):
+    def test_concurrent_add_remove_no_crash(self, small_states):
         """Concurrent add + remove must not raise RuntimeError."""
         from humeris.adapters.viewer_server import LayerManager
 
         lm = LayerManager(EPOCH)
-        states = _make_states()
+        states = small_states
         errors: list[Exception] = []
 
         # Pre-populate some layers
@@ -1743,15 +1614,10 @@ class TestSecondPassFixes:
     def test_update_layer_mode_does_not_block_get_state(self, running_server):
         """BUG-031: update_layer mode switch should not hold the lock during CZML gen."""
         port, mgr = running_server
-        status, data = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 1, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "LockTest",
-            },
-        })
+        status, data = _api_request(
+            port, "POST", "/api/constellation",
+            _walker("LockTest", num_planes=1),
+        )
         assert status == 201
         lid = data["layer_id"]
 
@@ -1776,15 +1642,7 @@ class TestSecondPassFixes:
         """BUG-035: Ground stations should survive save/load cycle."""
         port, mgr = running_server
         # Add constellation first
-        _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 1, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "GSTest",
-            },
-        })
+        _api_request(port, "POST", "/api/constellation", _walker("GSTest", num_planes=1))
 
         # Add ground station
         _api_request(port, "POST", "/api/ground-station", {
@@ -1801,8 +1659,8 @@ class TestSecondPassFixes:
         assert len(gs_layers) == 1, "Ground station should be in saved session"
 
         # Load session (clears and restores)
-        status, result = _api_request(port, "POST", "/api/session/load",
-                                      {"session": session})
+        status, _ = _api_request(port, "POST", "/api/session/load",
+                                      {"session": session}, parse=False)
         assert status == 200
 
         # Check state — should have constellation + ground station
@@ -1816,15 +1674,10 @@ class TestSecondPassFixes:
         """Gap-7: Hidden layers should stay hidden after save/load."""
         port, mgr = running_server
         # Add constellation
-        status, data = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 1, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "VisTest",
-            },
-        })
+        status, data = _api_request(
+            port, "POST", "/api/constellation",
+            _walker("VisTest", num_planes=1),
+        )
         lid = data["layer_id"]
 
         # Hide the layer
@@ -1847,11 +1700,11 @@ class TestSecondPassFixes:
 class TestParamsMutationIsolation:
     """R2-01/BUG-037: _generate_czml must not mutate stored params."""
 
-    def test_add_layer_params_not_mutated_by_czml_gen(self):
+    def test_add_layer_params_not_mutated_by_czml_gen(self, small_states):
         """Params stored in LayerState must not contain _capped_from after add_layer."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(EPOCH)
-        states = _make_states()
+        states = small_states
         original_params = {"max_range_km": 5000.0}
         lid = mgr.add_layer(
             name="ISL", category="Analysis", layer_type="isl",
@@ -1861,11 +1714,11 @@ class TestParamsMutationIsolation:
         assert "_capped_from" not in original_params, \
             "Caller's params dict was mutated by _generate_czml"
 
-    def test_recompute_does_not_mutate_caller_params(self):
+    def test_recompute_does_not_mutate_caller_params(self, small_states):
         """Recompute must not leak _capped_from into the caller's params dict."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(EPOCH)
-        states = _make_states()
+        states = small_states
         lid = mgr.add_layer(
             name="Precession", category="Analysis", layer_type="precession",
             states=states, params={},
@@ -1882,19 +1735,11 @@ class TestExportCORS:
     def test_export_includes_cors_methods_header(self, running_server):
         """Export response must include Access-Control-Allow-Methods."""
         port, mgr = running_server
-        _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 1, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "CORSTest",
-            },
-        })
+        _api_request(port, "POST", "/api/constellation", _walker("CORSTest", num_planes=1))
         _, state = _api_request(port, "GET", "/api/state")
         lid = state["layers"][0]["layer_id"]
         # Direct request to export endpoint to check headers
-        url = f"http://localhost:{port}/api/export/{lid}"
+        url = f"http://{_HOST}:{port}/api/export/{lid}"
         req = urllib.request.Request(url, method="GET")
         resp = urllib.request.urlopen(req, timeout=10)
         allow_methods = resp.headers.get("Access-Control-Allow-Methods", "")
@@ -1911,9 +1756,9 @@ class TestSessionLoadValidation:
     def test_non_list_layers_returns_400(self, running_server):
         """Session with layers as a string should return 400."""
         port, mgr = running_server
-        status, body = _api_request(port, "POST", "/api/session/load", {
+        status, _ = _api_request(port, "POST", "/api/session/load", {
             "session": {"layers": "not-a-list"},
-        })
+        }, parse=False)
         assert status == 400, f"Expected 400 for non-list layers, got {status}"
 
     def test_non_dict_layer_entry_skipped(self, running_server):
@@ -1956,15 +1801,10 @@ class TestConcurrentSessionLoad:
 
         def add_constellation():
             try:
-                _api_request(port, "POST", "/api/constellation", {
-                    "type": "walker",
-                    "params": {
-                        "altitude_km": 800, "inclination_deg": 97,
-                        "num_planes": 1, "sats_per_plane": 2,
-                        "phase_factor": 1, "raan_offset_deg": 0,
-                        "shell_name": "ConcAdd",
-                    },
-                })
+                _api_request(
+                    port, "POST", "/api/constellation",
+                    _walker("ConcAdd", altitude_km=800, inclination_deg=97, num_planes=1),
+                )
             except Exception as e:
                 errors.append(("add", e))
 
@@ -2051,11 +1891,11 @@ class TestLayerManagerLoadSession:
         assert layer.name == "Constellation:LoadTest"
         assert layer.layer_type == "walker"
 
-    def test_load_session_clears_existing(self):
+    def test_load_session_clears_existing(self, small_states):
         """load_session must clear existing layers before restoring."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         mgr.add_layer(
             name="Old", category="Constellation",
             layer_type="walker", states=states, params={},
@@ -2105,11 +1945,11 @@ class TestLayerManagerLoadSession:
 class TestSatNamesInPipeline:
     """SAT-NAME-01: Satellite names must thread through the CZML pipeline."""
 
-    def test_add_layer_accepts_sat_names(self):
+    def test_add_layer_accepts_sat_names(self, small_states):
         """add_layer() must accept sat_names parameter and store it in LayerState."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         names = [f"SAT-{i}" for i in range(len(states))]
         layer_id = mgr.add_layer(
             name="Constellation:Test",
@@ -2122,11 +1962,11 @@ class TestSatNamesInPipeline:
         layer = mgr.layers[layer_id]
         assert layer.sat_names == names
 
-    def test_sat_names_appear_in_czml_snapshot(self):
+    def test_sat_names_appear_in_czml_snapshot(self, large_states):
         """Snapshot CZML packets must use provided sat_names."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=6, n_sats=20)  # >100 → snapshot mode
+        states = large_states  # >100 → snapshot mode
         names = [f"ISS-{i}" for i in range(len(states))]
         layer_id = mgr.add_layer(
             name="Constellation:Named",
@@ -2141,11 +1981,11 @@ class TestSatNamesInPipeline:
         for idx, pkt in enumerate(czml[1:]):
             assert pkt["name"] == names[idx], f"Packet {idx} name mismatch"
 
-    def test_sat_names_appear_in_czml_animated(self):
+    def test_sat_names_appear_in_czml_animated(self, small_states):
         """Animated CZML packets must use provided sat_names."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=2, n_sats=2)  # <=100 → animated
+        states = small_states  # <=100 → animated
         names = [f"STARLINK-{i}" for i in range(len(states))]
         layer_id = mgr.add_layer(
             name="Constellation:Named",
@@ -2159,22 +1999,22 @@ class TestSatNamesInPipeline:
         for idx, pkt in enumerate(czml[1:]):
             assert pkt["name"] == names[idx], f"Packet {idx} name mismatch"
 
-    def test_sat_names_default_none(self):
+    def test_sat_names_default_none(self, small_states):
         """Without sat_names, LayerState.sat_names is None."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         layer_id = mgr.add_layer(
             name="Test", category="Constellation",
             layer_type="walker", states=states, params={},
         )
         assert mgr.layers[layer_id].sat_names is None
 
-    def test_save_session_includes_sat_names(self):
+    def test_save_session_includes_sat_names(self, small_states):
         """save_session() must include sat_names in serialized layer data."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         names = [f"SAT-{i}" for i in range(len(states))]
         mgr.add_layer(
             name="Named", category="Constellation",
@@ -2208,11 +2048,11 @@ class TestSatNamesInPipeline:
         assert len(layer.sat_names) == 2
         assert all("NameTest" in n for n in layer.sat_names)
 
-    def test_analysis_layer_inherits_sat_names(self):
+    def test_analysis_layer_inherits_sat_names(self, small_states):
         """Analysis layers must inherit sat_names from source constellation."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         names = [f"SAT-{i}" for i in range(len(states))]
         source_id = mgr.add_layer(
             name="Source", category="Constellation",
@@ -2323,15 +2163,7 @@ class TestGroundStationPresets:
         """POST /api/ground-station-network should add all stations."""
         port, mgr = running_server
         # First add a constellation for access computation
-        _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 1, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "GS-Test",
-            },
-        })
+        _api_request(port, "POST", "/api/constellation", _walker("GS-Test", num_planes=1))
         status, body = _api_request(port, "POST", "/api/ground-station-network", {
             "preset": "NASA DSN",
         })
@@ -2341,9 +2173,9 @@ class TestGroundStationPresets:
     def test_add_unknown_preset_returns_404(self, running_server):
         """POST with unknown preset name should return 404."""
         port, mgr = running_server
-        status, body = _api_request(port, "POST", "/api/ground-station-network", {
+        status, _ = _api_request(port, "POST", "/api/ground-station-network", {
             "preset": "Nonexistent Network",
-        })
+        }, parse=False)
         assert status == 404
 
 
@@ -2353,24 +2185,11 @@ class TestMultiLayerCzmlExport:
     def test_export_all_returns_czml(self, running_server):
         """GET /api/export-all should return merged CZML."""
         port, mgr = running_server
-        _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 1, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "ExportAll-1",
-            },
-        })
-        _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 800, "inclination_deg": 97,
-                "num_planes": 1, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "ExportAll-2",
-            },
-        })
+        _api_request(port, "POST", "/api/constellation", _walker("ExportAll-1", num_planes=1))
+        _api_request(
+            port, "POST", "/api/constellation",
+            _walker("ExportAll-2", altitude_km=800, inclination_deg=97, num_planes=1),
+        )
         status, body = _api_request(port, "GET", "/api/export-all")
         assert status == 200
         # Should be a list of CZML packets
@@ -2383,24 +2202,14 @@ class TestMultiLayerCzmlExport:
     def test_export_all_skips_hidden_layers(self, running_server):
         """Hidden layers should not be included in export-all."""
         port, mgr = running_server
-        _, add_resp = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 550, "inclination_deg": 53,
-                "num_planes": 1, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "Visible",
-            },
-        })
-        _, add_resp2 = _api_request(port, "POST", "/api/constellation", {
-            "type": "walker",
-            "params": {
-                "altitude_km": 800, "inclination_deg": 97,
-                "num_planes": 1, "sats_per_plane": 2,
-                "phase_factor": 1, "raan_offset_deg": 0,
-                "shell_name": "Hidden",
-            },
-        })
+        _, add_resp = _api_request(
+            port, "POST", "/api/constellation",
+            _walker("Visible", num_planes=1),
+        )
+        _, add_resp2 = _api_request(
+            port, "POST", "/api/constellation",
+            _walker("Hidden", altitude_km=800, inclination_deg=97, num_planes=1),
+        )
         # Hide the second layer
         layer_id = add_resp2["layer_id"]
         _api_request(port, "PUT", f"/api/layer/{layer_id}", {"visible": False})
@@ -2531,32 +2340,55 @@ class TestCliHeadlessMode:
         assert len(czml_files) >= 1
 
 
+_ALLOWED_IMPORTS = frozenset({
+    # stdlib
+    "json", "http", "html", "threading", "datetime", "dataclasses",
+    "urllib", "functools", "math", "numpy", "logging", "typing",
+    "socketserver", "os", "csv", "re",
+    # internal
+    "humeris",
+})
+
+
+@functools.lru_cache(maxsize=1)
+def _viewer_server_tree() -> ast.Module:
+    """Parse viewer_server.py once for all purity checks."""
+    import humeris.adapters.viewer_server as mod
+
+    with open(mod.__file__, encoding="utf-8") as f:
+        return ast.parse(f.read())
+
+
+def _iter_imports(node):
+    """Yield Import/ImportFrom nodes, descending only through statements.
+
+    Imports are statements, so expression subtrees (the bulk of the AST)
+    are never visited. Function and class bodies are still scanned because
+    the adapter imports lazily inside handlers.
+    """
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, (ast.Import, ast.ImportFrom)):
+            yield child
+        elif isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case)):
+            yield from _iter_imports(child)
+
+
 class TestViewerServerPurity:
     """Adapter purity: only stdlib + internal imports allowed."""
 
     def test_no_external_deps(self):
-        import humeris.adapters.viewer_server as mod
-
-        with open(mod.__file__, encoding="utf-8") as f:
-            tree = ast.parse(f.read())
-
-        allowed_stdlib = {
-            "json", "http", "html", "threading", "datetime", "dataclasses",
-            "urllib", "functools", "math", "numpy", "logging", "typing",
-            "socketserver", "os", "csv", "re",
-        }
-        allowed_internal = {"humeris"}
+        tree = _viewer_server_tree()
 
-        for node in ast.walk(tree):
+        for node in _iter_imports(tree):
             if isinstance(node, ast.Import):
                 for alias in node.names:
                     top = alias.name.split(".")[0]
-                    assert top in allowed_stdlib or top in allowed_internal, \
+                    assert top in _ALLOWED_IMPORTS, \
                         f"Forbidden import: {alias.name}"
             elif isinstance(node, ast.ImportFrom):
                 if node.module and node.level == 0:
                     top = node.module.split(".")[0]
-                    assert top in allowed_stdlib or top in allowed_internal, \
+                    assert top in _ALLOWED_IMPORTS, \
                         f"Forbidden import from: {node.module}"
 
 
@@ -2678,11 +2510,11 @@ class TestReconfigureConstellation:
         with pytest.raises(KeyError):
             mgr.reconfigure_constellation("nonexistent", {"altitude_km": 700})
 
-    def test_reconfigure_non_walker_raises(self):
+    def test_reconfigure_non_walker_raises(self, small_states):
         """Reconfiguring a non-walker layer raises ValueError."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         layer_id = mgr.add_layer(
             name="Analysis:Eclipse",
             category="Analysis",
@@ -2716,11 +2548,11 @@ class TestReconfigureConstellation:
         layer_info = state["layers"][0]
         assert layer_info["editable"] is True
 
-    def test_get_state_celestrak_not_editable(self):
+    def test_get_state_celestrak_not_editable(self, small_states):
         """get_state() marks non-walker constellation layers as not editable."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         mgr.add_layer(
             name="Constellation:GPS",
             category="Constellation",
@@ -2761,11 +2593,11 @@ class TestLayerMetrics:
         assert "percent_covered" in metrics
         assert isinstance(metrics["mean_visible"], (int, float))
 
-    def test_eclipse_layer_has_metrics(self):
+    def test_eclipse_layer_has_metrics(self, small_states):
         """Eclipse analysis layer returns metrics in get_state()."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=2, n_sats=2)
+        states = small_states
         layer_id = mgr.add_layer(
             name="Analysis:Eclipse",
             category="Analysis",
@@ -2780,11 +2612,11 @@ class TestLayerMetrics:
         assert "avg_sunlit_pct" in metrics
         assert "max_eclipse_min" in metrics
 
-    def test_beta_angle_layer_has_metrics(self):
+    def test_beta_angle_layer_has_metrics(self, small_states):
         """Beta angle analysis returns min/max/avg metrics."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=2, n_sats=2)
+        states = small_states
         layer_id = mgr.add_layer(
             name="Analysis:Beta",
             category="Analysis",
@@ -2800,11 +2632,11 @@ class TestLayerMetrics:
         assert "max_beta_deg" in metrics
         assert "avg_beta_deg" in metrics
 
-    def test_deorbit_layer_has_metrics(self):
+    def test_deorbit_layer_has_metrics(self, small_states):
         """Deorbit compliance analysis returns pass/fail count."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=2, n_sats=2)
+        states = small_states
         layer_id = mgr.add_layer(
             name="Analysis:Deorbit",
             category="Analysis",
@@ -2819,11 +2651,11 @@ class TestLayerMetrics:
         assert "compliant" in metrics
         assert "total" in metrics
 
-    def test_station_keeping_layer_has_metrics(self):
+    def test_station_keeping_layer_has_metrics(self, small_states):
         """Station-keeping analysis returns avg/max delta-V."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=2, n_sats=2)
+        states = small_states
         layer_id = mgr.add_layer(
             name="Analysis:SK",
             category="Analysis",
@@ -2838,11 +2670,11 @@ class TestLayerMetrics:
         assert "avg_dv_m_s" in metrics
         assert "max_dv_m_s" in metrics
 
-    def test_walker_layer_has_no_metrics(self):
+    def test_walker_layer_has_no_metrics(self, small_states):
         """Constellation layers (not analysis) have no metrics."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states()
+        states = small_states
         layer_id = mgr.add_layer(
             name="Constellation:Test",
             category="Constellation",
@@ -2854,11 +2686,11 @@ class TestLayerMetrics:
         layer_info = [l for l in state["layers"] if l["layer_id"] == layer_id][0]
         assert "metrics" not in layer_info or layer_info.get("metrics") is None
 
-    def test_metrics_recomputed_after_beta_angle(self):
+    def test_metrics_recomputed_after_beta_angle(self, small_states):
         """Metrics are computed correctly for beta angle analysis."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=2, n_sats=2)
+        states = small_states
         mgr.add_layer(
             name="Analysis:Beta",
             category="Analysis",
@@ -2946,11 +2778,11 @@ class TestSatelliteTable:
         assert table["rows"][0]["name"] == "Sat-0"
         assert table["rows"][1]["name"] == "Sat-1"
 
-    def test_table_plane_assignment(self):
+    def test_table_plane_assignment(self, small_states):
         """Plane number is correctly assigned based on num_planes."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=2, n_sats=2)
+        states = small_states
         lid = mgr.add_layer(
             name="Constellation:Walker",
             category="Constellation",
@@ -3234,11 +3066,11 @@ class TestConfigComparison:
 class TestConstraints:
     """Tests for constraint definition and pass/fail evaluation."""
 
-    def test_add_and_evaluate_constraint_pass(self):
+    def test_add_and_evaluate_constraint_pass(self, small_states):
         """Constraint that is met evaluates to pass."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=2, n_sats=2)
+        states = small_states
         lid = mgr.add_layer(
             name="Constellation:Test", category="Constellation",
             layer_type="walker", states=states,
@@ -3257,11 +3089,11 @@ class TestConstraints:
         assert len(results) == 1
         assert results[0]["passed"] is True
 
-    def test_add_and_evaluate_constraint_fail(self):
+    def test_add_and_evaluate_constraint_fail(self, small_states):
         """Constraint that is not met evaluates to fail."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=2, n_sats=2)
+        states = small_states
         lid = mgr.add_layer(
             name="Constellation:Test", category="Constellation",
             layer_type="walker", states=states,
@@ -3281,11 +3113,11 @@ class TestConstraints:
         assert len(results) == 1
         assert results[0]["passed"] is False
 
-    def test_constraints_summary(self):
+    def test_constraints_summary(self, small_states):
         """evaluate_constraints returns summary with pass count."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=2, n_sats=2)
+        states = small_states
         lid = mgr.add_layer(
             name="Constellation:Test", category="Constellation",
             layer_type="walker", states=states,
@@ -3330,11 +3162,11 @@ class TestConstraints:
 class TestReportGeneration:
     """Tests for HTML report generation."""
 
-    def test_generate_report_returns_html(self):
+    def test_generate_report_returns_html(self, small_states):
         """generate_report returns valid HTML string."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=2, n_sats=2)
+        states = small_states
         mgr.add_layer(
             name="Constellation:Test", category="Constellation",
             layer_type="walker", states=states,
@@ -3345,11 +3177,11 @@ class TestReportGeneration:
         assert "Test Report" in html
         assert "Constellation:Test" in html
 
-    def test_report_includes_metrics(self):
+    def test_report_includes_metrics(self, small_states):
         """Report includes metrics for analysis layers."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=2, n_sats=2)
+        states = small_states
         lid = mgr.add_layer(
             name="Constellation:Test", category="Constellation",
             layer_type="walker", states=states,
@@ -3362,11 +3194,11 @@ class TestReportGeneration:
         html = mgr.generate_report(name="Metrics Report")
         assert "beta" in html.lower()
 
-    def test_report_includes_constraints(self):
+    def test_report_includes_constraints(self, small_states):
         """Report includes constraint pass/fail results."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=2, n_sats=2)
+        states = small_states
         lid = mgr.add_layer(
             name="Constellation:Test", category="Constellation",
             layer_type="walker", states=states,
@@ -3695,11 +3527,11 @@ class TestCascadeMetrics:
 class TestCompareLayersFix:
     """compare_layers() should skip metrics only present on one side."""
 
-    def test_compare_missing_metric_skipped(self):
+    def test_compare_missing_metric_skipped(self, small_states):
         """Delta should not include metrics present on only one side."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=2, n_sats=2)
+        states = small_states
         lid_a = mgr.add_layer(
             name="Constellation:A", category="Constellation",
             layer_type="walker", states=states,
@@ -3864,11 +3696,11 @@ class TestCliHardening:
 class TestReconfigureValidation:
     """Reconfigure validates param bounds."""
 
-    def test_reconfigure_validates_params(self):
+    def test_reconfigure_validates_params(self, small_states):
         """Reconfigure with out-of-range altitude should raise ValueError."""
         from humeris.adapters.viewer_server import LayerManager
         mgr = LayerManager(epoch=EPOCH)
-        states = _make_states(n_planes=2, n_sats=2)
+        states = small_states
         lid = mgr.add_layer(
             name="Constellation:Test", category="Constellation",
             layer_type="walker", states=states,